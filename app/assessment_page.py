@@ -7,7 +7,9 @@
 import tkinter as tk
 from tkinter import ttk, messagebox
 from data.unit import Unit
+from data.events import ChangeEvent, UnitChanged
 from utils.asset_manager import AssetManager
+from app.table_sync import TableSync
 
 class AssessmentPage(tk.Frame):
     """
@@ -29,6 +31,10 @@ class AssessmentPage(tk.Frame):
         self.unit = unit
         self.main_window = main_window
 
+        # rebuilds the table on the next load after the data changes
+        self.dirty = True
+        self.unit.subscribe(self.on_change)
+
         # sets the style of the page
         style = ttk.Style(self)
         style.theme_use("alt")
@@ -64,6 +70,9 @@ class AssessmentPage(tk.Frame):
         # initialises table
         self.table = ttk.Treeview(table_frame, columns=self.columns, show="headings", height=8)
 
+        # keeps table rows in step with the data, keyed by assessment name
+        self.rows = TableSync(self.table, 0)
+
         # adds columns to the table
         for column in self.columns:
             self.table.heading(column, text=column)
@@ -100,13 +109,8 @@ class AssessmentPage(tk.Frame):
                 event (tk.Event): a user input event.
         """
 
-        # clear current table
-        for row in self.table.get_children():
-            self.table.delete(row)
-
-        # add units from unit data to table
-        for unit in self.unit.get_unit_assessments(self.select_unit.get()):
-            self.table.insert("", "end", values=unit)
+        # updates table rows from unit data
+        self.rows.sync(self.unit.get_unit_assessments(self.select_unit.get()))
 
         # scrolls table all the way up
         children = self.table.get_children()
@@ -149,11 +153,28 @@ class AssessmentPage(tk.Frame):
         # stops default behaviour
         return "break"
 
+    def on_change(self, event: ChangeEvent) -> None:
+        """
+            Marks the page for a rebuild when units are added or removed.
+
+            Args:
+                event (ChangeEvent): the change event.
+        """
+
+        # marks the unit list as out of date
+        if isinstance(event, UnitChanged):
+            self.dirty = True
+
     def load_page(self) -> None:
         """
             Loads page from data.
         """
 
+        # keeps the current table if the data has not changed
+        if not self.dirty:
+            self.table.focus_set()
+            return
+
         # gets list of units
         units = list(self.unit.data.keys())
 
@@ -165,9 +186,11 @@ class AssessmentPage(tk.Frame):
         self.add_assessment_btn.config(state="disabled")
         self.remove_assessment_btn.config(state="disabled")
 
-        # clear current table
-        for row in self.table.get_children():
-            self.table.delete(row)
+        # clears current table
+        self.rows.sync([])
+
+        # marks table as up to date
+        self.dirty = False
 
         # sets focus to the table
         self.table.focus_set()
@@ -299,7 +322,7 @@ class AssessmentPage(tk.Frame):
         # validates assessment name
         if len(assessment_name) == 0 or \
            len(assessment_name) > 15 or \
-           assessment_name in [assessment for assessment, _, _, _ in self.unit.data[unit_code]]:
+           self.unit.has_assessment(unit_code, assessment_name):
             self.assessment_name.focus_set()
             self.input_error_lbl.config(text="Input Error: Assessment name is invalid.")
             return
@@ -309,7 +332,7 @@ class AssessmentPage(tk.Frame):
             weight = float(weight)
             if weight < 0 or \
                round(weight, 2) != weight or \
-               weight + sum(float(weight) for _, weight, _, _ in self.unit.data[unit_code]) > 100:
+               not self.unit.can_add_weight(unit_code, weight):
                 raise ValueError
         except ValueError:
             self.weight.focus_set()
@@ -349,7 +372,7 @@ class AssessmentPage(tk.Frame):
 
          # adds unit to the record and table
         self.unit.add_assessment(unit_code, [assessment_name, weight, obtained_marks, total_marks])
-        self.table.insert("", "end", values=self.unit.get_unit_assessments(unit_code)[-1])
+        self.rows.append(self.unit.get_unit_assessments(unit_code)[-1])
 
         # scrolls table all the way down
         self.table.see(self.table.get_children()[-1])
@@ -397,13 +420,8 @@ class AssessmentPage(tk.Frame):
         # deletes the selected unit from unit data
         self.unit.remove_assessment(unit_code, assessment_no)
 
-        # clears current table
-        for row in self.table.get_children():
-            self.table.delete(row)
-
-        # adds assessments from overview data to table
-        for unit in self.unit.get_unit_assessments(unit_code):
-            self.table.insert("", "end", values=unit)
+        # updates table rows from unit assessments
+        self.rows.sync(self.unit.get_unit_assessments(unit_code))
 
         # resets focus
         self.table.focus_set()
@@ -6,8 +6,13 @@
 
 import tkinter as tk
 from tkinter import ttk, messagebox
-from data.gpa import GPA
+from data.store import Store
+from data.events import ChangeEvent
 from utils.asset_manager import AssetManager
+from app.virtual_table import VirtualTable
+from collections import Counter
+from fractions import Fraction
+from re import split
 
 class GPAPage(tk.Frame):
     """
@@ -25,9 +30,13 @@ class GPAPage(tk.Frame):
 
         # initialises the frame and gpa data
         super().__init__(root)
-        self.gpa = GPA()
+        self.gpa = Store.get_gpa()
         self.main_window = main_window
 
+        # rebuilds the table on the next load after the data changes
+        self.dirty = True
+        self.gpa.subscribe(self.on_change)
+
         # sets frame to hold table
         table_frame = tk.Frame(self, width=500, height=275)
         table_frame.pack()
@@ -47,13 +56,8 @@ class GPAPage(tk.Frame):
         self.columns = ["Unit #", "Grade", "Credit Points"]
         self.column_width = 160
 
-        # initialises table
-        self.table = ttk.Treeview(table_frame, columns=self.columns, show="headings", height=12)
-
-        # adds columns to the table
-        for column in self.columns:
-            self.table.heading(column, text=column)
-            self.table.column(column, anchor="center", width=self.column_width, minwidth=self.column_width, stretch=False)
+        # initialises table, only rendering the rows in view
+        self.table = VirtualTable(table_frame, self.columns, self.column_width, height=12, key_column=0)
 
         # binds keyboard and mouse actions
         self.table.bind("<Button-1>", self.select_row)
@@ -63,13 +67,8 @@ class GPAPage(tk.Frame):
         # add tag for current record
         self.table.tag_configure("current", background="whitesmoke")
 
-        # initialises scrollbar for the table
-        scrollbar = ttk.Scrollbar(table_frame, orient="vertical", command=self.table.yview)
-        self.table.configure(yscrollcommand=scrollbar.set)
-
-        # adds table and scrollbar to the frame
+        # adds table to the frame
         self.table.grid(row=0, column=0, sticky="nsew")
-        scrollbar.grid(row=0, column=1, sticky="ns")
 
         # sets frame to hold control buttons
         control_frame = tk.Frame(self)
@@ -78,6 +77,7 @@ class GPAPage(tk.Frame):
         # adds the control buttons
         tk.Button(control_frame, text="Add Unit", font=("Segoe UI", 10, "bold"), width=15, command=lambda: self.add_unit_form()).pack(side="left", expand=True, fill="both", padx=10)
         tk.Button(control_frame, text="Remove Unit", font=("Segoe UI", 10, "bold"), width=15, command=lambda: self.remove_unit()).pack(side="left", expand=True, fill="both", padx=10)
+        tk.Button(control_frame, text="Target GPA", font=("Segoe UI", 10, "bold"), width=15, command=lambda: self.target_gpa_form()).pack(side="left", expand=True, fill="both", padx=10)
 
         # sets frame to hold results information
         results_frame = tk.Frame(self)
@@ -122,25 +122,31 @@ class GPAPage(tk.Frame):
         # stops default behaviour
         return "break"
 
-    def load_page(self) -> None:
+    def on_change(self, event: ChangeEvent) -> None:
         """
-            Loads page from data.
+            Marks the page for a rebuild when its data changes.
+
+            Args:
+                event (ChangeEvent): the change event.
         """
 
-        # resets gpa data
-        self.gpa.reset()
+        # marks the table as out of date
+        self.dirty = True
 
-        # clears current table
-        for row in self.table.get_children():
-            self.table.delete(row)
+    def load_page(self) -> None:
+        """
+            Loads page from data.
+        """
 
-        # adds units from gpa record data to table
-        for unit in self.gpa.get_record():
-            self.table.insert("", "end", values=unit, tags=("current",))
+        # keeps the current table if the data has not changed
+        if not self.dirty:
+            self.table.focus_set()
+            return
 
-        # adds units from gpa extra data to table
-        for unit in self.gpa.get_data():
-            self.table.insert("", "end", values=unit)
+        # updates table rows from gpa record and extra data
+        record = self.gpa.get_record()
+        data = self.gpa.get_data()
+        self.table.set_rows(record + data, [("current",)] * len(record) + [()] * len(data))
 
         # set current and calculated gpa
         self.current_gpa_lbl.config(text=self.gpa.get_current_gpa())
@@ -151,6 +157,9 @@ class GPAPage(tk.Frame):
         if len(children) > 0:
             self.table.see(children[0])
 
+        # marks table as up to date
+        self.dirty = False
+
         # resets focus
         self.table.focus_set()
 
@@ -159,6 +168,10 @@ class GPAPage(tk.Frame):
             Creates the add unit form.
         """
 
+        # closes the target gpa form if it is open
+        if self.main_window.entry_window is not None and self.main_window.entry_window.winfo_exists() and self.main_window.entry_window.title() == "Target GPA":
+            self.on_close_target_gpa_form()
+
         # checks if add unit form already exists
         if self.main_window.entry_window is None or not self.main_window.entry_window.winfo_exists():
 
@@ -240,6 +253,135 @@ class GPAPage(tk.Frame):
         self.main_window.entry_window.destroy()
         self.main_window.entry_window = None
 
+    def target_gpa_form(self) -> None:
+        """
+            Creates the target GPA form.
+        """
+
+        # closes form if it already exists
+        if self.main_window.entry_window is not None and self.main_window.entry_window.winfo_exists():
+            self.on_close_target_gpa_form()
+
+        # creates the entry window
+        self.main_window.entry_window = tk.Toplevel(self)
+        self.main_window.entry_window.withdraw()
+
+        # sets close protocol
+        self.main_window.entry_window.protocol("WM_DELETE_WINDOW", self.on_close_target_gpa_form)
+
+        # sets title and icon
+        self.main_window.entry_window.title("Target GPA")
+        self.main_window.entry_window.iconbitmap(AssetManager.get_asset("icon.ico"))
+
+        # sets the window dimensions
+        window_width = 400
+        window_height = 340
+
+        # gets the screen dimensions
+        screen_width = self.main_window.entry_window.winfo_screenwidth()
+        screen_height = self.main_window.entry_window.winfo_screenheight()
+
+        # calculates desired window position
+        x = (screen_width // 2) - (window_width // 2)
+        y = (screen_height // 2) - (window_height // 2) - 30
+
+        # sets window size and position and disables resizing
+        self.main_window.entry_window.geometry(f"{window_width}x{window_height}+{x}+{y}")
+        self.main_window.entry_window.resizable(False, False)
+
+        # adds title label
+        tk.Label(self.main_window.entry_window, text="Grades Needed for Planned Units", font=("Segoe UI", 10, "bold")).pack(pady=10)
+
+        # creates and sets target gpa frame, label, and entry box
+        target_frame = tk.LabelFrame(self.main_window.entry_window, text="Target GPA", font=("Segoe UI", 10, "bold"))
+        target_frame.pack(pady=5)
+        self.target_gpa = tk.Entry(target_frame, width=15, font=("Segoe UI", 10))
+        self.target_gpa.pack(padx=10, pady=10)
+        self.target_gpa.bind("<Return>", lambda e: self.planned.focus_set())
+
+        # creates and sets planned credit points frame, label, and entry box
+        planned_frame = tk.LabelFrame(self.main_window.entry_window, text="Planned Credit Points (e.g. 6, 6, 12)", font=("Segoe UI", 10, "bold"))
+        planned_frame.pack(pady=5)
+        self.planned = tk.Entry(planned_frame, width=30, font=("Segoe UI", 10))
+        self.planned.pack(padx=10, pady=10)
+        self.planned.bind("<Return>", lambda e: self.solve_target())
+
+        # set frame for control buttons
+        control_frame = tk.Frame(self.main_window.entry_window)
+        control_frame.pack(pady=10)
+
+        # adds control buttons
+        tk.Button(control_frame, text="Close", font=("Segoe UI", 10, "bold"), width=15, command=lambda: self.on_close_target_gpa_form()).pack(side="left", expand=True, fill="both", padx=10)
+        tk.Button(control_frame, text="Solve", font=("Segoe UI", 10, "bold"), width=15, command=lambda: self.solve_target()).pack(side="left", expand=True, fill="both", padx=10)
+
+        # adds grades needed information label
+        self.target_grades_lbl = tk.Label(self.main_window.entry_window, text="", font=("Segoe UI", 9), wraplength=360)
+        self.target_grades_lbl.pack()
+
+        # adds input error label
+        self.input_error_lbl = tk.Label(self.main_window.entry_window, text="", font=("Segoe UI", 8, "italic"), fg="red")
+        self.input_error_lbl.pack()
+
+        # shows form
+        self.main_window.entry_window.deiconify()
+
+        # sets focus on target gpa entry box
+        self.target_gpa.focus_set()
+
+    def on_close_target_gpa_form(self) -> None:
+        """
+            Closes the target GPA form.
+        """
+
+        # destroys window and sets pointer to none
+        self.main_window.entry_window.destroy()
+        self.main_window.entry_window = None
+
+    def solve_target(self) -> None:
+        """
+            Shows the cheapest grades for the planned units that reach the target GPA.
+        """
+
+        # gets the target and planned credit points from entry boxes
+        target = self.target_gpa.get().strip()
+        planned = [credit_pts for credit_pts in split(r"[,\s]+", self.planned.get().strip()) if credit_pts]
+
+        # resets result and input error labels
+        self.target_grades_lbl.config(text="")
+        self.input_error_lbl.config(text="")
+
+        # validates target gpa, converting it as the solver does so non-finite values are rejected
+        try:
+            if not 0 <= Fraction(target) <= 4:
+                raise ValueError
+        except ValueError:
+            self.target_gpa.focus_set()
+            self.input_error_lbl.config(text="Input Error: Target GPA is invalid.")
+            return
+
+        # validates planned credit points
+        try:
+            planned = [int(credit_pts) for credit_pts in planned]
+            if not planned or any(credit_pts not in [6, 12, 18, 24] for credit_pts in planned):
+                raise ValueError
+        except ValueError:
+            self.planned.focus_set()
+            self.input_error_lbl.config(text="Input Error: Planned credit points are invalid.")
+            return
+
+        # solves for the grades of the planned units
+        result = self.gpa.solve_target(target, planned)
+
+        # checks if the target cannot be reached
+        if result is None:
+            self.target_grades_lbl.config(text="Target GPA cannot be reached.")
+            return
+
+        # shows the number of units needing each grade at each credit point value and the resulting gpa
+        grades, gpa = result
+        counts = Counter(zip(grades, planned))
+        self.target_grades_lbl.config(text=", ".join(f"{count} x {grade} ({credit_pts} CP)" for (grade, credit_pts), count in counts.items()) + f"\nGPA: {gpa}")
+
     def add_unit(self) -> None:
         """
             Adds a unit to the GPA data.
@@ -268,7 +410,7 @@ class GPAPage(tk.Frame):
 
         # adds unit to the gpa and table
         self.gpa.add_unit([grade, credit_pts])
-        self.table.insert("", "end", values=self.gpa.get_data()[-1])
+        self.table.append(self.gpa.get_data()[-1])
 
         # scrolls table all the way down
         self.table.see(self.table.get_children()[-1])
@@ -282,6 +424,9 @@ class GPAPage(tk.Frame):
         # resets focus
         self.table.focus_set()
 
+        # marks table as up to date
+        self.dirty = False
+
         # displays success message to user
         messagebox.showinfo("Add Unit", f"Unit {len(self.gpa.get_record()) + len(self.gpa.get_data())} added.")
 
@@ -315,20 +460,16 @@ class GPAPage(tk.Frame):
         # updates calculated gpa
         self.calculated_gpa_lbl.config(text=self.gpa.get_calculated_gpa())
 
-        # clears current table
-        for row in self.table.get_children():
-            self.table.delete(row)
-
-        # adds units from gpa record data to table
-        for unit in self.gpa.get_record():
-            self.table.insert("", "end", values=unit, tags=("current",))
-
-        # adds units from gpa extra data to table
-        for unit in self.gpa.get_data():
-            self.table.insert("", "end", values=unit)
+        # updates table rows from gpa record and extra data
+        record = self.gpa.get_record()
+        data = self.gpa.get_data()
+        self.table.set_rows(record + data, [("current",)] * len(record) + [()] * len(data))
 
         # resets focus
         self.table.focus_set()
 
+        # marks table as up to date
+        self.dirty = False
+
         # displays success message to user
         messagebox.showinfo("Remove Unit", f"Unit {unit_no} removed.")
@@ -7,7 +7,10 @@
 import tkinter as tk
 from tkinter import ttk, messagebox
 from data.unit import Unit
+from data.store import Store
+from data.events import ChangeEvent
 from utils.asset_manager import AssetManager
+from app.virtual_table import VirtualTable
 from re import fullmatch
 
 class OverviewPage(tk.Frame):
@@ -30,6 +33,10 @@ class OverviewPage(tk.Frame):
         self.unit = unit
         self.main_window = main_window
 
+        # rebuilds the table on the next load after the data changes
+        self.dirty = True
+        self.unit.subscribe(self.on_change)
+
         # sets frame to hold table
         table_frame = tk.Frame(self, width=500, height=185)
         table_frame.pack()
@@ -49,26 +56,16 @@ class OverviewPage(tk.Frame):
         self.columns = ["Unit Code", "Mark (Grade)", "Remaining", "Average Required"]
         self.column_width = 120
 
-        # initialises table
-        self.table = ttk.Treeview(table_frame, columns=self.columns, show="headings", height=8)
-
-        # adds columns to the table
-        for column in self.columns:
-            self.table.heading(column, text=column)
-            self.table.column(column, anchor="center", width=self.column_width, minwidth=self.column_width, stretch=False)
+        # initialises table, only rendering the rows in view
+        self.table = VirtualTable(table_frame, self.columns, self.column_width, height=8, key_column=0)
 
         # binds keyboard and mouse actions
         self.table.bind("<Button-1>", self.select_row)
         self.table.bind("<BackSpace>", lambda e: self.remove_unit())
         self.table.bind("<Return>", lambda e: self.add_unit_form())
 
-        # initialises scrollbar for the table
-        scrollbar = ttk.Scrollbar(table_frame, orient="vertical", command=self.table.yview)
-        self.table.configure(yscrollcommand=scrollbar.set)
-
-        # adds table and scrollbar to the frame
+        # adds table to the frame
         self.table.grid(row=0, column=0, sticky="nsew")
-        scrollbar.grid(row=0, column=1, sticky="ns")
 
         # sets change target type
         self.change_target_type = "Grade"
@@ -86,6 +83,9 @@ class OverviewPage(tk.Frame):
         tk.Button(control_frame, text="Add Unit", font=("Segoe UI", 10, "bold"), width=15, command=lambda: self.add_unit_form()).pack(side="left", expand=True, fill="both", padx=10)
         tk.Button(control_frame, text="Remove Unit", font=("Segoe UI", 10, "bold"), width=15, command=lambda: self.remove_unit()).pack(side="left", expand=True, fill="both", padx=10)
 
+        # adds the projection button
+        tk.Button(self, text="Projection", font=("Segoe UI", 10, "bold"), width=15, command=lambda: self.projection_form()).pack()
+
     def select_row(self, event: tk.Event) -> None:
         """
             Handles a select row action.
@@ -115,24 +115,38 @@ class OverviewPage(tk.Frame):
         # stops default behaviour
         return "break"
 
+    def on_change(self, event: ChangeEvent) -> None:
+        """
+            Marks the page for a rebuild when its data changes.
+
+            Args:
+                event (ChangeEvent): the change event.
+        """
+
+        # marks the table as out of date
+        self.dirty = True
+
     def load_page(self) -> None:
         """
             Loads page from data.
         """
 
-        # clear current table
-        for row in self.table.get_children():
-            self.table.delete(row)
+        # keeps the current table if the data has not changed
+        if not self.dirty:
+            self.table.focus_set()
+            return
 
-        # add units from unit data to table
-        for unit in self.unit.get_overview():
-            self.table.insert("", "end", values=unit)
+        # updates table rows from unit data
+        self.table.set_rows(self.unit.get_overview())
 
         # scrolls table all the way up
         children = self.table.get_children()
         if len(children) > 0:
             self.table.see(children[0])
 
+        # marks table as up to date
+        self.dirty = False
+
         # resets focus
         self.table.focus_set()
 
@@ -156,9 +170,12 @@ class OverviewPage(tk.Frame):
         self.main_window.entry_window.title("Change Target")
         self.main_window.entry_window.iconbitmap(AssetManager.get_asset("icon.ico"))
 
+        # gets the average required of each unit for each target grade
+        requirements = self.unit.get_requirements()
+
         # sets the window dimensions
         window_width = 400
-        window_height = 270
+        window_height = 270 + 20 * len(requirements)
 
         # gets the screen dimensions
         screen_width = self.main_window.entry_window.winfo_screenwidth()
@@ -175,6 +192,11 @@ class OverviewPage(tk.Frame):
         # adds title label
         tk.Label(self.main_window.entry_window, text="Set New Target", font=("Segoe UI", 10, "bold")).pack(pady=15)
 
+        # adds the average required of each unit for each target grade
+        if requirements:
+            averages = "\n".join(f"{unit_code}:  " + "  ".join(f"{grade} {average}" for grade, average in grades.items()) for unit_code, grades in requirements.items())
+            tk.Label(self.main_window.entry_window, text=averages, font=("Segoe UI", 9), justify="left").pack()
+
         # sets change target type
         self.change_target_type = "Grade"
 
@@ -206,6 +228,75 @@ class OverviewPage(tk.Frame):
         # sets focus on target entry box
         self.target.focus_set()
 
+    def projection_form(self) -> None:
+        """
+            Creates the projection form.
+        """
+
+        # checks if there are no units to project
+        if not self.unit.data:
+            messagebox.showerror("Projection", "Add a unit to project.")
+            return
+
+        # projects the units from the record totals
+        record = Store.get_record()
+        try:
+            projection = self.unit.get_projection(record.weighted_marks, record.weighted_credits)
+        except ImportError as error:
+            messagebox.showerror("Projection", str(error))
+            return
+        except ValueError:
+            messagebox.showerror("Projection", "Add an assessment to project from.")
+            return
+
+        # closes form if it already exists
+        if self.main_window.entry_window is not None and self.main_window.entry_window.winfo_exists():
+            self.on_close_form_close()
+
+        # creates the entry window
+        self.main_window.entry_window = tk.Toplevel(self)
+        self.main_window.entry_window.withdraw()
+
+        # sets close protocol
+        self.main_window.entry_window.protocol("WM_DELETE_WINDOW", self.on_close_form_close)
+
+        # sets title and icon
+        self.main_window.entry_window.title("Projection")
+        self.main_window.entry_window.iconbitmap(AssetManager.get_asset("icon.ico"))
+
+        # sets the window dimensions
+        window_width = 400
+        window_height = 160 + 20 * len(projection.bands)
+
+        # gets the screen dimensions
+        screen_width = self.main_window.entry_window.winfo_screenwidth()
+        screen_height = self.main_window.entry_window.winfo_screenheight()
+
+        # calculates desired window position
+        x = (screen_width // 2) - (window_width // 2)
+        y = (screen_height // 2) - (window_height // 2) - 30
+
+        # sets window size and position and disables resizing
+        self.main_window.entry_window.geometry(f"{window_width}x{window_height}+{x}+{y}")
+        self.main_window.entry_window.resizable(False, False)
+
+        # adds title label
+        tk.Label(self.main_window.entry_window, text="Chance of Each Grade", font=("Segoe UI", 10, "bold")).pack(pady=10)
+
+        # adds the grade band chances of each unit
+        bands = "\n".join(f"{unit_code}:  " + "  ".join(f"{grade} {chance:.0%}" for grade, chance in chances.items()) for unit_code, chances in projection.bands.items())
+        tk.Label(self.main_window.entry_window, text=bands, font=("Segoe UI", 9), justify="left").pack()
+
+        # adds the projected wam
+        percentiles = projection.get_wam_percentiles((5, 50, 95))
+        tk.Label(self.main_window.entry_window, text=f"Projected WAM: {percentiles[50]:06.3f} (90% between {percentiles[5]:06.3f} and {percentiles[95]:06.3f})", font=("Segoe UI", 9, "bold")).pack(pady=10)
+
+        # adds close button
+        tk.Button(self.main_window.entry_window, text="Close", font=("Segoe UI", 10, "bold"), width=15, command=lambda: self.on_close_form_close()).pack(pady=5)
+
+        # shows form
+        self.main_window.entry_window.deiconify()
+
     def switch_target_type(self) -> None:
         """
             Switches target type.
@@ -337,13 +428,8 @@ class OverviewPage(tk.Frame):
         # updates target label
         self.target_lbl.config(text=self.unit.get_target())
 
-        # clear current table
-        for row in self.table.get_children():
-            self.table.delete(row)
-
-        # add units from unit data to table
-        for unit in self.unit.get_overview():
-            self.table.insert("", "end", values=unit)
+        # updates table rows from unit data
+        self.table.set_rows(self.unit.get_overview())
 
         # scrolls table all the way up
         children = self.table.get_children()
@@ -353,6 +439,9 @@ class OverviewPage(tk.Frame):
         # resets focus
         self.table.focus_set()
 
+        # marks table as up to date
+        self.dirty = False
+
         # displays success message to user
         messagebox.showinfo("Change Target", "Target changed.")
 
@@ -376,13 +465,8 @@ class OverviewPage(tk.Frame):
         # closes add unit form
         self.main_window.entry_window.destroy()
 
-        # clear current table
-        for row in self.table.get_children():
-            self.table.delete(row)
-
-        # add units from overview data to table
-        for unit in self.unit.get_overview():
-            self.table.insert("", "end", values=unit)
+        # updates table rows from overview data
+        self.table.set_rows(self.unit.get_overview())
 
         # scrolls table all the way up
         self.table.see(self.table.get_children()[0])
@@ -390,6 +474,9 @@ class OverviewPage(tk.Frame):
         # resets focus
         self.table.focus_set()
 
+        # marks table as up to date
+        self.dirty = False
+
         # displays success message to user
         messagebox.showinfo("Add Unit", f"{unit_code} added.")
 
@@ -420,16 +507,14 @@ class OverviewPage(tk.Frame):
         # deletes the selected unit from unit data
         self.unit.remove_unit(unit_code)
 
-        # clears current table
-        for row in self.table.get_children():
-            self.table.delete(row)
-
-        # adds units from overview data to table
-        for unit in self.unit.get_overview():
-            self.table.insert("", "end", values=unit)
+        # updates table rows from overview data
+        self.table.set_rows(self.unit.get_overview())
 
         # resets focus
         self.table.focus_set()
 
+        # marks table as up to date
+        self.dirty = False
+
         # displays success message to user
         messagebox.showinfo("Remove Unit", f"{unit_code} removed.")
@@ -6,9 +6,12 @@
 
 import tkinter as tk
 from tkinter import ttk, messagebox
-from data.record import Record
+from data.store import Store
+from data.events import ChangeEvent
 from utils.asset_manager import AssetManager
+from app.virtual_table import VirtualTable
 from re import fullmatch
+from math import inf
 
 class RecordPage(tk.Frame):
     """
@@ -26,9 +29,13 @@ class RecordPage(tk.Frame):
 
         # initialises the frame and record
         super().__init__(root)
-        self.record = Record()
+        self.record = Store.get_record()
         self.main_window = main_window
 
+        # rebuilds the table on the next load after the data changes
+        self.dirty = True
+        self.record.subscribe(self.on_change)
+
         # sets frame to hold table
         table_frame = tk.Frame(self, width=500, height=275)
         table_frame.pack()
@@ -45,29 +52,28 @@ class RecordPage(tk.Frame):
         self.option_add("*Entry.selectForeground", "black")
 
         # sets columns of the table
-        self.columns = ["Unit #", "Unit Code", "Mark", "Grade", "Credit Points"]
-        self.column_width = 96
+        self.columns = ["Unit #", "Unit Code", "Mark", "Grade", "Credit Points", "WAM Impact"]
+        self.column_width = 80
+
+        # initialises table, only rendering the rows in view
+        self.table = VirtualTable(table_frame, self.columns, self.column_width, height=12, key_column=1)
 
-        # initialises table
-        self.table = ttk.Treeview(table_frame, columns=self.columns, show="headings", height=12)
+        # hides the impact column until it is shown from the impact form
+        self.impact_shown = False
+        self.retake_mark = None
+        self.table.display_columns(self.columns[:5])
 
-        # adds columns to the table
-        for column in self.columns:
-            self.table.heading(column, text=column)
-            self.table.column(column, anchor="center", width=self.column_width, minwidth=self.column_width, stretch=False)
+        # sorts rows by impact when its heading is clicked
+        self.sort_impact = False
+        self.table.heading("WAM Impact", command=self.sort_by_impact)
 
         # binds keyboard and mouse actions
         self.table.bind("<Button-1>", self.select_row)
         self.table.bind("<BackSpace>", lambda e: self.remove_unit())
         self.table.bind("<Return>", lambda e: self.add_unit_form())
 
-        # initialises scrollbar for the table
-        scrollbar = ttk.Scrollbar(table_frame, orient="vertical", command=self.table.yview)
-        self.table.configure(yscrollcommand=scrollbar.set)
-
-        # adds table and scrollbar to the frame
+        # adds table to the frame
         self.table.grid(row=0, column=0, sticky="nsew")
-        scrollbar.grid(row=0, column=1, sticky="ns")
 
         # sets frame to hold control buttons
         control_frame = tk.Frame(self)
@@ -76,6 +82,7 @@ class RecordPage(tk.Frame):
         # adds the control buttons
         tk.Button(control_frame, text="Add Unit", font=("Segoe UI", 10, "bold"), width=15, command=lambda: self.add_unit_form()).pack(side="left", expand=True, fill="both", padx=10)
         tk.Button(control_frame, text="Remove Unit", font=("Segoe UI", 10, "bold"), width=15, command=lambda: self.remove_unit()).pack(side="left", expand=True, fill="both", padx=10)
+        tk.Button(control_frame, text="Impact", font=("Segoe UI", 10, "bold"), width=15, command=lambda: self.impact_form()).pack(side="left", expand=True, fill="both", padx=10)
 
         # sets frame to hold results information
         results_frame = tk.Frame(self)
@@ -91,6 +98,11 @@ class RecordPage(tk.Frame):
         self.gpa_lbl = tk.Label(results_frame, text="0.000", font=("Segoe UI", 10))
         self.gpa_lbl.pack(side="left", expand=True, fill="both", padx=(0, 20))
 
+        # adds credit points information label
+        tk.Label(results_frame, text="Credit Points:", font=("Segoe UI", 10, "bold")).pack(side="left", expand=True, fill="both", padx=(20, 0))
+        self.credits_lbl = tk.Label(results_frame, text="0", font=("Segoe UI", 10))
+        self.credits_lbl.pack(side="left", expand=True, fill="both", padx=(0, 20))
+
     def select_row(self, event: tk.Event) -> None:
         """
             Handles a select row action.
@@ -120,28 +132,244 @@ class RecordPage(tk.Frame):
         # stops default behaviour
         return "break"
 
+    def on_change(self, event: ChangeEvent) -> None:
+        """
+            Marks the page for a rebuild when its data changes.
+
+            Args:
+                event (ChangeEvent): the change event.
+        """
+
+        # marks the table as out of date
+        self.dirty = True
+
+    def update_summary(self) -> None:
+        """
+            Updates the results labels from the record summary.
+        """
+
+        # gets the summary of the record
+        summary = self.record.summary()
+
+        # sets wam, gpa and credit points
+        self.wam_lbl.config(text=summary.wam)
+        self.gpa_lbl.config(text=summary.gpa)
+        self.credits_lbl.config(text=summary.total_credits)
+
+    def update_impacts(self) -> None:
+        """
+            Updates the impact column of the table while it is shown.
+        """
+
+        # skips working out impacts while the column is hidden
+        if not self.impact_shown:
+            return
+
+        # sets how much each unit raises the wam, or how much retaking it would
+        impacts = self.record.get_impacts(self.retake_mark)
+        self.table.set_column(5, {unit_code: impact[-1] for unit_code, impact in impacts.items()})
+
+        # keeps rows sorted by impact
+        if self.sort_impact:
+            self.table.sort(self.get_impact_key)
+
+    def get_impact_key(self, row: list) -> float:
+        """
+            Returns the sort key of a row when sorting by impact.
+
+            Args:
+                row (list): the table row.
+
+            Returns:
+                float: the key putting the units dragging the WAM down most, or gaining most when retaken, first.
+        """
+
+        # puts units without an impact last
+        if row[5] == "-":
+            return inf
+
+        # sorts wam impacts up and retake impacts down
+        return float(row[5]) if self.retake_mark is None else -float(row[5])
+
+    def update_impact_heading(self) -> None:
+        """
+            Updates the heading of the impact column.
+        """
+
+        # names the column after the impact shown, marking the sort direction
+        text = "WAM Impact" if self.retake_mark is None else f"Retake {self.retake_mark}"
+        if self.sort_impact:
+            text += " ▲" if self.retake_mark is None else " ▼"
+        self.table.heading("WAM Impact", text=text)
+
+    def sort_by_impact(self) -> None:
+        """
+            Toggles sorting the table by impact.
+        """
+
+        # toggles sorting and updates heading
+        self.sort_impact = not self.sort_impact
+        self.update_impact_heading()
+
+        # sorts rows by impact, or back into record order
+        self.table.sort(self.get_impact_key if self.sort_impact else lambda row: row[0])
+
+        # scrolls table all the way up
+        children = self.table.get_children()
+        if len(children) > 0:
+            self.table.see(children[0])
+
+        # resets focus
+        self.table.focus_set()
+
+    def impact_form(self) -> None:
+        """
+            Creates the impact form.
+        """
+
+        # closes form if it already exists
+        if self.main_window.entry_window is not None and self.main_window.entry_window.winfo_exists():
+            self.on_close_impact_form()
+
+        # creates the entry window
+        self.main_window.entry_window = tk.Toplevel(self)
+        self.main_window.entry_window.withdraw()
+
+        # sets close protocol
+        self.main_window.entry_window.protocol("WM_DELETE_WINDOW", self.on_close_impact_form)
+
+        # sets title and icon
+        self.main_window.entry_window.title("Impact")
+        self.main_window.entry_window.iconbitmap(AssetManager.get_asset("icon.ico"))
+
+        # sets the window dimensions
+        window_width = 400
+        window_height = 200
+
+        # gets the screen dimensions
+        screen_width = self.main_window.entry_window.winfo_screenwidth()
+        screen_height = self.main_window.entry_window.winfo_screenheight()
+
+        # calculates desired window position
+        x = (screen_width // 2) - (window_width // 2)
+        y = (screen_height // 2) - (window_height // 2) - 30
+
+        # sets window size and position and disables resizing
+        self.main_window.entry_window.geometry(f"{window_width}x{window_height}+{x}+{y}")
+        self.main_window.entry_window.resizable(False, False)
+
+        # adds title label
+        tk.Label(self.main_window.entry_window, text="WAM Change of Each Unit", font=("Segoe UI", 10, "bold")).pack(pady=10)
+
+        # creates and sets retake mark frame, label, and entry box
+        retake_frame = tk.LabelFrame(self.main_window.entry_window, text="Retake Mark (blank to leave units out)", font=("Segoe UI", 10, "bold"))
+        retake_frame.pack(pady=5)
+        self.retake = tk.Entry(retake_frame, width=15, font=("Segoe UI", 10))
+        self.retake.pack(padx=10, pady=10)
+        self.retake.insert(0, "" if self.retake_mark is None else str(self.retake_mark))
+        self.retake.bind("<Return>", lambda e: self.show_impact())
+
+        # set frame for control buttons
+        control_frame = tk.Frame(self.main_window.entry_window)
+        control_frame.pack(pady=10)
+
+        # adds control buttons
+        tk.Button(control_frame, text="Hide", font=("Segoe UI", 10, "bold"), width=15, command=lambda: self.hide_impact()).pack(side="left", expand=True, fill="both", padx=10)
+        tk.Button(control_frame, text="Show", font=("Segoe UI", 10, "bold"), width=15, command=lambda: self.show_impact()).pack(side="left", expand=True, fill="both", padx=10)
+
+        # adds input error label
+        self.input_error_lbl = tk.Label(self.main_window.entry_window, text="", font=("Segoe UI", 8, "italic"), fg="red")
+        self.input_error_lbl.pack()
+
+        # shows form
+        self.main_window.entry_window.deiconify()
+
+        # sets focus on retake mark entry box
+        self.retake.focus_set()
+
+    def on_close_impact_form(self) -> None:
+        """
+            Closes the impact form.
+        """
+
+        # destroys window and sets pointer to none
+        self.main_window.entry_window.destroy()
+        self.main_window.entry_window = None
+
+    def show_impact(self) -> None:
+        """
+            Shows how much each unit changes the WAM, or how much retaking it at the retake mark would.
+        """
+
+        # gets the retake mark from entry box
+        retake_mark = self.retake.get().strip()
+
+        # validates retake mark
+        try:
+            retake_mark = int(retake_mark) if retake_mark else None
+            if retake_mark is not None and not 0 <= retake_mark <= 100:
+                raise ValueError
+        except ValueError:
+            self.retake.focus_set()
+            self.input_error_lbl.config(text="Input Error: Retake mark is invalid.")
+            return
+
+        # shows the impact column and works out the impacts
+        self.retake_mark = retake_mark
+        self.impact_shown = True
+        self.table.display_columns(self.columns)
+        self.update_impact_heading()
+        self.update_impacts()
+
+        # closes impact form
+        self.on_close_impact_form()
+
+        # resets focus
+        self.table.focus_set()
+
+    def hide_impact(self) -> None:
+        """
+            Hides the impact column, putting rows back into record order.
+        """
+
+        # hides the impact column and stops sorting by it
+        self.impact_shown = False
+        self.sort_impact = False
+        self.update_impact_heading()
+        self.table.display_columns(self.columns[:5])
+        self.table.sort(lambda row: row[0])
+
+        # closes impact form
+        self.on_close_impact_form()
+
+        # resets focus
+        self.table.focus_set()
+
     def load_page(self) -> None:
         """
             Loads page from data.
         """
 
-        # clears current table
-        for row in self.table.get_children():
-            self.table.delete(row)
+        # keeps the current table if the data has not changed
+        if not self.dirty:
+            self.table.focus_set()
+            return
 
-        # adds units from record to table
-        for unit in self.record.get_data():
-            self.table.insert("", "end", values=unit)
+        # updates table rows and impacts from record
+        self.table.set_rows(self.record.get_data())
+        self.update_impacts()
 
-        # set wam and gpa
-        self.wam_lbl.config(text=self.record.get_wam())
-        self.gpa_lbl.config(text=self.record.get_gpa())
+        # sets wam, gpa and credit points
+        self.update_summary()
 
         # scrolls table all the way up
         children = self.table.get_children()
         if len(children) > 0:
             self.table.see(children[0])
 
+        # marks table as up to date
+        self.dirty = False
+
         # resets focus
         self.table.focus_set()
 
@@ -150,6 +378,10 @@ class RecordPage(tk.Frame):
             Creates the add unit form.
         """
 
+        # closes the impact form if it is open
+        if self.main_window.entry_window is not None and self.main_window.entry_window.winfo_exists() and self.main_window.entry_window.title() == "Impact":
+            self.on_close_impact_form()
+
         # checks if add unit form already exists
         if self.main_window.entry_window is None or not self.main_window.entry_window.winfo_exists():
 
@@ -269,7 +501,7 @@ class RecordPage(tk.Frame):
         credit_pts = self.credit_pts.get()
 
         # validates unit code
-        if not fullmatch(r"[A-Z]{3}\d{4}", unit_code) or unit_code in [unit for _, unit, _, _, _ in self.record.get_data()]:
+        if not fullmatch(r"[A-Z]{3}\d{4}", unit_code) or self.record.has_unit(unit_code):
             self.unit_code.focus_set()
             self.input_error_lbl.config(text="Input Error: Unit code is invalid.")
             return
@@ -315,16 +547,16 @@ class RecordPage(tk.Frame):
         mark = str(mark)
         credit_pts = str(credit_pts)
 
-        # adds unit to the record and table
+        # adds unit to the record and table, updating impacts as the unit changes every one
         self.record.add_unit([unit_code, mark, grade, credit_pts])
-        self.table.insert("", "end", values=self.record.get_data()[-1])
+        self.table.append(self.record.get_data()[-1])
+        self.update_impacts()
 
-        # scrolls table all the way down
-        self.table.see(self.table.get_children()[-1])
+        # scrolls table to the new unit
+        self.table.see(unit_code)
 
-        # updates wam and gpa
-        self.wam_lbl.config(text=self.record.get_wam())
-        self.gpa_lbl.config(text=self.record.get_gpa())
+        # updates wam, gpa and credit points
+        self.update_summary()
 
         # closes add unit form
         self.main_window.entry_window.destroy()
@@ -332,6 +564,9 @@ class RecordPage(tk.Frame):
         # resets focus
         self.table.focus_set()
 
+        # marks table as up to date
+        self.dirty = False
+
         # displays success message to user
         messagebox.showinfo("Add Unit", f"{unit_code} added.")
 
@@ -363,20 +598,18 @@ class RecordPage(tk.Frame):
         # deletes the selected unit from record
         self.record.remove_unit(unit_no)
 
-        # updates wam and gpa
-        self.wam_lbl.config(text=self.record.get_wam())
-        self.gpa_lbl.config(text=self.record.get_gpa())
-
-        # clears current table
-        for row in self.table.get_children():
-            self.table.delete(row)
+        # updates wam, gpa and credit points
+        self.update_summary()
 
-        # adds units from record to table
-        for unit in self.record.get_data():
-            self.table.insert("", "end", values=unit)
+        # updates table rows and impacts from record
+        self.table.set_rows(self.record.get_data())
+        self.update_impacts()
 
         # resets focus
         self.table.focus_set()
 
+        # marks table as up to date
+        self.dirty = False
+
         # displays success message to user
         messagebox.showinfo("Remove Unit", f"{unit_code} removed.")
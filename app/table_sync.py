@@ -0,0 +1,97 @@
+"""
+    table_sync.py
+
+    Contains the table sync helper class.
+"""
+
+from tkinter import ttk
+
+class TableSync:
+    """
+        Keeps the rows of a table in step with a list of rows.
+
+        Each row is keyed by one of its columns, which is used as the row id
+        in the table. New rows are compared with the displayed ones so only
+        the rows that were added, removed, changed or moved are touched.
+    """
+
+    def __init__(self, table: ttk.Treeview, key_column: int) -> None:
+        """
+            Initialises the table sync.
+
+            Args:
+                table (ttk.Treeview): the table to keep in step.
+                key_column (int): the column that identifies each row.
+        """
+
+        # sets table and key column
+        self.table = table
+        self.key_column = key_column
+
+        # initialises displayed row order and row contents
+        self.order = []
+        self.rows = {}
+
+    def sync(self, rows: list[list], tags: list[tuple[str, ...]] | None = None) -> None:
+        """
+            Updates the table to show the given rows.
+
+            Args:
+                rows (list[list]): the rows to show.
+                tags (list[tuple[str, ...]] | None): the tags of each row.
+        """
+
+        # gets the key of each new row
+        keys = [str(row[self.key_column]) for row in rows]
+        key_set = set(keys)
+
+        # deletes rows that are no longer shown
+        stale = [key for key in self.order if key not in key_set]
+        if stale:
+            self.table.delete(*stale)
+            for key in stale:
+                del self.rows[key]
+            self.order = [key for key in self.order if key in key_set]
+
+        # iterates through the new rows in order
+        for index, (key, row) in enumerate(zip(keys, rows)):
+
+            # gets the displayed contents of the row
+            row_tags = tags[index] if tags else ()
+            contents = (tuple(str(value) for value in row), row_tags)
+
+            # inserts a new row
+            if key not in self.rows:
+                self.table.insert("", index, iid=key, values=row, tags=row_tags)
+                self.order.insert(index, key)
+
+            # updates an existing row
+            else:
+
+                # updates the values of a changed row
+                if self.rows[key] != contents:
+                    self.table.item(key, values=row, tags=row_tags)
+
+                # moves a row that is out of place
+                if self.order[index] != key:
+                    self.table.move(key, "", index)
+                    self.order.remove(key)
+                    self.order.insert(index, key)
+
+            # stores the displayed contents of the row
+            self.rows[key] = contents
+
+    def append(self, row: list, tags: tuple[str, ...] = ()) -> None:
+        """
+            Adds a row to the end of the table.
+
+            Args:
+                row (list): the row to add.
+                tags (tuple[str, ...]): the tags of the row.
+        """
+
+        # inserts the row and stores its contents
+        key = str(row[self.key_column])
+        self.table.insert("", "end", iid=key, values=row, tags=tags)
+        self.order.append(key)
+        self.rows[key] = (tuple(str(value) for value in row), tags)
@@ -5,7 +5,7 @@
 """
 
 import tkinter as tk
-from data.unit import Unit
+from data.store import Store
 from app.overview_page import OverviewPage
 from app.assessment_page import AssessmentPage
 
@@ -25,7 +25,7 @@ class UnitPage(tk.Frame):
 
         # initialises the frame and unit data
         super().__init__(root)
-        self.unit = Unit()
+        self.unit = Store.get_unit()
         self.main_window = main_window
 
         # sets frame to hold menu buttons
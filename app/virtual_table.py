@@ -0,0 +1,396 @@
+"""
+    virtual_table.py
+
+    Contains the virtual table widget.
+"""
+
+import tkinter as tk
+from tkinter import ttk
+from app.table_sync import TableSync
+
+class VirtualTable(tk.Frame):
+    """
+        A table that only keeps the rows in view as real table items.
+
+        All rows are kept in a backing list, and only the visible rows plus a
+        small overscan above and below them are inserted into the underlying
+        Treeview. The scrollbar is mapped onto the backing list, so load time
+        and widget memory stay flat as the number of rows grows. Rows are
+        identified by the value in their key column, which is used in place of
+        Treeview item ids by selection, item and see.
+    """
+
+    # sets the number of rows rendered above and below the visible rows
+    overscan = 10
+
+    def __init__(self, root: tk.Frame, columns: list[str], column_width: int, height: int, key_column: int) -> None:
+        """
+            Initialises the virtual table.
+
+            Args:
+                root (tk.Frame): the frame holding the table.
+                columns (list[str]): the column headings.
+                column_width (int): the width of each column.
+                height (int): the number of visible rows.
+                key_column (int): the column that identifies each row.
+        """
+
+        # initialises the frame and sizes
+        super().__init__(root)
+        self.height = height
+        self.key_column = key_column
+        self.width = column_width * len(columns)
+
+        # initialises backing rows, tags, key positions and selection
+        self.rows = []
+        self.tags = []
+        self.keys = []
+        self.positions = {}
+        self.selected = []
+
+        # initialises the first visible row and the first rendered row
+        self.first = 0
+        self.start = 0
+        self.end = 0
+
+        # initialises table
+        self.tree = ttk.Treeview(self, columns=columns, show="headings", height=height)
+
+        # keeps rendered rows in step with the visible window
+        self.rendered = TableSync(self.tree, key_column)
+
+        # adds columns to the table
+        for column in columns:
+            self.tree.heading(column, text=column)
+            self.tree.column(column, anchor="center", width=column_width, minwidth=column_width, stretch=False)
+
+        # initialises scrollbar mapped onto the backing rows
+        self.scrollbar = ttk.Scrollbar(self, orient="vertical", command=self.yview)
+        self.tree.configure(yscrollcommand=self.on_tree_scroll)
+
+        # follows selection changes made by the table itself, such as the arrow keys
+        self.tree.bind("<<TreeviewSelect>>", self.on_tree_select)
+
+        # adds table and scrollbar to the frame
+        self.tree.grid(row=0, column=0, sticky="nsew")
+        self.scrollbar.grid(row=0, column=1, sticky="ns")
+
+    def set_rows(self, rows: list[list], tags: list[tuple[str, ...]] | None = None) -> None:
+        """
+            Replaces the backing rows and renders the visible window.
+
+            Args:
+                rows (list[list]): the rows of the table.
+                tags (list[tuple[str, ...]] | None): the tags of each row.
+        """
+
+        # sets backing rows and tags
+        self.rows = rows
+        self.tags = tags if tags else [()] * len(rows)
+
+        # indexes rows by key
+        self.keys = [str(row[self.key_column]) for row in rows]
+        self.positions = {key: index for index, key in enumerate(self.keys)}
+
+        # drops selected rows that no longer exist
+        self.selected = [key for key in self.selected if key in self.positions]
+
+        # renders the visible window
+        self.render(self.first)
+
+    def append(self, row: list, tags: tuple[str, ...] = ()) -> None:
+        """
+            Adds a row to the end of the table.
+
+            Args:
+                row (list): the row to add.
+                tags (tuple[str, ...]): the tags of the row.
+        """
+
+        # adds the row to the backing rows
+        key = str(row[self.key_column])
+        self.positions[key] = len(self.rows)
+        self.rows.append(row)
+        self.tags.append(tags)
+        self.keys.append(key)
+
+        # renders the visible window
+        self.render(self.first)
+
+    def set_column(self, column: int, values: dict[str, object]) -> None:
+        """
+            Replaces one value of each row and renders the visible window.
+
+            Args:
+                column (int): the index of the column.
+                values (dict[str, object]): the new value of each row, by row key.
+        """
+
+        # sets the value of each row, padding rows without the column
+        for key, value in values.items():
+            row = self.rows[self.positions[key]]
+            row.extend([""] * (column + 1 - len(row)))
+            row[column] = value
+
+        # renders the visible window
+        self.render(self.first)
+
+    def sort(self, key: object) -> None:
+        """
+            Sorts the backing rows and renders the visible window.
+
+            Args:
+                key (object): the function giving the sort key of a row.
+        """
+
+        # reorders rows with their tags
+        order = sorted(range(len(self.rows)), key=lambda index: key(self.rows[index]))
+        self.set_rows([self.rows[index] for index in order], [self.tags[index] for index in order])
+
+    def render(self, first: int) -> None:
+        """
+            Renders the window of rows around the first visible row.
+
+            Args:
+                first (int): the index of the first visible row.
+        """
+
+        # clamps the first visible row to the backing rows
+        self.first = max(0, min(first, len(self.rows) - self.height))
+
+        # gets the rendered window including overscan
+        self.start = max(0, self.first - self.overscan)
+        self.end = min(len(self.rows), self.first + self.height + self.overscan)
+
+        # updates rendered rows
+        self.rendered.sync(self.rows[self.start:self.end], self.tags[self.start:self.end])
+
+        # restores the selection of rendered rows
+        self.tree.selection_set([key for key in self.selected if self.start <= self.positions[key] < self.end])
+
+        # scrolls the table to the first visible row
+        if self.end > self.start:
+            self.tree.yview_moveto((self.first - self.start) / (self.end - self.start))
+
+        # updates the scrollbar
+        self.update_scrollbar()
+
+    def update_scrollbar(self) -> None:
+        """
+            Sets the scrollbar from the position of the visible rows in the backing rows.
+        """
+
+        # shows the whole range when all rows fit
+        if len(self.rows) <= self.height:
+            self.scrollbar.set(0, 1)
+
+        # shows the visible fraction of the backing rows
+        else:
+            self.scrollbar.set(self.first / len(self.rows), (self.first + self.height) / len(self.rows))
+
+    def on_tree_scroll(self, low: str, high: str) -> None:
+        """
+            Follows scrolling done by the table itself and renders more rows near the window edges.
+
+            Args:
+                low (str): the top of the table view as a fraction of the rendered rows.
+                high (str): the bottom of the table view as a fraction of the rendered rows.
+        """
+
+        # gets the first visible row in the backing rows
+        first = self.start + round(float(low) * (self.end - self.start))
+
+        # renders a new window if the view is close to the edge of the rendered rows
+        margin = self.overscan // 2
+        if (first - self.start < margin and self.start > 0) or \
+           (self.end - (first + self.height) < margin and self.end < len(self.rows)):
+            self.render(first)
+
+        # updates the scrollbar otherwise
+        else:
+            self.first = first
+            self.update_scrollbar()
+
+    def on_tree_select(self, event: tk.Event) -> None:
+        """
+            Copies the selection of the rendered rows from the table, keeping the selection of rows not rendered.
+
+            Args:
+                event (tk.Event): the selection event.
+        """
+
+        # replaces the selected rendered rows with the table selection
+        rendered = set(self.keys[self.start:self.end])
+        self.selected = [key for key in self.selected if key not in rendered] + list(self.tree.selection())
+
+    def yview(self, *args: str) -> None:
+        """
+            Handles scrollbar movement by rendering the matching window of rows.
+
+            Args:
+                *args (str): the scrollbar command arguments.
+        """
+
+        # moves to a fraction of the backing rows
+        if args[0] == "moveto":
+            self.render(round(float(args[1]) * len(self.rows)))
+
+        # scrolls by rows or pages
+        elif args[0] == "scroll":
+            step = self.height if args[2] == "pages" else 1
+            self.render(self.first + int(args[1]) * step)
+
+    def see(self, key: str | tuple[str, ...]) -> None:
+        """
+            Scrolls the table so a row is visible.
+
+            Args:
+                key (str | tuple[str, ...]): the key of the row, or a selection holding it.
+        """
+
+        # gets the key from a selection
+        if isinstance(key, (tuple, list)):
+            if not key: return
+            key = key[0]
+
+        # gets the position of the row
+        position = self.positions[str(key)]
+
+        # renders a window showing the row if it is out of view
+        if position < self.first:
+            self.render(position)
+        elif position >= self.first + self.height:
+            self.render(position - self.height + 1)
+
+    def get_children(self) -> tuple[str, ...]:
+        """
+            Returns the keys of all backing rows.
+
+            Returns:
+                tuple[str, ...]: the row keys.
+        """
+
+        # returns all row keys
+        return tuple(self.keys)
+
+    def item(self, key: str) -> dict[str, list]:
+        """
+            Returns the values and tags of a row.
+
+            Args:
+                key (str): the key of the row.
+
+            Returns:
+                dict[str, list]: the row values and tags.
+        """
+
+        # gets the row from the backing rows
+        position = self.positions[str(key)]
+        return {"values": list(self.rows[position]), "tags": list(self.tags[position])}
+
+    def selection(self) -> tuple[str, ...]:
+        """
+            Returns the keys of the selected rows.
+
+            Returns:
+                tuple[str, ...]: the selected row keys.
+        """
+
+        # returns selected keys
+        return tuple(self.selected)
+
+    def selection_set(self, key: str) -> None:
+        """
+            Selects a row.
+
+            Args:
+                key (str): the key of the row.
+        """
+
+        # sets selection and updates rendered rows
+        self.selected = [str(key)]
+        self.render(self.first)
+
+    def selection_remove(self, keys: tuple[str, ...]) -> None:
+        """
+            Deselects rows.
+
+            Args:
+                keys (tuple[str, ...]): the keys of the rows.
+        """
+
+        # removes keys from selection and updates rendered rows
+        keys = {str(key) for key in keys}
+        self.selected = [key for key in self.selected if key not in keys]
+        self.render(self.first)
+
+    def identify_row(self, y: int) -> str:
+        """
+            Returns the key of the row at a y position.
+
+            Args:
+                y (int): the y position.
+
+            Returns:
+                str: the key of the row, or an empty string.
+        """
+
+        # identifies the rendered row
+        return self.tree.identify_row(y)
+
+    def bind(self, sequence: str, func: object) -> None:
+        """
+            Binds an event on the table.
+
+            Args:
+                sequence (str): the event sequence.
+                func (object): the event handler.
+        """
+
+        # binds the event on the treeview
+        self.tree.bind(sequence, func)
+
+    def tag_configure(self, tag: str, **options: object) -> None:
+        """
+            Configures the appearance of a tag.
+
+            Args:
+                tag (str): the tag name.
+                **options (object): the tag options.
+        """
+
+        # configures the tag on the treeview
+        self.tree.tag_configure(tag, **options)
+
+    def heading(self, column: str, **options: object) -> None:
+        """
+            Configures a column heading.
+
+            Args:
+                column (str): the column heading.
+                **options (object): the heading options.
+        """
+
+        # configures the heading on the treeview
+        self.tree.heading(column, **options)
+
+    def display_columns(self, columns: list[str]) -> None:
+        """
+            Shows only some columns, sharing the table width between them.
+
+            Args:
+                columns (list[str]): the column headings to show.
+        """
+
+        # shows the columns and resizes them to fill the table
+        self.tree.configure(displaycolumns=columns)
+        for column in columns:
+            self.tree.column(column, width=self.width // len(columns), minwidth=self.width // len(columns))
+
+    def focus_set(self) -> None:
+        """
+            Sets focus to the table.
+        """
+
+        # sets focus to the treeview
+        self.tree.focus_set()
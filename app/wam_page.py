@@ -6,8 +6,10 @@
 
 import tkinter as tk
 from tkinter import ttk, messagebox
-from data.wam import WAM
+from data.store import Store
+from data.events import ChangeEvent
 from utils.asset_manager import AssetManager
+from app.virtual_table import VirtualTable
 
 class WAMPage(tk.Frame):
     """
@@ -25,9 +27,13 @@ class WAMPage(tk.Frame):
 
         # initialises the frame and wam data
         super().__init__(root)
-        self.wam = WAM()
+        self.wam = Store.get_wam()
         self.main_window = main_window
 
+        # rebuilds the table on the next load after the data changes
+        self.dirty = True
+        self.wam.subscribe(self.on_change)
+
         # sets frame to hold table
         table_frame = tk.Frame(self, width=500, height=275)
         table_frame.pack()
@@ -47,13 +53,8 @@ class WAMPage(tk.Frame):
         self.columns = ["Unit #", "Year Level", "Mark", "Credit Points"]
         self.column_width = 120
 
-        # initialises table
-        self.table = ttk.Treeview(table_frame, columns=self.columns, show="headings", height=12)
-
-        # adds columns to the table
-        for column in self.columns:
-            self.table.heading(column, text=column)
-            self.table.column(column, anchor="center", width=self.column_width, minwidth=self.column_width, stretch=False)
+        # initialises table, only rendering the rows in view
+        self.table = VirtualTable(table_frame, self.columns, self.column_width, height=12, key_column=0)
 
         # binds keyboard and mouse actions
         self.table.bind("<Button-1>", self.select_row)
@@ -63,13 +64,8 @@ class WAMPage(tk.Frame):
         # add tag for current record
         self.table.tag_configure("current", background="whitesmoke")
 
-        # initialises scrollbar for the table
-        scrollbar = ttk.Scrollbar(table_frame, orient="vertical", command=self.table.yview)
-        self.table.configure(yscrollcommand=scrollbar.set)
-
-        # adds table and scrollbar to the frame
+        # adds table to the frame
         self.table.grid(row=0, column=0, sticky="nsew")
-        scrollbar.grid(row=0, column=1, sticky="ns")
 
         # sets frame to hold control buttons
         control_frame = tk.Frame(self)
@@ -78,6 +74,7 @@ class WAMPage(tk.Frame):
         # adds the control buttons
         tk.Button(control_frame, text="Add Unit", font=("Segoe UI", 10, "bold"), width=15, command=lambda: self.add_unit_form()).pack(side="left", expand=True, fill="both", padx=10)
         tk.Button(control_frame, text="Remove Unit", font=("Segoe UI", 10, "bold"), width=15, command=lambda: self.remove_unit()).pack(side="left", expand=True, fill="both", padx=10)
+        tk.Button(control_frame, text="Target WAM", font=("Segoe UI", 10, "bold"), width=15, command=lambda: self.target_wam_form()).pack(side="left", expand=True, fill="both", padx=10)
 
         # sets frame to hold results information
         results_frame = tk.Frame(self)
@@ -122,25 +119,31 @@ class WAMPage(tk.Frame):
         # stops default behaviour
         return "break"
 
-    def load_page(self) -> None:
+    def on_change(self, event: ChangeEvent) -> None:
         """
-            Loads page from data.
+            Marks the page for a rebuild when its data changes.
+
+            Args:
+                event (ChangeEvent): the change event.
         """
 
-        # resets wam data
-        self.wam.reset()
+        # marks the table as out of date
+        self.dirty = True
 
-        # clears current table
-        for row in self.table.get_children():
-            self.table.delete(row)
+    def load_page(self) -> None:
+        """
+            Loads page from data.
+        """
 
-        # adds units from wam record data to table
-        for unit in self.wam.get_record():
-            self.table.insert("", "end", values=unit, tags=("current",))
+        # keeps the current table if the data has not changed
+        if not self.dirty:
+            self.table.focus_set()
+            return
 
-        # adds units from wam extra data to table
-        for unit in self.wam.get_data():
-            self.table.insert("", "end", values=unit)
+        # updates table rows from wam record and extra data
+        record = self.wam.get_record()
+        data = self.wam.get_data()
+        self.table.set_rows(record + data, [("current",)] * len(record) + [()] * len(data))
 
         # set current and calculated wam
         self.current_wam_lbl.config(text=self.wam.get_current_wam())
@@ -151,6 +154,9 @@ class WAMPage(tk.Frame):
         if len(children) > 0:
             self.table.see(children[0])
 
+        # marks table as up to date
+        self.dirty = False
+
         # resets focus
         self.table.focus_set()
 
@@ -159,6 +165,10 @@ class WAMPage(tk.Frame):
             Creates the add unit form.
         """
 
+        # closes the target wam form if it is open
+        if self.main_window.entry_window is not None and self.main_window.entry_window.winfo_exists() and self.main_window.entry_window.title() == "Target WAM":
+            self.on_close_target_wam_form()
+
         # checks if add unit form already exists
         if self.main_window.entry_window is None or not self.main_window.entry_window.winfo_exists():
 
@@ -259,6 +269,111 @@ class WAMPage(tk.Frame):
         self.main_window.entry_window.destroy()
         self.main_window.entry_window = None
 
+    def target_wam_form(self) -> None:
+        """
+            Creates the target WAM form.
+        """
+
+        # closes form if it already exists
+        if self.main_window.entry_window is not None and self.main_window.entry_window.winfo_exists():
+            self.on_close_target_wam_form()
+
+        # creates the entry window
+        self.main_window.entry_window = tk.Toplevel(self)
+        self.main_window.entry_window.withdraw()
+
+        # sets close protocol
+        self.main_window.entry_window.protocol("WM_DELETE_WINDOW", self.on_close_target_wam_form)
+
+        # sets title and icon
+        self.main_window.entry_window.title("Target WAM")
+        self.main_window.entry_window.iconbitmap(AssetManager.get_asset("icon.ico"))
+
+        # sets the window dimensions
+        window_width = 400
+        window_height = 270
+
+        # gets the screen dimensions
+        screen_width = self.main_window.entry_window.winfo_screenwidth()
+        screen_height = self.main_window.entry_window.winfo_screenheight()
+
+        # calculates desired window position
+        x = (screen_width // 2) - (window_width // 2)
+        y = (screen_height // 2) - (window_height // 2) - 30
+
+        # sets window size and position and disables resizing
+        self.main_window.entry_window.geometry(f"{window_width}x{window_height}+{x}+{y}")
+        self.main_window.entry_window.resizable(False, False)
+
+        # adds title label
+        tk.Label(self.main_window.entry_window, text="Marks Needed for Units Without a Mark", font=("Segoe UI", 10, "bold")).pack(pady=10)
+
+        # creates and sets target wam frame, label, and slider
+        target_frame = tk.LabelFrame(self.main_window.entry_window, text="Target WAM", font=("Segoe UI", 10, "bold"))
+        target_frame.pack(pady=5)
+        self.target_wam = tk.Scale(target_frame, from_=50, to=100, resolution=0.5, orient="horizontal", length=300, font=("Segoe UI", 10), command=lambda value: self.solve_target(value))
+        self.target_wam.pack(padx=10, pady=5)
+
+        # adds minimum mark information label
+        mark_frame = tk.Frame(self.main_window.entry_window)
+        mark_frame.pack(pady=5)
+        tk.Label(mark_frame, text="Minimum Mark:", font=("Segoe UI", 10, "bold")).pack(side="left")
+        self.target_mark_lbl = tk.Label(mark_frame, text="-", font=("Segoe UI", 10))
+        self.target_mark_lbl.pack(side="left")
+
+        # adds marks of each unit information label
+        self.target_marks_lbl = tk.Label(self.main_window.entry_window, text="", font=("Segoe UI", 9), wraplength=360)
+        self.target_marks_lbl.pack(pady=5)
+
+        # adds close button
+        tk.Button(self.main_window.entry_window, text="Close", font=("Segoe UI", 10, "bold"), width=15, command=lambda: self.on_close_target_wam_form()).pack(pady=10)
+
+        # starts the slider at the calculated wam and solves for it
+        self.target_wam.set(min(max(float(self.wam.get_calculated_wam()), 50), 100))
+        self.solve_target(self.target_wam.get())
+
+        # shows form
+        self.main_window.entry_window.deiconify()
+
+        # sets focus on the slider
+        self.target_wam.focus_set()
+
+    def on_close_target_wam_form(self) -> None:
+        """
+            Closes the target WAM form.
+        """
+
+        # destroys window and sets pointer to none
+        self.main_window.entry_window.destroy()
+        self.main_window.entry_window = None
+
+    def solve_target(self, target: str) -> None:
+        """
+            Updates the target WAM form with the marks needed to reach a target.
+
+            Args:
+                target (str): the target WAM from the slider.
+        """
+
+        # checks if there are no units without a mark to plan for
+        if self.wam.planned_credits == 0:
+            self.target_mark_lbl.config(text="-")
+            self.target_marks_lbl.config(text="Add units without a mark to plan for.")
+            return
+
+        # solves for the uniform mark and the marks of each unit
+        mark, marks = self.wam.solve_target(target)
+
+        # checks if the target cannot be reached
+        if mark is None:
+            self.target_mark_lbl.config(text="-")
+            self.target_marks_lbl.config(text="Target WAM cannot be reached.")
+            return
+
+        # shows the uniform mark and the marks of each unit
+        self.target_mark_lbl.config(text=str(mark))
+        self.target_marks_lbl.config(text=", ".join(f"Unit {unit_no}: {unit_mark}" for unit_no, unit_mark in marks.items()))
+
     def add_unit(self) -> None:
         """
             Adds a unit to the WAM data.
@@ -307,7 +422,7 @@ class WAMPage(tk.Frame):
 
         # adds unit to the wam and table
         self.wam.add_unit([year_lvl, mark, credit_pts])
-        self.table.insert("", "end", values=self.wam.get_data()[-1])
+        self.table.append(self.wam.get_data()[-1])
 
         # scrolls table all the way down
         self.table.see(self.table.get_children()[-1])
@@ -321,6 +436,9 @@ class WAMPage(tk.Frame):
         # resets focus
         self.table.focus_set()
 
+        # marks table as up to date
+        self.dirty = False
+
         # displays success message to user
         messagebox.showinfo("Add Unit", f"Unit {len(self.wam.get_record()) + len(self.wam.get_data())} added.")
 
@@ -354,20 +472,16 @@ class WAMPage(tk.Frame):
         # updates calculated wam
         self.calculated_wam_lbl.config(text=self.wam.get_calculated_wam())
 
-        # clears current table
-        for row in self.table.get_children():
-            self.table.delete(row)
-
-        # adds units from wam record data to table
-        for unit in self.wam.get_record():
-            self.table.insert("", "end", values=unit, tags=("current",))
-
-        # adds units from wam extra data to table
-        for unit in self.wam.get_data():
-            self.table.insert("", "end", values=unit)
+        # updates table rows from wam record and extra data
+        record = self.wam.get_record()
+        data = self.wam.get_data()
+        self.table.set_rows(record + data, [("current",)] * len(record) + [()] * len(data))
 
         # resets focus
         self.table.focus_set()
 
+        # marks table as up to date
+        self.dirty = False
+
         # displays success message to user
         messagebox.showinfo("Remove Unit", f"Unit {unit_no} removed.")
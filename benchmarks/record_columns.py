@@ -0,0 +1,48 @@
+"""
+    record_columns.py
+
+    Measures the bytes per record unit of string rows, parsed rows and record columns.
+
+    Usage:
+        python -m benchmarks.record_columns [STUDENTS] [UNITS]
+"""
+
+import sys
+import random
+from core.rows import RecordRow
+from core.columns import RecordColumns
+from benchmarks.rows import measure_memory
+
+def main() -> None:
+    """
+        Runs the benchmark and prints the results.
+    """
+
+    # sets the cohort size and generates each student's record file lines
+    students = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    units = int(sys.argv[2]) if len(sys.argv) > 2 else 24
+    random.seed(0)
+    grades = [("HD", 80, 100), ("D", 70, 79), ("C", 60, 69), ("P", 50, 59), ("N", 0, 49), ("WDN", None, None)]
+    unit_codes = [f"{prefix}{random.randint(1, 4)}{number:03d}" for prefix in ("FIT", "MTH", "ENG", "BUS") for number in range(125)]
+    cohort = []
+    for _ in range(students):
+        lines = []
+        for unit_code in random.choices(unit_codes, k=units):
+            grade, low, high = random.choice(grades)
+            lines.append(f"{unit_code},{'-' if low is None else random.randint(low, high)},{grade},{random.choice([6, 12])}")
+        cohort.append(lines)
+    count = students * units
+
+    # measures memory of each representation read from the file lines
+    _, string_bytes = measure_memory(lambda: [[line.split(",") for line in lines] for lines in cohort])
+    _, row_bytes = measure_memory(lambda: [[RecordRow.from_row(line.split(",")) for line in lines] for lines in cohort])
+    _, column_bytes = measure_memory(lambda: [RecordColumns.from_rows(line.split(",") for line in lines) for lines in cohort])
+
+    # prints results
+    print(f"{students} students x {units} units")
+    print(f"string rows:    {string_bytes / count:6.1f} bytes/unit")
+    print(f"parsed rows:    {row_bytes / count:6.1f} bytes/unit")
+    print(f"record columns: {column_bytes / count:6.1f} bytes/unit")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,128 @@
+"""
+    rows.py
+
+    Measures the memory and recompute time of parsed rows against string rows.
+
+    Usage:
+        python -m benchmarks.rows [ROWS]
+"""
+
+import sys
+import random
+import timeit
+import tracemalloc
+from collections.abc import Callable
+from core.grades import Grades
+from core.assessments import Assessments
+from core.rows import RecordRow, AssessmentRow
+
+def measure_memory(build: Callable[[], list]) -> tuple[list, int]:
+    """
+        Measures the memory allocated while building rows.
+
+        Args:
+            build (Callable[[], list]): builds and returns the rows.
+
+        Returns:
+            tuple[list, int]: the rows and the bytes allocated.
+    """
+
+    # traces allocations while building the rows
+    tracemalloc.start()
+    rows = build()
+    allocated, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return rows, allocated
+
+def get_string_record_totals(data: list[list[str]]) -> tuple[int, int, int, int]:
+    """
+        Calculates record totals by parsing string rows on every use, as before parsed rows.
+
+        Args:
+            data (list[list[str]]): the record units.
+
+        Returns:
+            tuple[int, int, int, int]: the weighted marks, weighted credits, grade points and graded credits.
+    """
+
+    # initialises the totals
+    totals = [0, 0, 0, 0]
+
+    # parses and adds each unit
+    for unit_code, mark, grade, credit_pts in data:
+        if mark != "-":
+            weight = 1 if unit_code[3] == "1" else 2
+            totals[0] += int(mark) * int(credit_pts) * weight
+            totals[1] += int(credit_pts) * weight
+        if grade in Grades.GRADE_POINTS:
+            totals[2] += Grades.GRADE_POINTS[grade] * int(credit_pts)
+            totals[3] += int(credit_pts)
+
+    # returns the totals
+    return tuple(totals)
+
+def get_string_assessment_totals(assessments: list[list[str]]) -> tuple[float, float]:
+    """
+        Calculates assessment totals by parsing string rows on every use, as before parsed rows.
+
+        Args:
+            assessments (list[list[str]]): the assessments of a unit.
+
+        Returns:
+            tuple[float, float]: the total weighted mark and total weight.
+    """
+
+    # initialises mark and weight totals
+    total_mark = 0
+    total_weight = 0
+
+    # parses and adds each assessment
+    for _, weight, score, total in assessments:
+        total_mark += float(weight) * (float(score) / float(total))
+        total_weight += float(weight)
+
+    # returns totals
+    return total_mark, total_weight
+
+def main() -> None:
+    """
+        Runs the benchmark and prints the results.
+    """
+
+    # sets the number of rows and generates file rows
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    random.seed(0)
+    grades = [("HD", 80, 100), ("D", 70, 79), ("C", 60, 69), ("P", 50, 59), ("N", 0, 49)]
+    record = []
+    for index in range(count):
+        grade, low, high = random.choice(grades)
+        record.append([f"FIT{random.randint(1, 4)}{index % 1000:03d}", str(random.randint(low, high)), grade, random.choice(["6", "12"])])
+    assessments = [[f"Assessment {index}", f"{random.choice([5, 10, 20, 25]):.2f}", str(float(random.randint(0, 20))), "20.0"] for index in range(count)]
+
+    # converts rows into file lines
+    record_lines = [",".join(row) for row in record]
+    assessment_lines = [",".join(row) for row in assessments]
+
+    # measures memory of string rows and parsed rows read from the file lines
+    string_record, string_record_bytes = measure_memory(lambda: [line.split(",") for line in record_lines])
+    parsed_record, parsed_record_bytes = measure_memory(lambda: [RecordRow.from_row(line.split(",")) for line in record_lines])
+    string_assessments, string_assessment_bytes = measure_memory(lambda: [line.split(",") for line in assessment_lines])
+    parsed_assessments, parsed_assessment_bytes = measure_memory(lambda: [AssessmentRow.from_row(line.split(",")) for line in assessment_lines])
+
+    # checks both representations give the same totals
+    assert get_string_record_totals(string_record) == Grades.get_record_totals(parsed_record)
+    assert get_string_assessment_totals(string_assessments) == Assessments.get_totals(parsed_assessments)
+
+    # times a recompute over each representation
+    string_record_time = min(timeit.repeat(lambda: get_string_record_totals(string_record), number=1, repeat=5))
+    parsed_record_time = min(timeit.repeat(lambda: Grades.get_record_totals(parsed_record), number=1, repeat=5))
+    string_assessment_time = min(timeit.repeat(lambda: get_string_assessment_totals(string_assessments), number=1, repeat=5))
+    parsed_assessment_time = min(timeit.repeat(lambda: Assessments.get_totals(parsed_assessments), number=1, repeat=5))
+
+    # prints results
+    print(f"{count} rows")
+    print(f"record rows:     {string_record_bytes / count:6.1f} -> {parsed_record_bytes / count:6.1f} bytes/row, recompute {string_record_time * 1000:7.2f} -> {parsed_record_time * 1000:7.2f} ms")
+    print(f"assessment rows: {string_assessment_bytes / count:6.1f} -> {parsed_assessment_bytes / count:6.1f} bytes/row, recompute {string_assessment_time * 1000:7.2f} -> {parsed_assessment_time * 1000:7.2f} ms")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,251 @@
+"""
+    cli.py
+
+    Runs the command-line interface.
+
+    Usage:
+        python -m cli wam [--data-dir PATH] [--format csv|json] [--stdin]
+        python -m cli gpa
+        python -m cli calculated-wam
+        python -m cli calculated-gpa
+        python -m cli overview [--target MARK]
+        python -m cli avg-required UNIT_CODE [--target MARK]
+        python -m cli batch COHORT_DIR OUTPUT [--workers N] [--chunk-size N]
+        python -m cli migrate text|bundle|sqlite [--data-dir PATH]
+
+    With --stdin, the profile is read from standard input instead of the data
+    directory. Each input line is a filename followed by one row of that
+    file, for example "record,FIT1045,85,HD,6", "wam,3,80,6",
+    "target,Grade,D" or "FIT2004,Assignment 1,20,18,20".
+"""
+
+import os
+import sys
+import csv
+import json
+import time
+import sqlite3
+from argparse import ArgumentParser, Namespace
+from core.profile import Profile
+from utils.file_manager import FileManager
+from utils.memory_backend import MemoryBackend
+
+def get_parser() -> ArgumentParser:
+    """
+        Builds the command-line argument parser.
+
+        Returns:
+            ArgumentParser: the argument parser.
+    """
+
+    # sets options shared by every command
+    common = ArgumentParser(add_help=False)
+    common.add_argument("--data-dir", default=FileManager.folder, help="data folder, SQLite database or bundle file to read (default: %(default)s)")
+    common.add_argument("--format", choices=["csv", "json"], default="csv", help="output format (default: %(default)s)")
+    common.add_argument("--stdin", action="store_true", help="read the profile from rows on standard input")
+
+    # initialises parser and commands
+    parser = ArgumentParser(prog="python -m cli", description="Calculates WAM, GPA and unit overviews without opening the application.")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    # adds wam and gpa commands
+    commands.add_parser("wam", parents=[common], help="WAM of the academic record")
+    commands.add_parser("gpa", parents=[common], help="GPA of the academic record")
+    commands.add_parser("calculated-wam", parents=[common], help="WAM of the academic record with extra WAM units")
+    commands.add_parser("calculated-gpa", parents=[common], help="GPA of the academic record with extra GPA units")
+
+    # adds overview command
+    overview = commands.add_parser("overview", parents=[common], help="overview of every unit")
+    overview.add_argument("--target", type=int, help="target mark (default: the saved target)")
+
+    # adds average required command
+    avg_required = commands.add_parser("avg-required", parents=[common], help="average required on a unit's remaining assessments")
+    avg_required.add_argument("unit_code", help="unit code of the unit")
+    avg_required.add_argument("--target", type=int, help="target mark (default: the saved target)")
+
+    # adds cohort batch command
+    batch = commands.add_parser("batch", help="results of every student profile in a cohort folder, as JSON lines")
+    batch.add_argument("cohort_dir", help="folder holding one data folder, SQLite database or bundle file per student")
+    batch.add_argument("output", help="JSON lines file to write results to")
+    batch.add_argument("--workers", type=int, help="number of worker processes (default: one per core)")
+    batch.add_argument("--chunk-size", type=int, default=64, help="number of profiles in each task (default: %(default)s)")
+
+    # adds storage format migration command
+    migrate = commands.add_parser("migrate", help="convert the data folder to another storage format")
+    migrate.add_argument("format", choices=["text", "bundle", "sqlite"], help="storage format to convert to")
+    migrate.add_argument("--data-dir", default=FileManager.folder, help="data folder to convert (default: %(default)s)")
+
+    # returns parser
+    return parser
+
+def read_stdin_backend() -> MemoryBackend:
+    """
+        Reads a profile from rows on standard input.
+
+        Returns:
+            MemoryBackend: the backend holding the rows of each file.
+    """
+
+    # initialises files dictionary
+    files = {}
+
+    # adds each row to the file named by its first field
+    for line in sys.stdin:
+        line = line.strip()
+        if line:
+            filename, *row = line.split(",")
+            files.setdefault(filename, []).append(row)
+
+    # returns backend holding the files
+    return MemoryBackend(files)
+
+def write_rows(header: list[str], rows: list[list[str]], format: str, single: bool = False) -> None:
+    """
+        Writes result rows to standard output.
+
+        Args:
+            header (list[str]): the column names.
+            rows (list[list[str]]): the result rows.
+            format (str): the output format, either "csv" or "json".
+            single (bool): whether the result is a single row written as one JSON object.
+    """
+
+    # writes json objects
+    if format == "json":
+        objects = [dict(zip(header, row)) for row in rows]
+        json.dump(objects[0] if single else objects, sys.stdout)
+        sys.stdout.write("\n")
+
+    # writes csv with a header row
+    else:
+        writer = csv.writer(sys.stdout, lineterminator="\n")
+        writer.writerow(header)
+        writer.writerows(rows)
+
+def main(argv: list[str] | None = None) -> int:
+    """
+        Runs a command.
+
+        Args:
+            argv (list[str] | None): the command-line arguments, or None to use sys.argv.
+
+        Returns:
+            int: the exit status.
+    """
+
+    # parses arguments
+    parser = get_parser()
+    args = parser.parse_args(argv)
+
+    # runs a cohort batch
+    if args.command == "batch":
+        run_batch(parser, args)
+        return 0
+
+    # converts the data folder
+    if args.command == "migrate":
+        run_migrate(parser, args)
+        return 0
+
+    # checks that the data path exists
+    if not args.stdin and not os.path.exists(args.data_dir):
+        parser.error(f"data path not found: {args.data_dir}")
+
+    # loads the profile and runs the command, reporting unreadable profiles as errors
+    try:
+        profile = Profile(read_stdin_backend()) if args.stdin else Profile.from_path(args.data_dir)
+        run_command(parser, args, profile)
+    except (ValueError, sqlite3.Error) as error:
+        parser.error(str(error))
+    return 0
+
+def run_command(parser: ArgumentParser, args: Namespace, profile: Profile) -> None:
+    """
+        Calculates and writes the result of a command.
+
+        Args:
+            parser (ArgumentParser): the argument parser, used to report errors.
+            args (Namespace): the parsed arguments.
+            profile (Profile): the profile to calculate from.
+    """
+
+    # writes record and calculated results
+    match args.command:
+        case "wam":
+            write_rows(["wam"], [[profile.get_wam()]], args.format, single=True)
+        case "gpa":
+            write_rows(["gpa"], [[profile.get_gpa()]], args.format, single=True)
+        case "calculated-wam":
+            write_rows(["wam"], [[profile.get_calculated_wam()]], args.format, single=True)
+        case "calculated-gpa":
+            write_rows(["gpa"], [[profile.get_calculated_gpa()]], args.format, single=True)
+
+        # writes unit overview
+        case "overview":
+            write_rows(["unit_code", "mark_grade", "remaining", "average_required"], profile.get_overview(args.target), args.format)
+
+        # writes average required for a unit
+        case "avg-required":
+            unit_code = args.unit_code.upper()
+            if unit_code not in profile.units:
+                parser.error(f"unit not found: {unit_code}")
+            write_rows(["unit_code", "average_required"], [[unit_code, profile.get_average_required(unit_code, args.target)]], args.format, single=True)
+
+def run_batch(parser: ArgumentParser, args: Namespace) -> None:
+    """
+        Calculates the results of every profile in a cohort folder and reports worker throughput.
+
+        Args:
+            parser (ArgumentParser): the argument parser, used to report errors.
+            args (Namespace): the parsed arguments.
+    """
+
+    # checks that the cohort folder exists
+    if not os.path.isdir(args.cohort_dir):
+        parser.error(f"cohort folder not found: {args.cohort_dir}")
+
+    # loads the batch engine only for batch runs, as it pulls in the multiprocessing modules
+    from core.batch import CohortBatch
+
+    # lists student data paths lazily
+    paths = (entry.path for entry in os.scandir(args.cohort_dir) if not entry.name.startswith("."))
+
+    # runs the batch and reports throughput
+    batch = CohortBatch(workers=args.workers, chunk_size=args.chunk_size)
+    start = time.perf_counter()
+    written = batch.run(paths, args.output)
+    elapsed = time.perf_counter() - start
+    for line in batch.get_report():
+        print(line, file=sys.stderr)
+    print(f"total: {written} profiles in {elapsed:.2f}s ({written / elapsed if elapsed else 0:.0f}/s)", file=sys.stderr)
+
+def run_migrate(parser: ArgumentParser, args: Namespace) -> None:
+    """
+        Converts the data folder to another storage format.
+
+        Args:
+            parser (ArgumentParser): the argument parser, used to report errors.
+            args (Namespace): the parsed arguments.
+    """
+
+    # checks that the data folder exists and is not already in the format
+    if not os.path.isdir(args.data_dir):
+        parser.error(f"data folder not found: {args.data_dir}")
+    if FileManager.get_format(args.data_dir) == args.format:
+        parser.error(f"data folder already uses the {args.format} format: {args.data_dir}")
+
+    # converts the folder, reporting data that cannot be read
+    try:
+        current = FileManager.migrate_folder(args.data_dir, args.format)
+    except (ValueError, sqlite3.Error) as error:
+        parser.error(str(error))
+    print(f"converted {args.data_dir} from {current} to {args.format}", file=sys.stderr)
+
+if __name__ == "__main__":
+
+    # runs the command, exiting quietly if the reader of the output closes early
+    try:
+        sys.exit(main())
+    except BrokenPipeError:
+        os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+        sys.exit(1)
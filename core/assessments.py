@@ -0,0 +1,201 @@
+"""
+    assessments.py
+
+    Contains the assessments helper class.
+"""
+
+from core.rows import AssessmentRow
+
+class Assessments:
+    """
+        Calculates unit marks and required averages from assessment rows.
+    """
+
+    # minimum marks of each target grade
+    TARGET_MARKS = {"P": 50, "C": 60, "D": 70, "HD": 80}
+
+    # target marks that can be set
+    SWEEP_MARKS = range(50, 101)
+
+    @classmethod
+    def get_target_mark(cls, target_type: str, target: str) -> int:
+        """
+            Converts a target into the mark it requires.
+
+            Args:
+                target_type (str): the target type, either "Grade" or "Mark".
+                target (str): the target grade or mark.
+
+            Returns:
+                int: the target mark.
+        """
+
+        # returns the minimum mark of a target grade
+        if target_type == "Grade":
+            return cls.TARGET_MARKS[target]
+
+        # returns a target mark
+        return int(target)
+
+    @staticmethod
+    def get_totals(assessments: list[AssessmentRow]) -> tuple[float, float]:
+        """
+            Calculates the weighted mark and weight of a unit's assessments.
+
+            Args:
+                assessments (list[AssessmentRow]): the assessments of the unit.
+
+            Returns:
+                tuple[float, float]: the total weighted mark and total weight.
+        """
+
+        # initialises mark and weight totals
+        total_mark = 0
+        total_weight = 0
+
+        # iterates through each assessment
+        for assessment in assessments:
+
+            # adds mark and weight of assessment to totals
+            total_mark += assessment.weight * (assessment.score / assessment.total)
+            total_weight += assessment.weight
+
+        # returns totals
+        return total_mark, total_weight
+
+    @staticmethod
+    def get_mark_grade(total_mark: float, total_weight: float) -> str:
+        """
+            Formats the mark and grade of a unit so far.
+
+            Args:
+                total_mark (float): the total weighted mark.
+                total_weight (float): the total weight.
+
+            Returns:
+                str: the mark and grade, or "-" if there are no assessments.
+        """
+
+        # checks if no assessments are in data
+        if total_weight <= 0:
+            return "-"
+
+        # calculates mark
+        mark = round(total_mark * 100 / total_weight)
+
+        # calculates grade
+        if mark < 50:
+            grade = "N"
+        elif mark < 60:
+            grade = "P"
+        elif mark < 70:
+            grade = "C"
+        elif mark < 80:
+            grade = "D"
+        else:
+            grade = "HD"
+
+        # returns mark/grade string
+        return f"{mark} ({grade})"
+
+    @staticmethod
+    def get_average_required(total_mark: float, total_weight: float, target_mark: int) -> str:
+        """
+            Calculates the average needed on the remaining assessments to reach a target.
+
+            Args:
+                total_mark (float): the total weighted mark.
+                total_weight (float): the total weight.
+                target_mark (int): the target mark.
+
+            Returns:
+                str: the average required, or "-" if the target cannot be reached.
+        """
+
+        # calculates average required
+        if total_weight < 100:
+            avg_req = (target_mark - total_mark) * 100 / (100 - total_weight)
+        else:
+            avg_req = -1
+
+        # checks if average required is feasible
+        if avg_req < 0 or avg_req > 100:
+            return "-"
+
+        # returns average required string
+        return f"{avg_req:.2f}"
+
+    @classmethod
+    def get_average_required_sweep(cls, total_mark: float, total_weight: float) -> list[float | None]:
+        """
+            Calculates the average required for every target mark that can be set.
+
+            Args:
+                total_mark (float): the total weighted mark.
+                total_weight (float): the total weight.
+
+            Returns:
+                list[float | None]: the average required for each mark in SWEEP_MARKS, or None where the target cannot be reached.
+        """
+
+        # checks if no weight remains
+        if total_weight >= 100:
+            return [None] * len(cls.SWEEP_MARKS)
+
+        # calculates the average required for each target mark with the same arithmetic as a single target
+        remaining = 100 - total_weight
+        averages = [(target_mark - total_mark) * 100 / remaining for target_mark in cls.SWEEP_MARKS]
+        return [average if 0 <= average <= 100 else None for average in averages]
+
+    @staticmethod
+    def format_average_required(average: float | None) -> str:
+        """
+            Formats an average required from a sweep.
+
+            Args:
+                average (float | None): the average required, or None if the target cannot be reached.
+
+            Returns:
+                str: the average required, or "-" if the target cannot be reached.
+        """
+
+        # returns average required string
+        return "-" if average is None else f"{average:.2f}"
+
+    @classmethod
+    def get_overview_row(cls, unit_code: str, total_mark: float, total_weight: float, target_mark: int) -> list[str]:
+        """
+            Gets the overview of a unit from its assessment totals.
+
+            Args:
+                unit_code (str): the unit code of the unit.
+                total_mark (float): the total weighted mark.
+                total_weight (float): the total weight.
+                target_mark (int): the target mark.
+
+            Returns:
+                list[str]: the unit code, mark and grade, remaining weight and average required.
+        """
+
+        # returns unit overview
+        return [unit_code, cls.get_mark_grade(total_mark, total_weight), f"{100 - total_weight:.2f}", cls.get_average_required(total_mark, total_weight, target_mark)]
+
+    @classmethod
+    def get_unit_overview(cls, unit_code: str, assessments: list[AssessmentRow], target_mark: int) -> list[str]:
+        """
+            Gets the overview of a unit.
+
+            Args:
+                unit_code (str): the unit code of the unit.
+                assessments (list[AssessmentRow]): the assessments of the unit.
+                target_mark (int): the target mark.
+
+            Returns:
+                list[str]: the unit code, mark and grade, remaining weight and average required.
+        """
+
+        # gets the assessment totals
+        total_mark, total_weight = cls.get_totals(assessments)
+
+        # returns unit overview
+        return cls.get_overview_row(unit_code, total_mark, total_weight, target_mark)
@@ -0,0 +1,177 @@
+"""
+    batch.py
+
+    Contains the cohort batch class.
+"""
+
+import os
+import json
+import time
+from itertools import islice
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ProcessPoolExecutor, Future, wait, FIRST_COMPLETED
+from core.profile import Profile
+
+class CohortBatch:
+    """
+        Calculates the results of many student profiles in worker processes.
+
+        Data paths are grouped into chunks so each task amortises the cost of
+        passing work between processes, and at most a fixed number of chunks
+        are in flight at once so memory stays bounded however large the
+        cohort is. Each student's result is written to the output file as a
+        JSON line as soon as its chunk finishes.
+    """
+
+    def __init__(self, workers: int | None = None, chunk_size: int = 64, max_pending: int | None = None) -> None:
+        """
+            Initialises the batch settings.
+
+            Args:
+                workers (int | None): the number of worker processes, or None for one per core.
+                chunk_size (int): the number of profiles in each task.
+                max_pending (int | None): the number of tasks in flight at once, or None for two per worker.
+        """
+
+        # sets worker, chunk and in-flight limits
+        self.workers = workers or os.cpu_count() or 1
+        self.chunk_size = chunk_size
+        self.max_pending = max_pending or self.workers * 2
+
+        # initialises profiles and busy time of each worker process
+        self.stats = {}
+
+    @staticmethod
+    def get_result(path: str) -> dict[str, object]:
+        """
+            Calculates the results of one student profile.
+
+            Args:
+                path (str): the data folder, SQLite database or bundle file of the student.
+
+            Returns:
+                dict[str, object]: the WAM, GPA and unit overview of the student, or the error raised.
+        """
+
+        # reads the profile and calculates the results
+        try:
+            profile = Profile.from_path(path)
+            return {
+                "path": path,
+                "wam": profile.get_wam(),
+                "gpa": profile.get_gpa(),
+                "calculated_wam": profile.get_calculated_wam(),
+                "calculated_gpa": profile.get_calculated_gpa(),
+                "overview": profile.get_overview()
+            }
+
+        # reports profiles that cannot be read without stopping the batch
+        except Exception as error:
+            return {"path": path, "error": f"{type(error).__name__}: {error}"}
+
+    @classmethod
+    def run_chunk(cls, paths: list[str]) -> tuple[int, float, list[dict[str, object]]]:
+        """
+            Calculates the results of a chunk of profiles in a worker process.
+
+            Args:
+                paths (list[str]): the data paths of the students.
+
+            Returns:
+                tuple[int, float, list[dict[str, object]]]: the worker process id, the time taken and the results.
+        """
+
+        # calculates the results of each profile and times the chunk
+        start = time.perf_counter()
+        results = [cls.get_result(path) for path in paths]
+        return os.getpid(), time.perf_counter() - start, results
+
+    def run(self, paths: Iterable[str], output_path: str) -> int:
+        """
+            Calculates the results of every profile and writes them to a file.
+
+            Args:
+                paths (Iterable[str]): the data paths of the students, read lazily.
+                output_path (str): the path of the JSON lines output file.
+
+            Returns:
+                int: the number of profiles written.
+        """
+
+        # initialises chunks, pending tasks and written count
+        chunks = self.get_chunks(paths)
+        pending = set()
+        written = 0
+        self.stats = {}
+
+        # opens output file and worker processes
+        with open(output_path, "w") as file, ProcessPoolExecutor(max_workers=self.workers) as executor:
+
+            # keeps submitting chunks until all are done
+            while True:
+
+                # fills the pending tasks up to the in-flight limit
+                for chunk in islice(chunks, self.max_pending - len(pending)):
+                    pending.add(executor.submit(self.run_chunk, chunk))
+
+                # stops once there is no work left
+                if not pending:
+                    break
+
+                # writes the results of each finished task
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    written += self.write_results(file, future)
+
+        # returns the number of profiles written
+        return written
+
+    def get_chunks(self, paths: Iterable[str]) -> Iterator[list[str]]:
+        """
+            Groups data paths into chunks.
+
+            Args:
+                paths (Iterable[str]): the data paths of the students.
+
+            Returns:
+                Iterator[list[str]]: the chunks of data paths.
+        """
+
+        # yields chunks until the paths run out
+        paths = iter(paths)
+        while chunk := list(islice(paths, self.chunk_size)):
+            yield chunk
+
+    def write_results(self, file: object, future: Future) -> int:
+        """
+            Writes the results of a finished task and records its worker's throughput.
+
+            Args:
+                file (object): the output file.
+                future (Future): the finished task.
+
+            Returns:
+                int: the number of results written.
+        """
+
+        # gets the results of the task
+        pid, elapsed, results = future.result()
+
+        # adds the task to the worker's profile count and busy time
+        profiles, seconds = self.stats.get(pid, (0, 0.0))
+        self.stats[pid] = (profiles + len(results), seconds + elapsed)
+
+        # writes one json line per student
+        file.writelines(json.dumps(result) + "\n" for result in results)
+        return len(results)
+
+    def get_report(self) -> list[str]:
+        """
+            Returns the throughput of each worker process in the last run.
+
+            Returns:
+                list[str]: one line per worker with its profile count, busy time and profiles per second.
+        """
+
+        # formats the throughput of each worker
+        return [f"worker {pid}: {profiles} profiles in {seconds:.2f}s ({profiles / seconds if seconds else 0:.0f}/s)" for pid, (profiles, seconds) in sorted(self.stats.items())]
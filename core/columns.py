@@ -0,0 +1,186 @@
+"""
+    columns.py
+
+    Contains the record columns class.
+"""
+
+import sys
+from array import array
+from collections.abc import Iterator
+from core.rows import RecordRow
+
+class RecordColumns:
+    """
+        Stores record units column by column in compact arrays.
+
+        Marks are kept in an unsigned short array with a sentinel for units
+        without a mark, credit points, grade codes and year levels in byte
+        arrays, and unit codes as interned strings shared with every other
+        record in the process. Units are read and written as RecordRow
+        objects, so the columns can be used wherever a list of rows is.
+        Units with an unknown grade, or a mark or credit points that do not
+        fit their column, are rejected with a ValueError.
+    """
+
+    # mark used for units without a mark
+    NO_MARK = 0xFFFF
+
+    # largest mark and credit points that can be stored
+    MAX_MARK = 100
+    MAX_CREDIT_PTS = 0xFF
+
+    # grades that can be stored, indexed by grade code
+    GRADES = ("WN", "WDN", "SFR", "PGO", "NSR", "NH", "NGO", "NE", "NAS", "N", "P", "C", "D", "HD")
+    GRADE_CODES = {grade: code for code, grade in enumerate(GRADES)}
+
+    def __init__(self) -> None:
+        """
+            Initialises empty columns.
+        """
+
+        # initialises columns
+        self.unit_codes = []
+        self.marks = array("H")
+        self.credit_pts = array("B")
+        self.grade_codes = array("B")
+        self.year_lvls = array("B")
+
+    @classmethod
+    def from_rows(cls, rows: list[list[str]]) -> "RecordColumns":
+        """
+            Builds columns from file rows.
+
+            Args:
+                rows (list[list[str]]): the unit code, mark or "-", grade and credit points of each unit.
+
+            Returns:
+                RecordColumns: the columns.
+        """
+
+        # parses each row into the columns
+        columns = cls()
+        for row in rows:
+            columns.append(RecordRow.from_row(row))
+        return columns
+
+    @classmethod
+    def get_grade_code(cls, grade: str) -> int:
+        """
+            Returns the code of a grade.
+
+            Args:
+                grade (str): the grade.
+
+            Returns:
+                int: the grade code.
+        """
+
+        # checks if the grade is unknown
+        if grade not in cls.GRADE_CODES:
+            raise ValueError(f"unknown grade {grade!r}")
+
+        # returns the grade code
+        return cls.GRADE_CODES[grade]
+
+    @classmethod
+    def check_unit(cls, unit: RecordRow) -> None:
+        """
+            Checks that a unit fits in the columns.
+
+            Args:
+                unit (RecordRow): the unit to check.
+        """
+
+        # checks the grade is known and the mark and credit points are in range
+        if unit.grade not in cls.GRADE_CODES:
+            raise ValueError(f"{unit.unit_code}: unknown grade {unit.grade!r}")
+        if unit.mark is not None and not 0 <= unit.mark <= cls.MAX_MARK:
+            raise ValueError(f"{unit.unit_code}: mark {unit.mark} is not between 0 and {cls.MAX_MARK}")
+        if not 0 <= unit.credit_pts <= cls.MAX_CREDIT_PTS:
+            raise ValueError(f"{unit.unit_code}: credit points {unit.credit_pts} are not between 0 and {cls.MAX_CREDIT_PTS}")
+
+    def append(self, unit: RecordRow) -> None:
+        """
+            Adds a unit to the end of the columns.
+
+            Args:
+                unit (RecordRow): the unit to add.
+        """
+
+        # checks the unit fits before changing any column
+        self.check_unit(unit)
+        grade_code = self.get_grade_code(unit.grade)
+
+        # appends each field to its column
+        self.unit_codes.append(sys.intern(unit.unit_code))
+        self.marks.append(self.NO_MARK if unit.mark is None else unit.mark)
+        self.credit_pts.append(unit.credit_pts)
+        self.grade_codes.append(grade_code)
+        self.year_lvls.append(unit.year_lvl)
+
+    def pop(self, index: int) -> RecordRow:
+        """
+            Removes a unit from the columns.
+
+            Args:
+                index (int): the index of the unit.
+
+            Returns:
+                RecordRow: the removed unit.
+        """
+
+        # gets the unit and removes it from every column
+        unit = self[index]
+        for column in (self.unit_codes, self.marks, self.credit_pts, self.grade_codes, self.year_lvls):
+            column.pop(index)
+        return unit
+
+    def __len__(self) -> int:
+        """
+            Returns the number of units.
+
+            Returns:
+                int: the number of units.
+        """
+
+        # returns the length of the columns
+        return len(self.unit_codes)
+
+    def __getitem__(self, index: int) -> RecordRow:
+        """
+            Returns a unit as a row.
+
+            Args:
+                index (int): the index of the unit.
+
+            Returns:
+                RecordRow: the unit.
+        """
+
+        # builds the row from each column
+        mark = self.marks[index]
+        return RecordRow(self.unit_codes[index], None if mark == self.NO_MARK else mark, self.GRADES[self.grade_codes[index]], self.credit_pts[index])
+
+    def __iter__(self) -> Iterator[RecordRow]:
+        """
+            Iterates through the units as rows.
+
+            Returns:
+                Iterator[RecordRow]: the units.
+        """
+
+        # yields a row for each unit
+        for index in range(len(self.unit_codes)):
+            yield self[index]
+
+    def to_rows(self) -> list[list[str]]:
+        """
+            Converts the units into file rows.
+
+            Returns:
+                list[list[str]]: the unit code, mark or "-", grade and credit points of each unit.
+        """
+
+        # formats each unit straight from the columns
+        return [[unit_code, "-" if mark == self.NO_MARK else str(mark), self.GRADES[grade_code], str(credit_pts)]
+                for unit_code, mark, grade_code, credit_pts in zip(self.unit_codes, self.marks, self.grade_codes, self.credit_pts)]
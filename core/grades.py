@@ -0,0 +1,440 @@
+"""
+    grades.py
+
+    Contains the grades helper class.
+"""
+
+from math import ceil
+from fractions import Fraction
+from core.rows import RecordRow, WAMRow, GPARow
+from core.assessments import Assessments
+
+class Grades:
+    """
+        Converts units into the exact integer totals used for WAM and GPA.
+
+        WAM totals are kept in half weights (level 1 units count 1, all
+        other units count 2) and GPA totals are kept in tenths of a grade
+        point, so totals can be added to and subtracted from without any
+        floating point drift.
+    """
+
+    # grade values in tenths of a grade point
+    GRADE_POINTS = {"WN": 0, "NH": 3, "N": 3, "P": 10, "C": 20, "D": 30, "HD": 40}
+
+    @classmethod
+    def get_unit_totals(cls, unit: RecordRow) -> tuple[int, int, int, int]:
+        """
+            Calculates the contribution of a record unit to the totals.
+
+            Args:
+                unit (RecordRow): the record unit.
+
+            Returns:
+                tuple[int, int, int, int]: the weighted marks, weighted credits, grade points and graded credits.
+        """
+
+        # returns the wam and gpa contributions of the unit
+        return cls.get_wam_totals(unit.year_lvl, unit.mark, unit.credit_pts) + cls.get_gpa_totals(unit.grade, unit.credit_pts)
+
+    @staticmethod
+    def get_wam_totals(year_lvl: int, mark: int | None, credit_pts: int) -> tuple[int, int]:
+        """
+            Calculates the contribution of a unit to the WAM totals.
+
+            Args:
+                year_lvl (int): the year level of the unit.
+                mark (int | None): the mark of the unit, or None if there is none.
+                credit_pts (int): the credit points of the unit.
+
+            Returns:
+                tuple[int, int]: the weighted marks and weighted credits.
+        """
+
+        # checks if there are no marks
+        if mark is None:
+            return 0, 0
+
+        # gets weighting of unit in half weights
+        weight = 1 if year_lvl == 1 else 2
+
+        # returns unit weighted marks and credits
+        return mark * credit_pts * weight, credit_pts * weight
+
+    @classmethod
+    def get_gpa_totals(cls, grade: str, credit_pts: int) -> tuple[int, int]:
+        """
+            Calculates the contribution of a unit to the GPA totals.
+
+            Args:
+                grade (str): the grade of the unit.
+                credit_pts (int): the credit points of the unit.
+
+            Returns:
+                tuple[int, int]: the grade points and graded credits.
+        """
+
+        # checks if the grade has no value
+        if grade not in cls.GRADE_POINTS:
+            return 0, 0
+
+        # returns unit grade points and credits
+        return cls.GRADE_POINTS[grade] * credit_pts, credit_pts
+
+    @staticmethod
+    def get_grade(mark: int) -> str:
+        """
+            Converts a mark into its grade.
+
+            Args:
+                mark (int): the mark.
+
+            Returns:
+                str: the highest grade whose minimum mark is reached, or "N".
+        """
+
+        # returns the highest grade whose minimum mark is reached
+        for grade, target_mark in reversed(Assessments.TARGET_MARKS.items()):
+            if mark >= target_mark:
+                return grade
+
+        # returns a fail grade
+        return "N"
+
+    @classmethod
+    def get_record_totals(cls, data: list[RecordRow]) -> tuple[int, int, int, int]:
+        """
+            Calculates the totals of a whole record with a full pass.
+
+            Args:
+                data (list[RecordRow]): the record units.
+
+            Returns:
+                tuple[int, int, int, int]: the weighted marks, weighted credits, grade points and graded credits.
+        """
+
+        # initialises the totals
+        weighted_marks = weighted_credits = grade_points = graded_credits = 0
+
+        # adds the contribution of each unit to the totals
+        for unit in data:
+            unit_marks, unit_credits, unit_points, unit_graded = cls.get_unit_totals(unit)
+            weighted_marks += unit_marks
+            weighted_credits += unit_credits
+            grade_points += unit_points
+            graded_credits += unit_graded
+
+        # returns the totals
+        return weighted_marks, weighted_credits, grade_points, graded_credits
+
+    @classmethod
+    def get_extra_wam_totals(cls, extras: list[WAMRow]) -> tuple[int, int]:
+        """
+            Calculates the WAM totals of extra units.
+
+            Args:
+                extras (list[WAMRow]): the extra units.
+
+            Returns:
+                tuple[int, int]: the weighted marks and weighted credits.
+        """
+
+        # initialises the totals
+        weighted_marks = 0
+        weighted_credits = 0
+
+        # adds the contribution of each extra unit to the totals
+        for unit in extras:
+            unit_marks, unit_credits = cls.get_wam_totals(unit.year_lvl, unit.mark, unit.credit_pts)
+            weighted_marks += unit_marks
+            weighted_credits += unit_credits
+
+        # returns the totals
+        return weighted_marks, weighted_credits
+
+    @classmethod
+    def get_extra_gpa_totals(cls, extras: list[GPARow]) -> tuple[int, int]:
+        """
+            Calculates the GPA totals of extra units.
+
+            Args:
+                extras (list[GPARow]): the extra units.
+
+            Returns:
+                tuple[int, int]: the grade points and graded credits.
+        """
+
+        # initialises the totals
+        grade_points = 0
+        graded_credits = 0
+
+        # adds the contribution of each extra unit to the totals
+        for unit in extras:
+            unit_points, unit_credits = cls.get_gpa_totals(unit.grade, unit.credit_pts)
+            grade_points += unit_points
+            graded_credits += unit_credits
+
+        # returns the totals
+        return grade_points, graded_credits
+
+    @classmethod
+    def get_planned_wam_credits(cls, extras: list[WAMRow]) -> int:
+        """
+            Calculates the weighted credits of the extra units without a mark.
+
+            Args:
+                extras (list[WAMRow]): the extra units.
+
+            Returns:
+                int: the weighted credits of the planned units in half weights.
+        """
+
+        # adds the weighted credits of each unit without a mark
+        return sum(cls.get_wam_totals(unit.year_lvl, 0, unit.credit_pts)[1] for unit in extras if unit.mark is None)
+
+    @staticmethod
+    def get_wam_target_mark(weighted_marks: int, weighted_credits: int, planned_credits: int, target: float | str) -> int | None:
+        """
+            Calculates the lowest mark that reaches a target WAM if scored in every planned unit.
+
+            Args:
+                weighted_marks (int): the weighted marks in half weights.
+                weighted_credits (int): the weighted credits in half weights.
+                planned_credits (int): the weighted credits of the planned units in half weights.
+                target (float | str): the target WAM.
+
+            Returns:
+                int | None: the mark, or None if the target cannot be reached.
+        """
+
+        # gets the weighted marks the planned units need, using the exact target
+        required = ceil(Fraction(str(target)) * (weighted_credits + planned_credits)) - weighted_marks
+
+        # checks if the target is already reached by units with a weighted mark
+        if required <= 0 and weighted_credits + planned_credits > 0:
+            return 0
+
+        # checks if there are no planned units
+        if planned_credits == 0:
+            return None
+
+        # calculates the mark, rounding up, and checks it can be scored
+        mark = -(-required // planned_credits)
+        return mark if mark <= 100 else None
+
+    @classmethod
+    def get_wam_target_marks(cls, weighted_marks: int, weighted_credits: int, planned: list[tuple[int, int]], target: float | str) -> list[int] | None:
+        """
+            Calculates the lowest mark each planned unit needs to reach a target WAM.
+
+            Every unit needs the uniform target mark or one less, with marks
+            lowered on the heaviest units first while the target stays reached.
+
+            Args:
+                weighted_marks (int): the weighted marks in half weights.
+                weighted_credits (int): the weighted credits in half weights.
+                planned (list[tuple[int, int]]): the year level and credit points of each planned unit.
+                target (float | str): the target WAM.
+
+            Returns:
+                list[int] | None: the mark of each planned unit, or None if the target cannot be reached.
+        """
+
+        # gets the weighted credits of each planned unit
+        weights = [cls.get_wam_totals(year_lvl, 0, credit_pts)[1] for year_lvl, credit_pts in planned]
+        planned_credits = sum(weights)
+
+        # gets the uniform mark and checks if the target can be reached
+        mark = cls.get_wam_target_mark(weighted_marks, weighted_credits, planned_credits, target)
+        if mark is None:
+            return None
+        marks = [mark] * len(planned)
+        if mark == 0:
+            return marks
+
+        # gets the weighted marks the uniform mark scores over what is required
+        excess = mark * planned_credits - (ceil(Fraction(str(target)) * (weighted_credits + planned_credits)) - weighted_marks)
+
+        # lowers units by one mark, heaviest first, while the excess covers them
+        for index in sorted(range(len(planned)), key=lambda index: weights[index], reverse=True):
+            if 0 < weights[index] <= excess:
+                marks[index] -= 1
+                excess -= weights[index]
+
+        # returns the marks
+        return marks
+
+    @classmethod
+    def get_gpa_target_grades(cls, grade_points: int, graded_credits: int, planned: list[int], target: float | str, grades: tuple[str, ...] = ("P", "C", "D", "HD")) -> list[str] | None:
+        """
+            Finds the cheapest grades for planned units that reach a target GPA.
+
+            The cheapest grades score the fewest grade points above the
+            target. Bit s of each bitset is set if the units so far can
+            score s tenths of a credit weighted grade point above the lowest
+            allowed grade, so the search is a shift per unit and grade
+            rather than a search over every combination of grades.
+
+            Args:
+                grade_points (int): the grade points in tenths.
+                graded_credits (int): the graded credits.
+                planned (list[int]): the credit points of each planned unit.
+                target (float | str): the target GPA.
+                grades (tuple[str, ...]): the grades each planned unit can get.
+
+            Returns:
+                list[str] | None: the grade of each planned unit, or None if the target cannot be reached.
+        """
+
+        # checks if there are no credits to take a gpa over
+        planned_credits = sum(planned)
+        if graded_credits + planned_credits == 0:
+            return None
+
+        # gets the tenths of each allowed grade above the lowest one
+        grades = sorted(grades, key=lambda grade: cls.GRADE_POINTS[grade])
+        lowest = cls.GRADE_POINTS[grades[0]]
+        steps = [cls.GRADE_POINTS[grade] - lowest for grade in grades]
+
+        # gets the weighted tenths the planned units need above the lowest grade, using the exact target
+        required = ceil(Fraction(str(target)) * 10 * (graded_credits + planned_credits)) - grade_points - lowest * planned_credits
+
+        # builds the bitset of reachable scores after each planned unit
+        reach = [1]
+        for credit_pts in planned:
+            bits = 0
+            for step in steps:
+                bits |= reach[-1] << (step * credit_pts)
+            reach.append(bits)
+
+        # finds the lowest reachable score that meets the requirement
+        score = max(required, 0)
+        above = reach[-1] >> score
+        if above == 0:
+            return None
+        score += (above & -above).bit_length() - 1
+
+        # initialises the grades and the credits left to assign
+        result = []
+        remaining_credits = planned_credits
+
+        # backtracks through the units, picking the feasible grade nearest the average still needed
+        for index in range(len(planned) - 1, -1, -1):
+            credit_pts = planned[index]
+            average = score / remaining_credits if remaining_credits else 0
+            for grade, step in sorted(zip(grades, steps), key=lambda grade_step: abs(grade_step[1] - average)):
+                if score >= step * credit_pts and reach[index] >> (score - step * credit_pts) & 1:
+                    result.append(grade)
+                    score -= step * credit_pts
+                    break
+            remaining_credits -= credit_pts
+
+        # returns the grades in the order of the planned units
+        result.reverse()
+        return result
+
+    @classmethod
+    def get_wam(cls, record: list[RecordRow], extras: list[WAMRow] | None = None) -> str:
+        """
+            Calculates the WAM of a record and optional extra units.
+
+            Args:
+                record (list[RecordRow]): the record units.
+                extras (list[WAMRow] | None): the extra units.
+
+            Returns:
+                str: the WAM rounded to 3 decimal places.
+        """
+
+        # gets the record and extra totals
+        weighted_marks, weighted_credits, _, _ = cls.get_record_totals(record)
+        extra_marks, extra_credits = cls.get_extra_wam_totals(extras or [])
+
+        # formats and returns wam
+        return cls.format_wam(weighted_marks + extra_marks, weighted_credits + extra_credits)
+
+    @classmethod
+    def get_gpa(cls, record: list[RecordRow], extras: list[GPARow] | None = None) -> str:
+        """
+            Calculates the GPA of a record and optional extra units.
+
+            Args:
+                record (list[RecordRow]): the record units.
+                extras (list[GPARow] | None): the extra units.
+
+            Returns:
+                str: the GPA rounded to 3 decimal places.
+        """
+
+        # gets the record and extra totals
+        _, _, grade_points, graded_credits = cls.get_record_totals(record)
+        extra_points, extra_credits = cls.get_extra_gpa_totals(extras or [])
+
+        # formats and returns gpa
+        return cls.format_gpa(grade_points + extra_points, graded_credits + extra_credits)
+
+    @staticmethod
+    def format_wam(weighted_marks: int, weighted_credits: int) -> str:
+        """
+            Formats a WAM from its totals.
+
+            Args:
+                weighted_marks (int): the weighted marks in half weights.
+                weighted_credits (int): the weighted credits in half weights.
+
+            Returns:
+                str: the WAM rounded to 3 decimal places.
+        """
+
+        # checks if there are no weighted credits
+        if weighted_credits == 0:
+            return "00.000"
+
+        # calculates and returns wam rounded to 3 decimal places
+        wam = weighted_marks / weighted_credits
+        return f"{wam:06.3f}"
+
+    @staticmethod
+    def format_wam_change(weighted_marks: int, weighted_credits: int, base_marks: int, base_credits: int) -> str:
+        """
+            Formats how much a WAM is above a base WAM, from their totals.
+
+            Args:
+                weighted_marks (int): the weighted marks of the WAM in half weights.
+                weighted_credits (int): the weighted credits of the WAM in half weights.
+                base_marks (int): the weighted marks of the base WAM in half weights.
+                base_credits (int): the weighted credits of the base WAM in half weights.
+
+            Returns:
+                str: the signed change rounded to 3 decimal places, or "-" if either WAM has no weighted credits.
+        """
+
+        # checks if either wam has no weighted credits
+        if weighted_credits == 0 or base_credits == 0:
+            return "-"
+
+        # calculates the exact change and returns it rounded to 3 decimal places
+        change = Fraction(weighted_marks, weighted_credits) - Fraction(base_marks, base_credits)
+        return f"{float(change):+.3f}"
+
+    @staticmethod
+    def format_gpa(grade_points: int, graded_credits: int) -> str:
+        """
+            Formats a GPA from its totals.
+
+            Args:
+                grade_points (int): the grade points in tenths.
+                graded_credits (int): the graded credits.
+
+            Returns:
+                str: the GPA rounded to 3 decimal places.
+        """
+
+        # checks if there are no graded credits
+        if graded_credits == 0:
+            return "0.000"
+
+        # calculates and returns gpa rounded to 3 decimal places from the exact totals, so half-way ties
+        # round from the exact value rather than from float sums of 0.3 grade values
+        gpa = grade_points / (graded_credits * 10)
+        return f"{gpa:05.3f}"
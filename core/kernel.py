@@ -0,0 +1,174 @@
+"""
+    kernel.py
+
+    Contains the grade kernel class.
+"""
+
+try:
+    import numpy as np
+except ImportError as error:
+    raise ImportError("core.kernel requires NumPy, install it with: pip install numpy") from error
+
+from collections.abc import Iterable
+from core.grades import Grades
+
+class GradeKernel:
+    """
+        Calculates WAM and GPA for many students at once from column arrays.
+
+        Every unit is one row across the column arrays, and a student id
+        column maps each row to its student. Totals are summed per student
+        with segmented reductions. WAM totals are summed in the same integer
+        half weights as Grades. GPA grade values are summed as floats in row
+        order, as the record's GPA loop always has, so results near a
+        half-way tie in the third decimal round the same way as before.
+    """
+
+    # grade codes, with 0 for grades that are not counted in the gpa
+    GRADE_CODES = {grade: code for code, grade in enumerate(Grades.GRADE_POINTS, start=1)}
+
+    # grade values and whether they are graded, indexed by grade code
+    CODE_VALUES = np.array([0.0] + [points / 10 for points in Grades.GRADE_POINTS.values()], dtype=np.float64)
+    CODE_GRADED = np.array([0] + [1] * len(Grades.GRADE_POINTS), dtype=np.int64)
+
+    # mark used for units without a mark
+    NO_MARK = -1
+
+    @classmethod
+    def encode_grades(cls, grades: Iterable[str]) -> np.ndarray:
+        """
+            Maps grades to grade codes.
+
+            Args:
+                grades (Iterable[str]): the grades.
+
+            Returns:
+                np.ndarray: the grade codes.
+        """
+
+        # maps each grade to its code
+        return np.fromiter((cls.GRADE_CODES.get(grade, 0) for grade in grades), dtype=np.uint8)
+
+    @classmethod
+    def encode_records(cls, records: list[list[list[str]]]) -> dict[str, np.ndarray]:
+        """
+            Converts the records of many students into column arrays.
+
+            Args:
+                records (list[list[list[str]]]): the unit code, mark, grade and credit points of each unit, per student.
+
+            Returns:
+                dict[str, np.ndarray]: the student id, mark, credit points, year level and grade code columns.
+        """
+
+        # flattens the units of all students
+        units = [unit for record in records for unit in record]
+
+        # returns the column arrays
+        return {
+            "ids": np.repeat(np.arange(len(records), dtype=np.int64), [len(record) for record in records]),
+            "marks": np.fromiter((cls.NO_MARK if mark == "-" else int(mark) for _, mark, _, _ in units), dtype=np.int64, count=len(units)),
+            "credits": np.fromiter((int(credit_pts) for _, _, _, credit_pts in units), dtype=np.int64, count=len(units)),
+            "levels": np.fromiter((int(unit_code[3]) for unit_code, _, _, _ in units), dtype=np.int64, count=len(units)),
+            "grades": cls.encode_grades(grade for _, _, grade, _ in units)
+        }
+
+    @classmethod
+    def get_totals(cls, ids: np.ndarray, marks: np.ndarray, credits: np.ndarray, levels: np.ndarray, grades: np.ndarray, count: int) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """
+            Sums the WAM and GPA totals of each student.
+
+            Args:
+                ids (np.ndarray): the student id of each unit.
+                marks (np.ndarray): the mark of each unit, or NO_MARK if there is none.
+                credits (np.ndarray): the credit points of each unit.
+                levels (np.ndarray): the year level of each unit.
+                grades (np.ndarray): the grade code of each unit.
+                count (int): the number of students.
+
+            Returns:
+                tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]: the weighted marks, weighted credits, grade values and graded credits of each student.
+        """
+
+        # gets the weighted credits of each unit in half weights, ignoring units without a mark
+        credits = credits.astype(np.int64)
+        weighted_credits = np.where(marks == cls.NO_MARK, 0, credits * np.where(levels == 1, 1, 2))
+
+        # gets the grade values and graded credits of each unit
+        grades = grades.astype(np.intp)
+        grade_values = cls.CODE_VALUES[grades] * credits
+        graded_credits = cls.CODE_GRADED[grades] * credits
+
+        # sums each column per student
+        columns = (marks * weighted_credits, weighted_credits, grade_values, graded_credits)
+        return tuple(cls.sum_segments(ids, column, count) for column in columns)
+
+    @staticmethod
+    def sum_segments(ids: np.ndarray, values: np.ndarray, count: int) -> np.ndarray:
+        """
+            Sums values per student, adding each student's values in row order.
+
+            Args:
+                ids (np.ndarray): the student id of each value.
+                values (np.ndarray): the 64-bit integer or float values.
+                count (int): the number of students.
+
+            Returns:
+                np.ndarray: the sum for each student.
+        """
+
+        # sums the values of each student one at a time in row order
+        totals = np.zeros(count, dtype=values.dtype)
+        np.add.at(totals, ids, values)
+        return totals
+
+    @classmethod
+    def get_wams(cls, weighted_marks: np.ndarray, weighted_credits: np.ndarray) -> list[str]:
+        """
+            Formats the WAM of each student from their totals.
+
+            Args:
+                weighted_marks (np.ndarray): the weighted marks of each student.
+                weighted_credits (np.ndarray): the weighted credits of each student.
+
+            Returns:
+                list[str]: the WAM of each student rounded to 3 decimal places.
+        """
+
+        # formats each wam as the record does
+        return [Grades.format_wam(marks, credits) for marks, credits in zip(weighted_marks.tolist(), weighted_credits.tolist())]
+
+    @classmethod
+    def get_gpas(cls, grade_values: np.ndarray, graded_credits: np.ndarray) -> list[str]:
+        """
+            Formats the GPA of each student from their totals.
+
+            Args:
+                grade_values (np.ndarray): the summed grade values of each student.
+                graded_credits (np.ndarray): the graded credits of each student.
+
+            Returns:
+                list[str]: the GPA of each student rounded to 3 decimal places.
+        """
+
+        # formats each gpa as the record's gpa loop did
+        return ["0.000" if credits == 0 else f"{values / credits:05.3f}" for values, credits in zip(grade_values.tolist(), graded_credits.tolist())]
+
+    @classmethod
+    def get_results(cls, records: list[list[list[str]]]) -> tuple[list[str], list[str]]:
+        """
+            Calculates the WAM and GPA of many students' records.
+
+            Args:
+                records (list[list[list[str]]]): the unit code, mark, grade and credit points of each unit, per student.
+
+            Returns:
+                tuple[list[str], list[str]]: the WAM and GPA of each student.
+        """
+
+        # encodes the records and sums the totals of each student
+        columns = cls.encode_records(records)
+        weighted_marks, weighted_credits, grade_values, graded_credits = cls.get_totals(**columns, count=len(records))
+
+        # formats the results
+        return cls.get_wams(weighted_marks, weighted_credits), cls.get_gpas(grade_values, graded_credits)
@@ -0,0 +1,226 @@
+"""
+    profile.py
+
+    Contains the profile class.
+"""
+
+import os
+from re import fullmatch
+from typing import Callable
+from utils.storage_backend import StorageBackend
+from utils.text_backend import TextBackend
+from utils.sqlite_backend import SQLiteBackend
+from utils.bundle_backend import BundleBackend
+from utils.file_manager import FileManager
+from core.grades import Grades
+from core.assessments import Assessments
+from core.rows import RecordRow, WAMRow, GPARow, AssessmentRow
+from core.columns import RecordColumns
+
+class Profile:
+    """
+        Holds a student's data read from a storage backend, without any user interface.
+
+        The record, extra WAM and GPA units, target and unit assessments are
+        read once from the given backend and kept in memory, so the same
+        calculations as the application can run in scripts and batch jobs.
+    """
+
+    def __init__(self, backend: StorageBackend) -> None:
+        """
+            Initialises the profile from a storage backend.
+
+            Args:
+                backend (StorageBackend): the storage backend to read from.
+        """
+
+        # reads the record and extra units, parsing each row once and checking unit codes and grades
+        self.record = self.read_rows(backend, "record", RecordRow, lambda unit: fullmatch(r"[A-Z]{3}\d{4}", unit.unit_code) and unit.grade in RecordColumns.GRADE_CODES)
+        self.wam = self.read_rows(backend, "wam", WAMRow)
+        self.gpa = self.read_rows(backend, "gpa", GPARow, lambda unit: unit.grade in RecordColumns.GRADE_CODES)
+
+        # reads the target, checking it is a grade with a minimum mark or a whole mark
+        target = backend.read_file("target")
+        if target and (len(target[0]) < 2 or not self.is_target(*target[0][:2])):
+            raise ValueError(f"invalid target row 1: {','.join(map(str, target[0]))}")
+
+        # sets the target, defaulting to a high distinction
+        self.target_type, self.target = target[0][:2] if target else ("Grade", "HD")
+
+        # reads the assessments of each unit, checking each has a total to score against
+        self.units = {unit_code: self.read_rows(backend, unit_code, AssessmentRow, lambda assessment: assessment.total > 0) for unit_code in backend.get_unit_files()}
+
+    @staticmethod
+    def is_target(target_type: str, target: str) -> bool:
+        """
+            Checks if a target can be converted into the mark it requires.
+
+            Args:
+                target_type (str): the target type, either "Grade" or "Mark".
+                target (str): the target grade or mark.
+
+            Returns:
+                bool: whether the target is valid.
+        """
+
+        # checks a target grade
+        if target_type == "Grade":
+            return target in Assessments.TARGET_MARKS
+
+        # checks a target mark
+        return target_type == "Mark" and fullmatch(r"\d+", str(target)) is not None
+
+    @staticmethod
+    def read_rows(backend: StorageBackend, filename: str, row_type: type, valid: Callable[[object], object] | None = None) -> list:
+        """
+            Reads and parses the rows of a file.
+
+            Args:
+                backend (StorageBackend): the storage backend to read from.
+                filename (str): the name of the file to read.
+                row_type (type): the row class to parse each row with.
+                valid (Callable[[object], object] | None): checks a parsed row, or None to accept every row.
+
+            Returns:
+                list: the parsed rows.
+        """
+
+        # parses and checks each row, naming the file and row that cannot be used
+        rows = []
+        for number, row in enumerate(backend.read_file(filename), 1):
+            try:
+                parsed = row_type.from_row(row)
+                if valid is not None and not valid(parsed):
+                    raise ValueError
+            except (ValueError, TypeError, IndexError):
+                raise ValueError(f"invalid {filename} row {number}: {','.join(map(str, row))}") from None
+            rows.append(parsed)
+        return rows
+
+    @classmethod
+    def from_path(cls, path: str) -> "Profile":
+        """
+            Reads a profile from a data path.
+
+            Args:
+                path (str): a data folder, SQLite database or bundle file.
+
+            Returns:
+                Profile: the profile.
+        """
+
+        # reads the database or bundle of a data folder holding one
+        if os.path.isdir(path) and FileManager.get_format(path) in FileManager.profile_files:
+            path = os.path.join(path, FileManager.profile_files[FileManager.get_format(path)])
+
+        # opens a data folder, replaying journals left by the application
+        if os.path.isdir(path):
+            backend = TextBackend(path, journaled=os.path.isdir(os.path.join(path, "journal")))
+
+        # reads a SQLite database read-only, so reading never changes it, and closes it once read
+        elif path.endswith((".db", ".sqlite", ".sqlite3")):
+            backend = SQLiteBackend(path, read_only=True)
+            try:
+                return cls(backend)
+            finally:
+                backend.close()
+
+        # opens a bundle file
+        else:
+            backend = BundleBackend(path)
+
+        # reads the profile from the backend
+        return cls(backend)
+
+    def get_wam(self) -> str:
+        """
+            Returns the WAM of the record.
+
+            Returns:
+                str: the WAM rounded to 3 decimal places.
+        """
+
+        # calculates and returns wam
+        return Grades.get_wam(self.record)
+
+    def get_gpa(self) -> str:
+        """
+            Returns the GPA of the record.
+
+            Returns:
+                str: the GPA rounded to 3 decimal places.
+        """
+
+        # calculates and returns gpa
+        return Grades.get_gpa(self.record)
+
+    def get_calculated_wam(self) -> str:
+        """
+            Returns the WAM of the record with the extra WAM units.
+
+            Returns:
+                str: the WAM rounded to 3 decimal places.
+        """
+
+        # calculates and returns wam with extra units
+        return Grades.get_wam(self.record, self.wam)
+
+    def get_calculated_gpa(self) -> str:
+        """
+            Returns the GPA of the record with the extra GPA units.
+
+            Returns:
+                str: the GPA rounded to 3 decimal places.
+        """
+
+        # calculates and returns gpa with extra units
+        return Grades.get_gpa(self.record, self.gpa)
+
+    def get_target_mark(self) -> int:
+        """
+            Returns the mark required by the target.
+
+            Returns:
+                int: the target mark.
+        """
+
+        # converts and returns the target
+        return Assessments.get_target_mark(self.target_type, self.target)
+
+    def get_overview(self, target_mark: int | None = None) -> list[list[str]]:
+        """
+            Returns the overview of every unit.
+
+            Args:
+                target_mark (int | None): the target mark, or None to use the profile target.
+
+            Returns:
+                list[list[str]]: the unit code, mark and grade, remaining weight and average required of each unit.
+        """
+
+        # uses the profile target if none is given
+        if target_mark is None:
+            target_mark = self.get_target_mark()
+
+        # gets overview for each unit
+        return [Assessments.get_unit_overview(unit_code, assessments, target_mark) for unit_code, assessments in self.units.items()]
+
+    def get_average_required(self, unit_code: str, target_mark: int | None = None) -> str:
+        """
+            Returns the average needed on a unit's remaining assessments.
+
+            Args:
+                unit_code (str): the unit code of the unit.
+                target_mark (int | None): the target mark, or None to use the profile target.
+
+            Returns:
+                str: the average required, or "-" if the target cannot be reached.
+        """
+
+        # uses the profile target if none is given
+        if target_mark is None:
+            target_mark = self.get_target_mark()
+
+        # calculates and returns the average required
+        total_mark, total_weight = Assessments.get_totals(self.units[unit_code])
+        return Assessments.get_average_required(total_mark, total_weight, target_mark)
@@ -0,0 +1,213 @@
+"""
+    projection.py
+
+    Contains the mark projection classes.
+"""
+
+try:
+    import numpy as np
+except ImportError as error:
+    raise ImportError("core.projection requires NumPy, install it with: pip install numpy") from error
+
+from dataclasses import dataclass
+from core.assessments import Assessments
+from core.rows import AssessmentRow
+
+@dataclass(frozen=True)
+class Projection:
+    """
+        The projected grade bands of each unit and the projected WAM samples.
+    """
+
+    bands: dict[str, dict[str, float]]
+    wams: np.ndarray
+
+    def get_wam_percentiles(self, percentiles: tuple[int, ...] = (5, 25, 50, 75, 95)) -> dict[int, float]:
+        """
+            Returns percentiles of the projected WAM.
+
+            Args:
+                percentiles (tuple[int, ...]): the percentiles to return.
+
+            Returns:
+                dict[int, float]: the projected WAM at each percentile.
+        """
+
+        # returns each percentile of the wam samples
+        return dict(zip(percentiles, np.percentile(self.wams, percentiles).tolist()))
+
+class MarkProjection:
+    """
+        Projects the final marks of in-progress units by resampling the
+        student's own assessment results.
+
+        The remaining weight of each unit is split into as many assessments
+        as the student's average assessment weight gives, and each sample
+        scores every remaining assessment with a result drawn from the
+        student's past assessment percentages. The sum of each unit's
+        remaining results is drawn directly, one array of samples per unit,
+        by drawing from tables of the sums of every pair, triple and so on
+        of past results, so each draw adds several results at once.
+    """
+
+    # lowest marks of each grade band
+    BANDS = {"N": 0} | Assessments.TARGET_MARKS
+
+    # credit points of an in-progress unit
+    CREDIT_PTS = 6
+
+    # largest table of sums of past results
+    TABLE_SIZE = 65536
+
+    def __init__(self, samples: int = 100000, seed: int | None = None) -> None:
+        """
+            Initialises the projection.
+
+            Args:
+                samples (int): the number of samples to draw.
+                seed (int | None): the random seed, or None for a fresh one.
+        """
+
+        # sets the number of samples and random generator
+        self.samples = samples
+        self.rng = np.random.default_rng(seed)
+
+    @staticmethod
+    def get_history(units: dict[str, list[AssessmentRow]]) -> tuple[np.ndarray, float]:
+        """
+            Gets the percentages and average weight of every assessment of the student.
+
+            Args:
+                units (dict[str, list[AssessmentRow]]): the assessments of each unit.
+
+            Returns:
+                tuple[np.ndarray, float]: the assessment percentages and the average assessment weight.
+        """
+
+        # flattens the assessments of all units
+        assessments = [assessment for unit in units.values() for assessment in unit]
+
+        # checks if there are no assessments to resample
+        if not assessments:
+            raise ValueError("no assessments to project from")
+
+        # returns the percentages and average weight
+        percentages = np.array([assessment.score * 100 / assessment.total for assessment in assessments])
+        return percentages, sum(assessment.weight for assessment in assessments) / len(assessments)
+
+    @classmethod
+    def get_tables(cls, percentages: np.ndarray, draws: int) -> list[np.ndarray]:
+        """
+            Builds tables of the sums of every combination of past results.
+
+            Args:
+                percentages (np.ndarray): the past results.
+                draws (int): the largest number of results in a sum.
+
+            Returns:
+                list[np.ndarray]: the sums of every 1, 2, 3 and so on past results, up to draws tables or TABLE_SIZE sums.
+        """
+
+        # adds another result to every sum until there are enough tables or the next would be too big
+        tables = [percentages]
+        while len(tables) < draws and len(tables[-1]) * len(percentages) <= cls.TABLE_SIZE:
+            tables.append((tables[-1][:, None] + percentages).ravel())
+        return tables
+
+    def get_sums(self, tables: list[np.ndarray], draws: int) -> np.ndarray:
+        """
+            Samples the sum of a number of past results.
+
+            Args:
+                tables (list[np.ndarray]): the tables of sums of past results.
+                draws (int): the number of results in each sum.
+
+            Returns:
+                np.ndarray: the sum of each sample.
+        """
+
+        # initialises the sums
+        sums = np.zeros(self.samples)
+
+        # draws sums of as many results as the largest table holds, then the rest from a smaller table
+        full, rest = divmod(draws, len(tables))
+        for table in [tables[-1]] * full + ([tables[rest - 1]] if rest else []):
+            sums += table[self.rng.integers(0, len(table), size=self.samples, dtype=np.uint32)]
+        return sums
+
+    def get_final_marks(self, units: dict[str, list[AssessmentRow]]) -> np.ndarray:
+        """
+            Samples the final mark of each unit.
+
+            Args:
+                units (dict[str, list[AssessmentRow]]): the assessments of each unit.
+
+            Returns:
+                np.ndarray: the final marks, one row per sample and one column per unit.
+        """
+
+        # gets the student's assessment history
+        percentages, mean_weight = self.get_history(units)
+
+        # gets the totals, remaining weight and number of remaining assessments of each unit
+        totals = np.array([Assessments.get_totals(assessments) for assessments in units.values()], dtype=float).reshape(-1, 2)
+        remaining = np.clip(100 - totals[:, 1], 0, None)
+        draws = np.maximum(1, np.rint(remaining / max(mean_weight, 1))).astype(np.int64)
+
+        # builds the tables of sums of past results
+        tables = self.get_tables(percentages, int(draws.max()))
+
+        # samples the average remaining result of each unit
+        averages = np.empty((self.samples, len(units)))
+        for index, count in enumerate(draws.tolist()):
+            averages[:, index] = self.get_sums(tables, count) / count
+
+        # scores the averages over each unit's remaining weight
+        return np.rint(totals[:, 0] + remaining * averages / 100)
+
+    def get_bands(self, unit_codes: list[str], marks: np.ndarray) -> dict[str, dict[str, float]]:
+        """
+            Calculates the probability of each unit finishing in each grade band.
+
+            Args:
+                unit_codes (list[str]): the unit codes of the units.
+                marks (np.ndarray): the sampled final marks.
+
+            Returns:
+                dict[str, dict[str, float]]: the probability of each grade band, by unit code.
+        """
+
+        # gets the band index of every sampled mark
+        bands = np.digitize(marks, list(self.BANDS.values())[1:])
+
+        # counts the share of samples in each band of each unit
+        shares = (bands[..., None] == np.arange(len(self.BANDS))).mean(axis=0)
+        return {unit_code: dict(zip(self.BANDS, shares[index].tolist())) for index, unit_code in enumerate(unit_codes)}
+
+    def project(self, units: dict[str, list[AssessmentRow]], weighted_marks: int = 0, weighted_credits: int = 0, credit_pts: dict[str, int] | None = None) -> Projection:
+        """
+            Projects the grade bands of each unit and the WAM they give.
+
+            Args:
+                units (dict[str, list[AssessmentRow]]): the assessments of each unit.
+                weighted_marks (int): the weighted marks of the record in half weights.
+                weighted_credits (int): the weighted credits of the record in half weights.
+                credit_pts (dict[str, int] | None): the credit points of each unit, or None for CREDIT_PTS each.
+
+            Returns:
+                Projection: the grade bands and WAM samples.
+        """
+
+        # samples the final marks of each unit
+        unit_codes = list(units)
+        marks = self.get_final_marks(units)
+
+        # gets the weighted credits of each unit in half weights
+        credit_pts = credit_pts or {}
+        weights = np.array([credit_pts.get(unit_code, self.CREDIT_PTS) * (1 if unit_code[3] == "1" else 2) for unit_code in unit_codes], dtype=float)
+
+        # adds each sample's marks to the record totals
+        wams = (weighted_marks + marks @ weights) / max(weighted_credits + weights.sum(), 1)
+
+        # returns the projection
+        return Projection(self.get_bands(unit_codes, marks), wams)
@@ -0,0 +1,165 @@
+"""
+    rows.py
+
+    Contains the row classes.
+"""
+
+from dataclasses import dataclass, field
+
+@dataclass(slots=True)
+class RecordRow:
+    """
+        A unit in the record, with its numbers parsed once.
+    """
+
+    unit_code: str
+    mark: int | None
+    grade: str
+    credit_pts: int
+    year_lvl: int = field(init=False)
+
+    def __post_init__(self) -> None:
+        """
+            Sets the year level from the unit code.
+        """
+
+        # gets the year level from the first digit of the unit code
+        self.year_lvl = int(self.unit_code[3])
+
+    @classmethod
+    def from_row(cls, row: list[str]) -> "RecordRow":
+        """
+            Parses a file row.
+
+            Args:
+                row (list[str]): the unit code, mark or "-", grade and credit points.
+
+            Returns:
+                RecordRow: the parsed row.
+        """
+
+        # parses the row
+        unit_code, mark, grade, credit_pts = row
+        return cls(unit_code, None if mark == "-" else int(mark), grade, int(credit_pts))
+
+    def to_row(self) -> list[str]:
+        """
+            Converts the row back into a file row.
+
+            Returns:
+                list[str]: the unit code, mark or "-", grade and credit points.
+        """
+
+        # formats the row
+        return [self.unit_code, "-" if self.mark is None else str(self.mark), self.grade, str(self.credit_pts)]
+
+@dataclass(slots=True)
+class WAMRow:
+    """
+        An extra unit in the WAM data, with its numbers parsed once.
+    """
+
+    year_lvl: int
+    mark: int | None
+    credit_pts: int
+
+    @classmethod
+    def from_row(cls, row: list[str]) -> "WAMRow":
+        """
+            Parses a file row.
+
+            Args:
+                row (list[str]): the year level, mark or "-" and credit points.
+
+            Returns:
+                WAMRow: the parsed row.
+        """
+
+        # parses the row
+        year_lvl, mark, credit_pts = row
+        return cls(int(year_lvl), None if mark == "-" else int(mark), int(credit_pts))
+
+    def to_row(self) -> list[str]:
+        """
+            Converts the row back into a file row.
+
+            Returns:
+                list[str]: the year level, mark or "-" and credit points.
+        """
+
+        # formats the row
+        return [str(self.year_lvl), "-" if self.mark is None else str(self.mark), str(self.credit_pts)]
+
+@dataclass(slots=True)
+class GPARow:
+    """
+        An extra unit in the GPA data, with its credit points parsed once.
+    """
+
+    grade: str
+    credit_pts: int
+
+    @classmethod
+    def from_row(cls, row: list[str]) -> "GPARow":
+        """
+            Parses a file row.
+
+            Args:
+                row (list[str]): the grade and credit points.
+
+            Returns:
+                GPARow: the parsed row.
+        """
+
+        # parses the row
+        grade, credit_pts = row
+        return cls(grade, int(credit_pts))
+
+    def to_row(self) -> list[str]:
+        """
+            Converts the row back into a file row.
+
+            Returns:
+                list[str]: the grade and credit points.
+        """
+
+        # formats the row
+        return [self.grade, str(self.credit_pts)]
+
+@dataclass(slots=True)
+class AssessmentRow:
+    """
+        An assessment of a unit, with its numbers parsed once.
+    """
+
+    name: str
+    weight: float
+    score: float
+    total: float
+
+    @classmethod
+    def from_row(cls, row: list[str]) -> "AssessmentRow":
+        """
+            Parses a file row.
+
+            Args:
+                row (list[str]): the assessment name, weight, score and total.
+
+            Returns:
+                AssessmentRow: the parsed row.
+        """
+
+        # parses the row
+        name, weight, score, total = row
+        return cls(name, float(weight), float(score), float(total))
+
+    def to_row(self) -> list[str]:
+        """
+            Converts the row back into a file row.
+
+            Returns:
+                list[str]: the assessment name, weight, score and total.
+        """
+
+        # formats the row as the assessment page does
+        return [self.name, f"{self.weight:.2f}", str(self.score), str(self.total)]
@@ -0,0 +1,86 @@
+"""
+    summary.py
+
+    Contains the record summary class.
+"""
+
+from dataclasses import dataclass, field
+from core.grades import Grades
+from core.rows import RecordRow
+
+@dataclass(frozen=True)
+class RecordSummary:
+    """
+        Summarises a record: its WAM and GPA totals, credit points and ungraded units.
+
+        Credit points by year level only include year levels with credit points.
+    """
+
+    weighted_marks: int = 0
+    weighted_credits: int = 0
+    grade_points: int = 0
+    graded_credits: int = 0
+    total_credits: int = 0
+    level_credits: dict[int, int] = field(default_factory=dict)
+    ungraded_units: int = 0
+
+    @property
+    def wam(self) -> str:
+        """
+            Returns the WAM of the record.
+
+            Returns:
+                str: the WAM rounded to 3 decimal places.
+        """
+
+        # formats and returns wam
+        return Grades.format_wam(self.weighted_marks, self.weighted_credits)
+
+    @property
+    def gpa(self) -> str:
+        """
+            Returns the GPA of the record.
+
+            Returns:
+                str: the GPA rounded to 3 decimal places.
+        """
+
+        # formats and returns gpa
+        return Grades.format_gpa(self.grade_points, self.graded_credits)
+
+    @classmethod
+    def from_record(cls, data: list[RecordRow]) -> "RecordSummary":
+        """
+            Summarises a record in a single pass.
+
+            Args:
+                data (list[RecordRow]): the record units.
+
+            Returns:
+                RecordSummary: the summary of the record.
+        """
+
+        # initialises the totals
+        totals = [0, 0, 0, 0]
+        total_credits = 0
+        level_credits = {}
+        ungraded_units = 0
+
+        # iterates through each unit once
+        for unit in data:
+
+            # adds the wam and gpa contributions of the unit
+            for index, value in enumerate(Grades.get_unit_totals(unit)):
+                totals[index] += value
+
+            # adds the credit points of the unit to the total and its year level
+            total_credits += unit.credit_pts
+            if unit.credit_pts:
+                level_credits[unit.year_lvl] = level_credits.get(unit.year_lvl, 0) + unit.credit_pts
+
+            # counts units without a gpa grade
+            if unit.grade not in Grades.GRADE_POINTS:
+                ungraded_units += 1
+
+        # returns the summary
+        return cls(*totals, total_credits, level_credits, ungraded_units)
@@ -0,0 +1,68 @@
+"""
+    events.py
+
+    Contains the change event classes.
+"""
+
+from dataclasses import dataclass
+
+@dataclass(frozen=True)
+class ChangeEvent:
+    """
+        Describes a change to the data.
+    """
+
+@dataclass(frozen=True)
+class RecordChanged(ChangeEvent):
+    """
+        A unit was added to or removed from the record.
+    """
+
+    action: str
+    index: int
+
+@dataclass(frozen=True)
+class WAMChanged(ChangeEvent):
+    """
+        A unit was added to or removed from the extra WAM data.
+    """
+
+    action: str
+    index: int
+
+@dataclass(frozen=True)
+class GPAChanged(ChangeEvent):
+    """
+        A unit was added to or removed from the extra GPA data.
+    """
+
+    action: str
+    index: int
+
+@dataclass(frozen=True)
+class UnitChanged(ChangeEvent):
+    """
+        A unit was added or removed, or all units were reloaded.
+    """
+
+    action: str
+    unit_code: str | None = None
+
+@dataclass(frozen=True)
+class AssessmentChanged(ChangeEvent):
+    """
+        An assessment was added to or removed from a unit.
+    """
+
+    action: str
+    unit_code: str
+    index: int
+
+@dataclass(frozen=True)
+class TargetChanged(ChangeEvent):
+    """
+        The target was changed.
+    """
+
+    target_type: str
+    target: str
@@ -5,20 +5,37 @@
 """
 
 from utils.file_manager import FileManager
+from core.grades import Grades
+from core.rows import GPARow
+from data.events import GPAChanged
+from data.observable import Observable
+from data.record import Record
 
-class GPA:
+class GPA(Observable):
     """
         Stores and manages the GPA information of the student.
     """
 
-    def __init__(self) -> None:
+    def __init__(self, record: Record) -> None:
         """
-            Initialises the GPA data from files.
+            Initialises the GPA data from the shared record and file.
+
+            Args:
+                record (Record): the shared record.
         """
 
-        # gets data from files
-        self.record = [[grade, credit_pts] for _, _, grade, credit_pts in FileManager.read_file("record")]
-        self.data = FileManager.read_file("gpa")
+        # initialises subscribers
+        super().__init__()
+
+        # sets the shared record and gets extra data from file
+        self.record = record
+        self.data = [GPARow.from_row(row) for row in FileManager.read_file("gpa")]
+
+        # initialises the overlay totals of the extra units
+        self.extra_points, self.extra_credits = Grades.get_extra_gpa_totals(self.data)
+
+        # passes record change events on to subscribers
+        self.record.subscribe(self.notify)
 
     def get_record(self) -> list[list[str]]:
         """
@@ -29,7 +46,7 @@ class GPA:
         """
 
         # returns the record array
-        return [[i + 1] + self.record[i] for i in range(len(self.record))]
+        return [[i + 1, grade, credit_pts] for i, (_, _, grade, credit_pts) in enumerate(self.record.data.to_rows())]
 
     def get_data(self) -> list[list[str]]:
         """
@@ -40,53 +57,18 @@ class GPA:
         """
 
         # returns the data array
-        return [[i + len(self.record) + 1] + self.data[i] for i in range(len(self.data))]
+        return [[i + len(self.record.data) + 1] + unit.to_row() for i, unit in enumerate(self.data)]
 
     def get_current_gpa(self) -> str:
         """
-            Calculates and returns the current GPA.
+            Returns the current GPA from the record.
 
             Returns:
                 str: the gpa rounded to 3 decimal places.
         """
 
-        # initialises total grade value and credits
-        total_grade = 0
-        total_credits = 0
-
-        # iterates through each unit in the record
-        for grade, credit_pts in self.record:
-
-            # gets grade value
-            match grade:
-                case "WN":
-                    grade_value = 0.0
-                case "NH":
-                    grade_value = 0.3
-                case "N":
-                    grade_value = 0.3
-                case "P":
-                    grade_value = 1.0
-                case "C":
-                    grade_value = 2.0
-                case "D":
-                    grade_value = 3.0
-                case "HD":
-                    grade_value = 4.0
-                case _:
-                    continue
-
-            # adds unit grade value and credits to totals
-            total_grade += grade_value * int(credit_pts)
-            total_credits += int(credit_pts)
-
-        # checks if there are no units in the record
-        if total_credits == 0:
-            return "0.000"
-
-        # calculates and returns gpa rounded to 3 decimal places
-        gpa = total_grade / total_credits
-        return f"{gpa:05.3f}"
+        # returns the gpa of the shared record
+        return self.record.get_gpa()
 
     def get_calculated_gpa(self) -> str:
         """
@@ -96,43 +78,64 @@ class GPA:
                 str: the GPA rounded to 3 decimal places.
         """
 
-        # initialises total grade value and credits
-        total_grade = 0
-        total_credits = 0
-
-        # iterates through each unit in the record
-        for grade, credit_pts in self.record + self.data:
-
-            # gets grade value
-            match grade:
-                case "WN":
-                    grade_value = 0.0
-                case "NH":
-                    grade_value = 0.3
-                case "N":
-                    grade_value = 0.3
-                case "P":
-                    grade_value = 1.0
-                case "C":
-                    grade_value = 2.0
-                case "D":
-                    grade_value = 3.0
-                case "HD":
-                    grade_value = 4.0
-                case _:
-                    continue
-
-            # adds unit grade value and credits to totals
-            total_grade += grade_value * int(credit_pts)
-            total_credits += int(credit_pts)
-
-        # checks if there are no units in the record
-        if total_credits == 0:
-            return "0.000"
-
-        # calculates and returns gpa rounded to 3 decimal places
-        gpa = total_grade / total_credits
-        return f"{gpa:05.3f}"
+        # formats and returns gpa from the record totals and the overlay totals
+        return Grades.format_gpa(self.record.grade_points + self.extra_points, self.record.graded_credits + self.extra_credits)
+
+    def solve_target(self, target: float | str, planned: list[int], grades: tuple[str, ...] = ("P", "C", "D", "HD")) -> tuple[list[str], str] | None:
+        """
+            Finds the cheapest grades for planned units that reach a target GPA with the extra data.
+
+            Args:
+                target (float | str): the target GPA.
+                planned (list[int]): the credit points of each planned unit.
+                grades (tuple[str, ...]): the grades each planned unit can get.
+
+            Returns:
+                tuple[list[str], str] | None: the grade of each planned unit and the GPA they give, or None if the target cannot be reached.
+        """
+
+        # gets the totals of the record and the extra data
+        grade_points = self.record.grade_points + self.extra_points
+        graded_credits = self.record.graded_credits + self.extra_credits
+
+        # solves for the grades of the planned units
+        planned_grades = Grades.get_gpa_target_grades(grade_points, graded_credits, planned, target, grades)
+        if planned_grades is None:
+            return None
+
+        # adds the planned units to the totals and returns the grades and gpa
+        for grade, credit_pts in zip(planned_grades, planned):
+            unit_points, unit_credits = Grades.get_gpa_totals(grade, credit_pts)
+            grade_points += unit_points
+            graded_credits += unit_credits
+        return planned_grades, Grades.format_gpa(grade_points, graded_credits)
+
+    def update_totals(self, unit: GPARow, sign: int) -> None:
+        """
+            Adds or subtracts an extra unit from the overlay totals.
+
+            Args:
+                unit (GPARow): the unit to add or subtract.
+                sign (int): 1 to add the unit, -1 to subtract it.
+        """
+
+        # gets unit contribution to the totals
+        unit_points, unit_credits = Grades.get_gpa_totals(unit.grade, unit.credit_pts)
+
+        # updates overlay totals
+        self.extra_points += sign * unit_points
+        self.extra_credits += sign * unit_credits
+
+    def check_totals(self) -> bool:
+        """
+            Checks the overlay totals against a full recompute of the extra units.
+
+            Returns:
+                bool: whether the overlay totals are consistent.
+        """
+
+        # recomputes totals and compares them to the overlay totals
+        return (self.extra_points, self.extra_credits) == Grades.get_extra_gpa_totals(self.data)
 
     def add_unit(self, unit: list[str]) -> None:
         """
@@ -142,11 +145,14 @@ class GPA:
                 unit (list[str]): the unit to add.
         """
 
-        # appends the unit to the data array
+        # parses the unit and appends it to the data array and overlay totals
+        unit = GPARow.from_row(unit)
         self.data.append(unit)
+        self.update_totals(unit, 1)
 
-        # saves data to file
-        FileManager.write_file("gpa", self.data)
+        # saves data to file and notifies subscribers
+        FileManager.write_file("gpa", [unit.to_row() for unit in self.data])
+        self.notify(GPAChanged("add", len(self.data) - 1))
 
     def remove_unit(self, unit_no: int) -> None:
         """
@@ -156,17 +162,10 @@ class GPA:
                 unit_no (int): the unit to delete.
         """
 
-        # deletes unit from data
-        self.data.pop(unit_no - len(self.record) - 1)
-
-        # saves data to file
-        FileManager.write_file("gpa", self.data)
-
-    def reset(self) -> None:
-        """
-            Reinitialises the GPA data from files.
-        """
+        # deletes unit from data and overlay totals
+        index = unit_no - len(self.record.data) - 1
+        self.update_totals(self.data.pop(index), -1)
 
-        # gets data from files
-        self.record = [[grade, credit_pts] for _, _, grade, credit_pts in FileManager.read_file("record")]
-        self.data = FileManager.read_file("gpa")
+        # saves data to file and notifies subscribers
+        FileManager.write_file("gpa", [unit.to_row() for unit in self.data])
+        self.notify(GPAChanged("remove", index))
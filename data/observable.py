@@ -0,0 +1,44 @@
+"""
+    observable.py
+
+    Contains the observable base class.
+"""
+
+from collections.abc import Callable
+from data.events import ChangeEvent
+
+class Observable:
+    """
+        Lets data classes publish change events to subscribers.
+    """
+
+    def __init__(self) -> None:
+        """
+            Initialises the list of subscribers.
+        """
+
+        # initialises listeners
+        self.listeners = []
+
+    def subscribe(self, callback: Callable[[ChangeEvent], None]) -> None:
+        """
+            Subscribes a callback to change events.
+
+            Args:
+                callback (Callable[[ChangeEvent], None]): the function to call with each change event.
+        """
+
+        # adds callback to listeners
+        self.listeners.append(callback)
+
+    def notify(self, event: ChangeEvent) -> None:
+        """
+            Publishes a change event to all subscribers.
+
+            Args:
+                event (ChangeEvent): the change event.
+        """
+
+        # calls each subscribed callback
+        for callback in self.listeners:
+            callback(event)
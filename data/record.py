@@ -5,8 +5,14 @@
 """
 
 from utils.file_manager import FileManager
-
-class Record:
+from core.grades import Grades
+from core.summary import RecordSummary
+from core.rows import RecordRow
+from core.columns import RecordColumns
+from data.events import RecordChanged
+from data.observable import Observable
+
+class Record(Observable):
     """
         Stores and manages the record of the student.
     """
@@ -16,8 +22,20 @@ class Record:
             Initialises the record from file.
         """
 
-        # gets data from file
-        self.data = FileManager.read_file("record")
+        # initialises subscribers
+        super().__init__()
+
+        # gets data from file, parsing each unit once into columns
+        self.data = RecordColumns.from_rows(FileManager.read_file("record"))
+
+        # initialises the set of unit codes in the record
+        self.unit_codes = set(self.data.unit_codes)
+
+        # initialises running totals and credit counts from a single pass over the data
+        summary = RecordSummary.from_record(self.data)
+        self.weighted_marks, self.weighted_credits = summary.weighted_marks, summary.weighted_credits
+        self.grade_points, self.graded_credits = summary.grade_points, summary.graded_credits
+        self.total_credits, self.level_credits, self.ungraded_units = summary.total_credits, summary.level_credits, summary.ungraded_units
 
     def get_data(self) -> list[list[str]]:
         """
@@ -28,86 +46,142 @@ class Record:
         """
 
         # returns the data array
-        return [[i + 1] + self.data[i] for i in range(len(self.data))]
+        return [[i + 1] + row for i, row in enumerate(self.data.to_rows())]
+
+    def has_unit(self, unit_code: str) -> bool:
+        """
+            Checks if a unit is in the record.
+
+            Args:
+                unit_code (str): the unit code of the unit.
+
+            Returns:
+                bool: whether the unit is in the record.
+        """
+
+        # looks up the unit code in the set of unit codes
+        return unit_code in self.unit_codes
 
     def get_wam(self) -> str:
         """
-            Calculates and returns the WAM of the record.
+            Returns the WAM of the record from the running totals.
 
             Returns:
                 str: the WAM rounded to 3 decimal places.
         """
 
-        # initialises total weighted marks and credits
-        weighted_marks = 0
-        weighted_credits = 0
+        # formats and returns wam from running totals
+        return Grades.format_wam(self.weighted_marks, self.weighted_credits)
 
-        # iterates through each unit in the record
-        for unit_code, mark, _, credit_pts in self.data:
+    def get_gpa(self) -> str:
+        """
+            Returns the GPA of the record from the running totals.
 
-            # checks if there are no marks
-            if mark == "-": continue
+            Returns:
+                str: the GPA rounded to 3 decimal places.
+        """
 
-            # gets weighting of unit
-            weight = 0.5 if unit_code[3] == '1' else 1.0
+        # formats and returns gpa from running totals
+        return Grades.format_gpa(self.grade_points, self.graded_credits)
 
-            # adds unit weighted marks and credits to totals
-            weighted_marks += int(mark) * int(credit_pts) * weight
-            weighted_credits += int(credit_pts) * weight
+    def summary(self) -> RecordSummary:
+        """
+            Returns the WAM, GPA, credit points and ungraded units of the record from the running totals.
 
-        # checks if there are no units in the record
-        if weighted_credits == 0:
-            return "00.000"
+            Returns:
+                RecordSummary: the summary of the record.
+        """
 
-        # calculates and returns wam rounded to 3 decimal places
-        wam = weighted_marks / weighted_credits
-        return f"{wam:06.3f}"
+        # returns the running totals and credit counts
+        return RecordSummary(self.weighted_marks, self.weighted_credits, self.grade_points, self.graded_credits,
+                             self.total_credits, dict(self.level_credits), self.ungraded_units)
 
-    def get_gpa(self) -> str:
+    def get_impacts(self, retake_mark: int | None = None) -> dict[str, list[str]]:
         """
-            Calculates and returns the GPA of the record.
+            Returns how each unit changes the WAM and GPA of the record, and how retaking it at a mark would.
+
+            Args:
+                retake_mark (int | None): the mark each unit is retaken at, or None to leave out retakes.
 
             Returns:
-                str: the GPA rounded to 3 decimal places.
+                dict[str, list[str]]: by unit code, the WAM and GPA without the unit and how much the unit raises the WAM, followed by the WAM and GPA with it retaken and how much the retake raises the WAM if a retake mark is given.
+        """
+
+        # gets the grade of the retake mark
+        if retake_mark is not None:
+            retake_grade = Grades.get_grade(retake_mark)
+
+        # initialises the impacts of each unit
+        impacts = {}
+
+        # takes each unit out of the running totals in one pass
+        for unit in self.data:
+            unit_marks, unit_credits, unit_points, unit_graded = Grades.get_unit_totals(unit)
+            weighted_marks, weighted_credits = self.weighted_marks - unit_marks, self.weighted_credits - unit_credits
+            grade_points, graded_credits = self.grade_points - unit_points, self.graded_credits - unit_graded
+            impact = [
+                Grades.format_wam(weighted_marks, weighted_credits),
+                Grades.format_gpa(grade_points, graded_credits),
+                Grades.format_wam_change(self.weighted_marks, self.weighted_credits, weighted_marks, weighted_credits)
+            ]
+
+            # adds the unit back at the retake mark and grade
+            if retake_mark is not None:
+                retake_marks, retake_credits = Grades.get_wam_totals(unit.year_lvl, retake_mark, unit.credit_pts)
+                retake_points, retake_graded = Grades.get_gpa_totals(retake_grade, unit.credit_pts)
+                retake_marks, retake_credits = weighted_marks + retake_marks, weighted_credits + retake_credits
+                impact += [
+                    Grades.format_wam(retake_marks, retake_credits),
+                    Grades.format_gpa(grade_points + retake_points, graded_credits + retake_graded),
+                    Grades.format_wam_change(retake_marks, retake_credits, self.weighted_marks, self.weighted_credits)
+                ]
+
+            # adds the impacts of the unit
+            impacts[unit.unit_code] = impact
+
+        # returns the impacts
+        return impacts
+
+    def update_totals(self, unit: RecordRow, sign: int) -> None:
+        """
+            Adds or subtracts a unit from the running totals.
+
+            Args:
+                unit (RecordRow): the unit to add or subtract.
+                sign (int): 1 to add the unit, -1 to subtract it.
+        """
+
+        # gets unit contribution to the totals
+        weighted_marks, weighted_credits, grade_points, graded_credits = Grades.get_unit_totals(unit)
+
+        # updates running totals
+        self.weighted_marks += sign * weighted_marks
+        self.weighted_credits += sign * weighted_credits
+        self.grade_points += sign * grade_points
+        self.graded_credits += sign * graded_credits
+
+        # updates credit points of the record and the unit's year level
+        self.total_credits += sign * unit.credit_pts
+        self.level_credits[unit.year_lvl] = self.level_credits.get(unit.year_lvl, 0) + sign * unit.credit_pts
+
+        # drops year levels without any credit points left
+        if self.level_credits[unit.year_lvl] == 0:
+            del self.level_credits[unit.year_lvl]
+
+        # updates count of units without a gpa grade
+        if unit.grade not in Grades.GRADE_POINTS:
+            self.ungraded_units += sign
+
+    def check_totals(self) -> bool:
+        """
+            Checks the running totals against a full recompute of the record.
+
+            Returns:
+                bool: whether the running totals are consistent.
         """
 
-        # initialises total grade value and credits
-        total_grade = 0
-        total_credits = 0
-
-        # iterates through each unit in the record
-        for _, _, grade, credit_pts in self.data:
-
-            # gets grade value
-            match grade:
-                case "WN":
-                    grade_value = 0.0
-                case "NH":
-                    grade_value = 0.3
-                case "N":
-                    grade_value = 0.3
-                case "P":
-                    grade_value = 1.0
-                case "C":
-                    grade_value = 2.0
-                case "D":
-                    grade_value = 3.0
-                case "HD":
-                    grade_value = 4.0
-                case _:
-                    continue
-
-            # adds unit grade value and credits to totals
-            total_grade += grade_value * int(credit_pts)
-            total_credits += int(credit_pts)
-
-        # checks if there are no units in the record
-        if total_credits == 0:
-            return "0.000"
-
-        # calculates and returns gpa rounded to 3 decimal places
-        gpa = total_grade / total_credits
-        return f"{gpa:05.3f}"
+        # recomputes the summary in a single pass and compares it to the running totals
+        return self.summary() == RecordSummary.from_record(self.data)
 
     def add_unit(self, unit: list[str]) -> None:
         """
@@ -117,11 +191,15 @@ class Record:
                 unit (list[str]): the unit to add.
         """
 
-        # appends the unit to the data array
+        # parses the unit and appends it to the data array and totals
+        unit = RecordRow.from_row(unit)
         self.data.append(unit)
+        self.update_totals(unit, 1)
+        self.unit_codes.add(unit.unit_code)
 
-        # writes data to file
-        FileManager.write_file("record", self.data)
+        # writes data to file and notifies subscribers
+        FileManager.write_file("record", self.data.to_rows())
+        self.notify(RecordChanged("add", len(self.data) - 1))
 
     def remove_unit(self, unit_no: int) -> None:
         """
@@ -131,8 +209,11 @@ class Record:
                 unit_no (int): the unit to delete.
         """
 
-        # deletes unit from data
-        self.data.pop(unit_no - 1)
+        # deletes unit from data and totals
+        unit = self.data.pop(unit_no - 1)
+        self.update_totals(unit, -1)
+        self.unit_codes.discard(unit.unit_code)
 
-        # writes data to file
-        FileManager.write_file("record", self.data)
+        # writes data to file and notifies subscribers
+        FileManager.write_file("record", self.data.to_rows())
+        self.notify(RecordChanged("remove", unit_no - 1))
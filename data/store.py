@@ -0,0 +1,88 @@
+"""
+    store.py
+
+    Contains the store class.
+"""
+
+from data.record import Record
+from data.wam import WAM
+from data.gpa import GPA
+from data.unit import Unit
+
+class Store:
+    """
+        Holds the single process-wide instance of each data class.
+
+        The record is read from file once and viewed by the WAM and GPA data,
+        so every page works on the same in-memory data.
+    """
+
+    # initialises shared instances
+    record = None
+    wam = None
+    gpa = None
+    unit = None
+
+    @classmethod
+    def get_record(cls) -> Record:
+        """
+            Returns the shared record, loading it on first use.
+
+            Returns:
+                Record: the shared record.
+        """
+
+        # loads the record on first use
+        if cls.record is None:
+            cls.record = Record()
+
+        # returns the shared record
+        return cls.record
+
+    @classmethod
+    def get_wam(cls) -> WAM:
+        """
+            Returns the shared WAM data, loading it on first use.
+
+            Returns:
+                WAM: the shared WAM data.
+        """
+
+        # loads the wam data on first use
+        if cls.wam is None:
+            cls.wam = WAM(cls.get_record())
+
+        # returns the shared wam data
+        return cls.wam
+
+    @classmethod
+    def get_gpa(cls) -> GPA:
+        """
+            Returns the shared GPA data, loading it on first use.
+
+            Returns:
+                GPA: the shared GPA data.
+        """
+
+        # loads the gpa data on first use
+        if cls.gpa is None:
+            cls.gpa = GPA(cls.get_record())
+
+        # returns the shared gpa data
+        return cls.gpa
+
+    @classmethod
+    def get_unit(cls) -> Unit:
+        """
+            Returns the shared unit data, loading it on first use.
+
+            Returns:
+                Unit: the shared unit data.
+        """
+
+        # loads the unit data on first use
+        if cls.unit is None:
+            cls.unit = Unit()
+
+        # returns the shared unit data
+        return cls.unit
@@ -5,8 +5,18 @@
 """
 
 from utils.file_manager import FileManager
-
-class Unit:
+from core.assessments import Assessments
+from core.rows import AssessmentRow
+from data.events import UnitChanged, AssessmentChanged, TargetChanged
+from data.observable import Observable
+
+# the projection needs numpy, which the rest of the app does not
+try:
+    from core.projection import MarkProjection, Projection
+except ImportError:
+    MarkProjection = None
+
+class Unit(Observable):
     """
         Stores and manages the unit information of the student.
     """
@@ -16,15 +26,24 @@ class Unit:
             Initialises the unit data from files.
         """
 
-        # initialises data dictionary
+        # initialises subscribers
+        super().__init__()
+
+        # initialises data and file stamp dictionaries
         self.data = {}
+        self.stamps = {}
+
+        # initialises assessment name sets and weight totals in hundredths of each unit
+        self.names = {}
+        self.weights = {}
 
-        # gets unit files from file manager
-        unit_files = FileManager.get_unit_files()
+        # initialises assessment totals, cached overview rows and average required sweeps of each unit
+        self.totals = {}
+        self.overview = {}
+        self.sweeps = {}
 
-        # adds unit data to dictionary
-        for unit_file in unit_files:
-            self.data[unit_file] = FileManager.read_file(unit_file)
+        # loads unit data from files
+        self.load_units()
 
         # gets target data from file
         target = FileManager.read_file("target")
@@ -48,9 +67,13 @@ class Unit:
                 unit_code (str): the unit code of the unit to add.
         """
 
-        # adds unit to file system and refreshes
+        # adds unit to file system and data and notifies subscribers
         FileManager.create_file(f"{unit_code}")
-        self.reset()
+        self.data[unit_code] = []
+        self.stamps[unit_code] = FileManager.get_file_stamp(unit_code)
+        self.names[unit_code], self.weights[unit_code] = self.get_index([])
+        self.set_totals(unit_code, Assessments.get_totals([]))
+        self.notify(UnitChanged("add", unit_code))
 
     def remove_unit(self, unit_code: str) -> None:
         """
@@ -60,9 +83,16 @@ class Unit:
                 unit_code (str): the unit code of the unit to remove.
         """
 
-        # removes unit from file system and refreshes
+        # removes unit from file system and data and notifies subscribers
         FileManager.delete_file(f"{unit_code}")
-        self.reset()
+        self.data.pop(unit_code, None)
+        self.stamps.pop(unit_code, None)
+        self.names.pop(unit_code, None)
+        self.weights.pop(unit_code, None)
+        self.totals.pop(unit_code, None)
+        self.overview.pop(unit_code, None)
+        self.sweeps.pop(unit_code, None)
+        self.notify(UnitChanged("remove", unit_code))
 
     def add_assessment(self, unit_code: str, assessment: list[str]) -> None:
         """
@@ -73,11 +103,22 @@ class Unit:
                 assessment (list[str]): the assessment to add.
         """
 
-        # appends the assessment to the unit in the data dictionary
+        # parses the assessment and appends it to the unit in the data dictionary
+        assessment = AssessmentRow.from_row(assessment)
         self.data[unit_code].append(assessment)
 
-        # saves data to file
-        FileManager.write_file(f"{unit_code}", self.data[unit_code])
+        # adds the assessment to the unit's name set and weight total
+        self.names[unit_code].add(assessment.name)
+        self.weights[unit_code] += round(assessment.weight * 100)
+
+        # adds the assessment to the unit's totals in the same order as a full recompute
+        total_mark, total_weight = self.totals[unit_code]
+        self.set_totals(unit_code, (total_mark + assessment.weight * (assessment.score / assessment.total), total_weight + assessment.weight))
+
+        # saves data to file and notifies subscribers
+        FileManager.write_file(f"{unit_code}", [assessment.to_row() for assessment in self.data[unit_code]])
+        self.stamps[unit_code] = FileManager.get_file_stamp(unit_code)
+        self.notify(AssessmentChanged("add", unit_code, len(self.data[unit_code]) - 1))
 
     def remove_assessment(self, unit_code: str, assessment_no: int) -> None:
         """
@@ -89,10 +130,78 @@ class Unit:
         """
 
         # removes the assessment from the unit in the data dictionary
-        self.data[unit_code].pop(assessment_no)
+        assessment = self.data[unit_code].pop(assessment_no)
+
+        # removes the assessment from the unit's name set and weight total
+        self.names[unit_code].discard(assessment.name)
+        self.weights[unit_code] -= round(assessment.weight * 100)
+
+        # recomputes the unit's totals so removals do not leave rounding drift
+        self.set_totals(unit_code, Assessments.get_totals(self.data[unit_code]))
+
+        # saves data to file and notifies subscribers
+        FileManager.write_file(f"{unit_code}", [assessment.to_row() for assessment in self.data[unit_code]])
+        self.stamps[unit_code] = FileManager.get_file_stamp(unit_code)
+        self.notify(AssessmentChanged("remove", unit_code, assessment_no))
+
+    def set_totals(self, unit_code: str, totals: tuple[float, float]) -> None:
+        """
+            Sets the totals of a unit, sweeping the average required for every target mark and dropping its overview row.
+
+            Args:
+                unit_code (str): the unit code of the unit.
+                totals (tuple[float, float]): the total weighted mark and total weight.
+        """
+
+        # sets the totals and the sweep built from them
+        self.totals[unit_code] = totals
+        self.sweeps[unit_code] = Assessments.get_average_required_sweep(*totals)
+        self.overview.pop(unit_code, None)
+
+    @staticmethod
+    def get_index(assessments: list[AssessmentRow]) -> tuple[set[str], int]:
+        """
+            Builds the assessment name set and weight total of a unit.
+
+            Args:
+                assessments (list[AssessmentRow]): the assessments of the unit.
+
+            Returns:
+                tuple[set[str], int]: the assessment names and the total weight in hundredths.
+        """
+
+        # returns the names and total weight in hundredths of the assessments
+        return {assessment.name for assessment in assessments}, sum(round(assessment.weight * 100) for assessment in assessments)
+
+    def has_assessment(self, unit_code: str, name: str) -> bool:
+        """
+            Checks if a unit already has an assessment with a name.
+
+            Args:
+                unit_code (str): the unit code of the unit.
+                name (str): the assessment name.
+
+            Returns:
+                bool: whether the assessment name is taken.
+        """
+
+        # looks up the name in the unit's name set
+        return name in self.names[unit_code]
+
+    def can_add_weight(self, unit_code: str, weight: float) -> bool:
+        """
+            Checks if an assessment weight fits in a unit without going over 100.
+
+            Args:
+                unit_code (str): the unit code of the unit.
+                weight (float): the weight to add.
+
+            Returns:
+                bool: whether the weight fits.
+        """
 
-        # saves data to file
-        FileManager.write_file(f"{unit_code}", self.data[unit_code])
+        # compares the running weight total in hundredths
+        return self.weights[unit_code] + round(weight * 100) <= 10000
 
     def get_overview(self) -> list[list[str]]:
         """
@@ -102,12 +211,12 @@ class Unit:
                 list[list[str]]: the overview data.
         """
 
-        # gets overview for each unit and returns overview data
+        # gets cached or rebuilt overview for each unit and returns overview data
         return [self.get_unit_overview(unit_code) for unit_code in self.data]
 
     def get_unit_overview(self, unit_code: str) -> list[str]:
         """
-            Gets the overview for a unit.
+            Gets the overview for a unit, rebuilding it from the unit's totals if it has changed.
 
             Args:
                 unit_code (str): the unit code of the unit.
@@ -116,77 +225,74 @@ class Unit:
                 list[str]: the unit overview data.
         """
 
-        # sets target if target type is grade
-        if self.target_type == "Grade":
-            match self.target:
-                case "P":
-                    target = 50
-                case "C":
-                    target = 60
-                case "D":
-                    target = 70
-                case "HD":
-                    target = 80
-
-        # sets target if target type is mark
-        elif self.target_type == "Mark":
-            target = int(self.target)
-
-        # initialises mark and weight totals
-        total_mark = 0
-        total_weight = 0
-
-        # iterates through each assessment
-        for _, weight, score, total in self.data[unit_code]:
-
-            # adds mark and weight of assessment to totals
-            total_mark += float(weight) * (float(score) / float(total))
-            total_weight += float(weight)
-
-        # checks if at least one assessment is in data
-        if total_weight > 0:
-
-            # calculates mark
-            mark = round(total_mark * 100 / total_weight)
-
-            # calculates grade
-            if mark < 50:
-                grade = "N"
-            elif mark < 60:
-                grade = "P"
-            elif mark < 70:
-                grade = "C"
-            elif mark < 80:
-                grade = "D"
-            else:
-                grade = "HD"
+        # rebuilds the overview row from the cached totals if it was dropped
+        if unit_code not in self.overview:
+            target_mark = Assessments.get_target_mark(self.target_type, self.target)
+            self.overview[unit_code] = Assessments.get_overview_row(unit_code, *self.totals[unit_code], target_mark)
 
-            # sets mark/grade string
-            mark_grade = f"{mark} ({grade})"
+        # returns unit overview
+        return self.overview[unit_code]
 
-        # no assessments entered
-        else:
-            mark_grade = "-"
+    def get_average_required(self, unit_code: str, target_mark: int) -> str:
+        """
+            Looks up the average required of a unit for a target mark in its sweep.
 
-        # calculates remaining assessments
-        remaining = f"{100 - total_weight:.2f}"
+            Args:
+                unit_code (str): the unit code of the unit.
+                target_mark (int): the target mark.
 
-        # calculates average required
-        if total_weight < 100:
-            avg_req_float = (target - total_mark) * 100 / (100 - total_weight)
-        else:
-            avg_req_float = -1
+            Returns:
+                str: the average required, or "-" if the target cannot be reached.
+        """
 
-        # checks if average required is feasible
-        if avg_req_float < 0 or avg_req_float > 100:
-            avg_req = "-"
+        # calculates marks outside the sweep directly
+        if target_mark not in Assessments.SWEEP_MARKS:
+            return Assessments.get_average_required(*self.totals[unit_code], target_mark)
 
-        # sets average required string
-        else:
-            avg_req = f"{avg_req_float:.2f}"
+        # returns the average required from the sweep
+        return Assessments.format_average_required(self.sweeps[unit_code][target_mark - Assessments.SWEEP_MARKS.start])
 
-        # returns unit overview
-        return [unit_code, mark_grade, remaining, avg_req]
+    def get_requirements(self) -> dict[str, dict[str, str]]:
+        """
+            Looks up the average required of each unit for each target grade in its sweep.
+
+            Returns:
+                dict[str, dict[str, str]]: the average required for each grade, by unit code.
+        """
+
+        # looks up the minimum mark of each grade in each unit's sweep
+        return {unit_code: {grade: self.get_average_required(unit_code, target_mark) for grade, target_mark in Assessments.TARGET_MARKS.items()} for unit_code in self.data}
+
+    def update_average_required(self) -> None:
+        """
+            Updates the average required of each cached overview row for the current target.
+        """
+
+        # gets the target mark
+        target_mark = Assessments.get_target_mark(self.target_type, self.target)
+
+        # replaces each cached row with its average required looked up in the unit's sweep
+        for unit_code, row in self.overview.items():
+            self.overview[unit_code] = row[:3] + [self.get_average_required(unit_code, target_mark)]
+
+    def get_projection(self, weighted_marks: int = 0, weighted_credits: int = 0) -> "Projection":
+        """
+            Projects the grade bands of each unit and the WAM they give by resampling past assessment results.
+
+            Args:
+                weighted_marks (int): the weighted marks of the record in half weights.
+                weighted_credits (int): the weighted credits of the record in half weights.
+
+            Returns:
+                Projection: the grade bands and WAM samples.
+        """
+
+        # checks if numpy is available
+        if MarkProjection is None:
+            raise ImportError("Projection requires NumPy, install it with: pip install numpy")
+
+        # projects the units from the record totals
+        return MarkProjection().project(self.data, weighted_marks, weighted_credits)
 
     def get_unit_assessments(self, unit_code: str) -> list[list[str]]:
         """
@@ -200,7 +306,7 @@ class Unit:
         """
 
         # gets and returns the assessments for the unit
-        return [[assessment, weight, f"{float(score) * 100 / float(total):.2f}"] for assessment, weight, score, total in self.data[unit_code]]
+        return [[assessment.name, f"{assessment.weight:.2f}", f"{assessment.score * 100 / assessment.total:.2f}"] for assessment in self.data[unit_code]]
 
     def get_target(self) -> str:
         """
@@ -226,25 +332,79 @@ class Unit:
         self.target_type = target_type
         self.target = target
 
-        # saves new target to file
+        # updates the average required of the cached overview rows
+        self.update_average_required()
+
+        # saves new target to file and notifies subscribers
         FileManager.write_file("target", [[self.target_type, self.target]])
+        self.notify(TargetChanged(self.target_type, self.target))
 
-    def reset(self) -> None:
+    def load_units(self) -> None:
         """
-            Reinitialises the unit data from files.
+            Loads unit data from files, reading only files that were added or changed.
         """
 
-        # initialises unit dictionary
-        self.data = {}
+        # initialises new data, file stamp, name set, weight total, totals, overview and sweep dictionaries
+        data = {}
+        stamps = {}
+        names = {}
+        weights = {}
+        totals = {}
+        overview = {}
+        sweeps = {}
+
+        # iterates through unit files from file manager
+        for unit_file in FileManager.get_unit_files():
+
+            # gets stamp of the unit file
+            stamp = FileManager.get_file_stamp(unit_file)
+
+            # keeps unit data if the file is unchanged
+            if stamp is not None and unit_file in self.data and self.stamps.get(unit_file) == stamp:
+                data[unit_file] = self.data[unit_file]
+                names[unit_file] = self.names[unit_file]
+                weights[unit_file] = self.weights[unit_file]
+                totals[unit_file] = self.totals[unit_file]
+                sweeps[unit_file] = self.sweeps[unit_file]
+                if unit_file in self.overview:
+                    overview[unit_file] = self.overview[unit_file]
+
+            # reads and parses unit data if the file is new or changed
+            else:
+                data[unit_file] = [AssessmentRow.from_row(row) for row in FileManager.read_file(unit_file)]
+                names[unit_file], weights[unit_file] = self.get_index(data[unit_file])
+                totals[unit_file] = Assessments.get_totals(data[unit_file])
+                sweeps[unit_file] = Assessments.get_average_required_sweep(*totals[unit_file])
+
+            # stores stamp of the unit file
+            stamps[unit_file] = stamp
+
+        # sets data, stamps, name sets, weight totals, totals, overview rows and sweeps, dropping removed units
+        self.data = data
+        self.stamps = stamps
+        self.names = names
+        self.weights = weights
+        self.totals = totals
+        self.overview = overview
+        self.sweeps = sweeps
 
-        # gets unit files from file manager
-        unit_files = FileManager.get_unit_files()
+    def reset(self) -> None:
+        """
+            Reloads the unit data and target from files.
+        """
 
-        # adds unit data to dictionary
-        for unit_file in unit_files:
-            self.data[unit_file] = FileManager.read_file(unit_file)
+        # reloads changed unit files
+        self.load_units()
 
         # gets target data from file
         target = FileManager.read_file("target")
+        changed = (self.target_type, self.target) != (target[0][0], target[0][1])
         self.target = target[0][1]
         self.target_type = target[0][0]
+
+        # updates the average required of the cached overview rows if the target changed
+        if changed:
+            self.update_average_required()
+
+        # notifies subscribers
+        self.notify(UnitChanged("reload"))
@@ -5,20 +5,38 @@
 """
 
 from utils.file_manager import FileManager
+from core.grades import Grades
+from core.rows import WAMRow
+from data.events import WAMChanged
+from data.observable import Observable
+from data.record import Record
 
-class WAM:
+class WAM(Observable):
     """
         Stores and manages the WAM information of the student.
     """
 
-    def __init__(self) -> None:
+    def __init__(self, record: Record) -> None:
         """
-            Initialises the WAM data from files.
+            Initialises the WAM data from the shared record and file.
+
+            Args:
+                record (Record): the shared record.
         """
 
-        # gets data from files
-        self.record = [[unit_code[3], mark, credit_pts] for unit_code, mark, _, credit_pts in FileManager.read_file("record")]
-        self.data = FileManager.read_file("wam")
+        # initialises subscribers
+        super().__init__()
+
+        # sets the shared record and gets extra data from file
+        self.record = record
+        self.data = [WAMRow.from_row(row) for row in FileManager.read_file("wam")]
+
+        # initialises the overlay totals of the extra units and the weighted credits of those without a mark
+        self.extra_marks, self.extra_credits = Grades.get_extra_wam_totals(self.data)
+        self.planned_credits = Grades.get_planned_wam_credits(self.data)
+
+        # passes record change events on to subscribers
+        self.record.subscribe(self.notify)
 
     def get_record(self) -> list[list[str]]:
         """
@@ -29,7 +47,7 @@ class WAM:
         """
 
         # returns the record array
-        return [[i + 1] + self.record[i] for i in range(len(self.record))]
+        return [[i + 1, unit_code[3], mark, credit_pts] for i, (unit_code, mark, _, credit_pts) in enumerate(self.record.data.to_rows())]
 
     def get_data(self) -> list[list[str]]:
         """
@@ -40,73 +58,98 @@ class WAM:
         """
 
         # returns the data array
-        return [[i + len(self.record) + 1] + self.data[i] for i in range(len(self.data))]
+        return [[i + len(self.record.data) + 1] + unit.to_row() for i, unit in enumerate(self.data)]
 
     def get_current_wam(self) -> str:
         """
-            Calculates and returns the current WAM.
+            Returns the current WAM from the record.
 
             Returns:
                 str: the WAM rounded to 3 decimal places.
         """
 
-        # initialises total weighted marks and credits
-        weighted_marks = 0
-        weighted_credits = 0
+        # returns the wam of the shared record
+        return self.record.get_wam()
+
+    def get_calculated_wam(self) -> str:
+        """
+            Calculates and returns the WAM with extra data.
 
-        # iterates through each unit in the record
-        for year_lvl, mark, credit_pts in self.record:
+            Returns:
+                str: the WAM rounded to 3 decimal places.
+        """
 
-            # checks if there are no marks
-            if mark == "-": continue
+        # formats and returns wam from the record totals and the overlay totals
+        return Grades.format_wam(self.record.weighted_marks + self.extra_marks, self.record.weighted_credits + self.extra_credits)
 
-            # gets weighting of unit
-            weight = 0.5 if year_lvl == '1' else 1.0
+    def get_target_mark(self, target: float | str) -> int | None:
+        """
+            Returns the lowest mark that reaches a target WAM if scored in every extra unit without a mark.
 
-            # adds unit weighted marks and credits to totals
-            weighted_marks += int(mark) * int(credit_pts) * weight
-            weighted_credits += int(credit_pts) * weight
+            Args:
+                target (float | str): the target WAM.
 
-        # checks if there are no units in the record
-        if weighted_credits == 0:
-            return "00.000"
+            Returns:
+                int | None: the mark, or None if the target cannot be reached.
+        """
 
-        # calculates and returns wam rounded to 3 decimal places
-        wam = weighted_marks / weighted_credits
-        return f"{wam:06.3f}"
+        # solves from the record, overlay and planned totals
+        return Grades.get_wam_target_mark(self.record.weighted_marks + self.extra_marks, self.record.weighted_credits + self.extra_credits, self.planned_credits, target)
 
-    def get_calculated_wam(self) -> str:
+    def solve_target(self, target: float | str) -> tuple[int | None, dict[int, int] | None]:
         """
-            Calculates and returns the WAM with extra data.
+            Solves for the marks the extra units without a mark need to reach a target WAM.
+
+            Args:
+                target (float | str): the target WAM.
 
             Returns:
-                str: the WAM rounded to 3 decimal places.
+                tuple[int | None, dict[int, int] | None]: the uniform mark and the mark of each planned unit by unit number, or None if the target cannot be reached.
         """
 
-        # initialises total weighted marks and credits
-        weighted_marks = 0
-        weighted_credits = 0
+        # gets the unit numbers, year levels and credit points of the units without a mark
+        offset = len(self.record.data) + 1
+        unit_nos = [i + offset for i, unit in enumerate(self.data) if unit.mark is None]
+        planned = [(unit.year_lvl, unit.credit_pts) for unit in self.data if unit.mark is None]
 
-        # iterates through each unit in the record
-        for year_lvl, mark, credit_pts in self.record + self.data:
+        # solves for the uniform mark and the marks of each unit
+        mark = self.get_target_mark(target)
+        marks = Grades.get_wam_target_marks(self.record.weighted_marks + self.extra_marks, self.record.weighted_credits + self.extra_credits, planned, target)
 
-            # checks if there are no marks
-            if mark == "-": continue
+        # returns the marks by unit number
+        return mark, None if marks is None else dict(zip(unit_nos, marks))
 
-            # gets weighting of unit
-            weight = 0.5 if year_lvl == '1' else 1.0
+    def update_totals(self, unit: WAMRow, sign: int) -> None:
+        """
+            Adds or subtracts an extra unit from the overlay totals.
 
-            # adds unit weighted marks and credits to totals
-            weighted_marks += int(mark) * int(credit_pts) * weight
-            weighted_credits += int(credit_pts) * weight
+            Args:
+                unit (WAMRow): the unit to add or subtract.
+                sign (int): 1 to add the unit, -1 to subtract it.
+        """
+
+        # gets unit contribution to the totals
+        unit_marks, unit_credits = Grades.get_wam_totals(unit.year_lvl, unit.mark, unit.credit_pts)
 
-        # checks if there are no units in the record
-        if weighted_credits == 0:
-            return "00.000"
+        # updates overlay totals
+        self.extra_marks += sign * unit_marks
+        self.extra_credits += sign * unit_credits
 
-        # calculates and returns wam rounded to 3 decimal places
-        wam = weighted_marks / weighted_credits
-        return f"{wam:06.3f}"
+        # updates the planned weighted credits if the unit has no mark
+        if unit.mark is None:
+            self.planned_credits += sign * Grades.get_wam_totals(unit.year_lvl, 0, unit.credit_pts)[1]
+
+    def check_totals(self) -> bool:
+        """
+            Checks the overlay totals against a full recompute of the extra units.
+
+            Returns:
+                bool: whether the overlay totals are consistent.
+        """
+
+        # recomputes totals and compares them to the overlay totals
+        return (self.extra_marks, self.extra_credits) == Grades.get_extra_wam_totals(self.data) and \
+               self.planned_credits == Grades.get_planned_wam_credits(self.data)
 
     def add_unit(self, unit: list[str]) -> None:
         """
@@ -116,11 +159,14 @@ class WAM:
                 unit (list[str]): the unit to add.
         """
 
-        # appends the unit to the data array
+        # parses the unit and appends it to the data array and overlay totals
+        unit = WAMRow.from_row(unit)
         self.data.append(unit)
+        self.update_totals(unit, 1)
 
-        # saves data to file
-        FileManager.write_file("wam", self.data)
+        # saves data to file and notifies subscribers
+        FileManager.write_file("wam", [unit.to_row() for unit in self.data])
+        self.notify(WAMChanged("add", len(self.data) - 1))
 
     def remove_unit(self, unit_no: int) -> None:
         """
@@ -130,17 +176,10 @@ class WAM:
                 unit_no (int): the unit to delete.
         """
 
-        # deletes unit from data
-        self.data.pop(unit_no - len(self.record) - 1)
-
-        # saves data to file
-        FileManager.write_file("wam", self.data)
-
-    def reset(self) -> None:
-        """
-            Reinitialises the WAM data from files.
-        """
+        # deletes unit from data and overlay totals
+        index = unit_no - len(self.record.data) - 1
+        self.update_totals(self.data.pop(index), -1)
 
-        # gets data from files
-        self.record = [[unit_code[3], mark, credit_pts] for unit_code, mark, _, credit_pts in FileManager.read_file("record")]
-        self.data = FileManager.read_file("wam")
+        # saves data to file and notifies subscribers
+        FileManager.write_file("wam", [unit.to_row() for unit in self.data])
+        self.notify(WAMChanged("remove", index))
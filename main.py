@@ -5,15 +5,22 @@
 """
 
 from app.main_window import MainWindow
+from utils.file_manager import FileManager
 
 def main() -> None:
     """
         Starts the application.
     """
 
+    # opens the profile database or bundle in the data folder if there is one, otherwise appends changes to journals
+    FileManager.use_backend(FileManager.open_backend(FileManager.folder, journaled=True))
+
     # initialises main window and starts application
     app = MainWindow()
     app.start()
 
+    # compacts journals back into the data files or closes the profile file on exit
+    FileManager.close()
+
 if __name__ == "__main__":
     main()
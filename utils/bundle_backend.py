@@ -0,0 +1,173 @@
+"""
+    bundle_backend.py
+
+    Contains the bundle storage backend class.
+"""
+
+import os
+from re import compile
+from utils.storage_backend import StorageBackend
+
+class BundleBackend(StorageBackend):
+    """
+        Stores all files in a single bundle file.
+
+        The bundle is read and parsed once into memory, every read is served
+        from memory and every write rewrites the bundle atomically. Each file
+        in the bundle is a "filename,row count" header line followed by its
+        comma-separated rows.
+    """
+
+    def __init__(self, path: str) -> None:
+        """
+            Reads and parses the bundle.
+
+            Args:
+                path (str): the path of the bundle file.
+        """
+
+        # sets bundle path and initialises files and versions dictionaries
+        self.path = path
+        self.files = {}
+        self.versions = {}
+
+        # attempts to open the bundle
+        try:
+            with open(path, "r") as file:
+                lines = file.read().splitlines()
+
+        # bundle does not exist
+        except FileNotFoundError:
+            lines = []
+
+        # file is not text
+        except UnicodeDecodeError:
+            raise ValueError(f"not a bundle file: {path}") from None
+
+        # parses each file in the bundle
+        index = 0
+        while index < len(lines):
+
+            # reads the header of the file, checking it is followed by its rows
+            try:
+                filename, count = lines[index].rsplit(",", 1)
+                count = int(count)
+            except ValueError:
+                raise ValueError(f"not a bundle file: {path}") from None
+            if not 0 <= count <= len(lines) - index - 1:
+                raise ValueError(f"not a bundle file: {path}")
+
+            # reads the rows of the file
+            self.files[filename] = [line.split(",") for line in lines[index + 1:index + 1 + count]]
+            index += count + 1
+
+    def read_file(self, filename: str) -> list[list[str]]:
+        """
+            Reads the rows of a file from memory.
+
+            Args:
+                filename (str): the name of the file to read.
+
+            Returns:
+                list[list[str]]: the contents of the file.
+        """
+
+        # returns a copy of the file rows
+        return [line[:] for line in self.files.get(filename, [])]
+
+    def write_file(self, filename: str, data: list[list[str]]) -> None:
+        """
+            Replaces the rows of a file and rewrites the bundle.
+
+            Args:
+                filename (str): the name of the file to write to.
+                data (list[list[str]]): the data to write to the file.
+        """
+
+        # stores a copy of the rows and saves the bundle
+        self.files[filename] = [line[:] for line in data]
+        self.versions[filename] = self.versions.get(filename, 0) + 1
+        self.save()
+
+    def write_files(self, files: dict[str, list[list[str]]]) -> None:
+        """
+            Replaces the rows of several files with a single bundle rewrite.
+
+            Args:
+                files (dict[str, list[list[str]]]): the data of each file.
+        """
+
+        # stores a copy of the rows of each file and saves the bundle
+        for filename, data in files.items():
+            self.files[filename] = [line[:] for line in data]
+            self.versions[filename] = self.versions.get(filename, 0) + 1
+        self.save()
+
+    def create_file(self, filename: str) -> None:
+        """
+            Creates an empty file.
+
+            Args:
+                filename (str): the name of the file to create.
+        """
+
+        # writes an empty file
+        self.write_file(filename, [])
+
+    def delete_file(self, filename: str) -> None:
+        """
+            Deletes a file.
+
+            Args:
+                filename (str): the name of the file to delete.
+        """
+
+        # removes the file and saves the bundle
+        if self.files.pop(filename, None) is not None:
+            self.versions[filename] = self.versions.get(filename, 0) + 1
+            self.save()
+
+    def get_unit_files(self) -> list[str]:
+        """
+            Finds the filenames of all unit files in the bundle.
+
+            Returns:
+                list[str]: the list of unit filenames.
+        """
+
+        # sets the unit filename regular expression
+        unit_filename = compile(r"[A-Z]{3}\d{4}")
+
+        # returns all unit filenames
+        return [filename for filename in self.files if unit_filename.match(filename)]
+
+    def get_file_stamp(self, filename: str) -> int:
+        """
+            Gets the number of times a file was changed through this backend.
+
+            Args:
+                filename (str): the name of the file.
+
+            Returns:
+                int: the version of the file.
+        """
+
+        # returns the version of the file
+        return self.versions.get(filename, 0)
+
+    def save(self) -> None:
+        """
+            Writes the bundle to a temporary file and swaps it in.
+        """
+
+        # builds the lines of the bundle
+        lines = []
+        for filename, data in self.files.items():
+            lines.append(f"{filename},{len(data)}")
+            lines.extend(",".join(line) for line in data)
+
+        # writes the bundle atomically
+        temp_path = os.path.join(os.path.dirname(self.path), f".{os.path.basename(self.path)}.tmp")
+        with open(temp_path, "w") as file:
+            file.write("".join(line + "\n" for line in lines))
+        os.replace(temp_path, self.path)
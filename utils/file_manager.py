@@ -5,16 +5,166 @@
 """
 
 import os
-from re import compile
+from utils.storage_backend import StorageBackend
+from utils.text_backend import TextBackend
+from utils.bundle_backend import BundleBackend
+from utils.sqlite_backend import SQLiteBackend
 
 class FileManager:
     """
         Manages all files read and written in the program.
+
+        Files are read and written through a storage backend, which defaults
+        to comma-separated text files in the GradeCalculator folder. A data
+        folder holding a SQLite database or bundle file is opened through
+        that file instead, so the whole profile is loaded from one file.
     """
 
-    # initialises folder path and creates the directory
+    # initialises folder path, created when the default backend is first used
     folder = os.path.join(os.path.expanduser("~"), "GradeCalculator")
-    os.makedirs(folder, exist_ok=True)
+
+    # sets the file names of the single-file storage formats in a data folder
+    profile_files = {"sqlite": "profile.db", "bundle": "profile.bundle"}
+
+    # initialises the storage backend, set on first use
+    backend = None
+
+    @classmethod
+    def get_backend(cls) -> StorageBackend:
+        """
+            Returns the storage backend, creating the default one on first use.
+
+            Returns:
+                StorageBackend: the storage backend.
+        """
+
+        # creates the default backend on first use
+        if cls.backend is None:
+            cls.backend = cls.open_backend(cls.folder)
+
+        # returns the storage backend
+        return cls.backend
+
+    @classmethod
+    def get_format(cls, folder: str) -> str:
+        """
+            Finds the storage format of a data folder.
+
+            Args:
+                folder (str): the data folder.
+
+            Returns:
+                str: "sqlite" or "bundle" if the folder holds that profile file, otherwise "text".
+        """
+
+        # returns the first single-file format found in the folder
+        for format, filename in cls.profile_files.items():
+            if os.path.isfile(os.path.join(folder, filename)):
+                return format
+
+        # defaults to text files
+        return "text"
+
+    @classmethod
+    def open_backend(cls, folder: str, format: str | None = None, journaled: bool = False) -> StorageBackend:
+        """
+            Opens the storage backend of a data folder, creating the folder if needed.
+
+            Args:
+                folder (str): the data folder.
+                format (str | None): "text", "bundle" or "sqlite", or None for the format the folder already uses.
+                journaled (bool): whether text files are journaled.
+
+            Returns:
+                StorageBackend: the storage backend.
+        """
+
+        # creates the directory and gets the format to open
+        os.makedirs(folder, exist_ok=True)
+        format = format or cls.get_format(folder)
+
+        # opens the profile file of a single-file format
+        match format:
+            case "sqlite":
+                return SQLiteBackend(os.path.join(folder, cls.profile_files["sqlite"]))
+            case "bundle":
+                return BundleBackend(os.path.join(folder, cls.profile_files["bundle"]))
+
+        # opens the text files
+        return TextBackend(folder, journaled=journaled)
+
+    @classmethod
+    def use_backend(cls, backend: StorageBackend) -> None:
+        """
+            Switches to a different storage backend.
+
+            Args:
+                backend (StorageBackend): the storage backend to use.
+        """
+
+        # closes the current backend and sets the new one
+        cls.close()
+        cls.backend = backend
+
+    @classmethod
+    def migrate(cls, source: StorageBackend, target: StorageBackend) -> None:
+        """
+            Copies every file from one storage backend to another.
+
+            Args:
+                source (StorageBackend): the backend to copy from.
+                target (StorageBackend): the backend to copy to.
+        """
+
+        # reads all files from the source backend
+        unit_files = source.get_unit_files()
+        files = {filename: source.read_file(filename) for filename in ["record", "wam", "gpa", "target"] + unit_files}
+
+        # deletes units the target has that the source does not, then writes all files to the target backend
+        for filename in set(target.get_unit_files()) - set(unit_files):
+            target.delete_file(filename)
+        target.write_files(files)
+
+    @classmethod
+    def migrate_folder(cls, folder: str, format: str) -> str:
+        """
+            Converts a data folder to another storage format.
+
+            Args:
+                folder (str): the data folder.
+                format (str): the format to convert to, either "text", "bundle" or "sqlite".
+
+            Returns:
+                str: the format the folder was converted from.
+        """
+
+        # copies every file from the current format to the new one
+        current = cls.get_format(folder)
+        source = cls.open_backend(folder, current, journaled=True)
+        target = cls.open_backend(folder, format)
+        cls.migrate(source, target)
+        source.close()
+        target.close()
+
+        # removes the old profile file so the folder opens in the new format, leaving text files as a backup
+        if current in cls.profile_files:
+            path = os.path.join(folder, cls.profile_files[current])
+            for suffix in ["", "-wal", "-shm"]:
+                if os.path.exists(path + suffix):
+                    os.remove(path + suffix)
+
+        # returns the old format
+        return current
+
+    @classmethod
+    def close(cls) -> None:
+        """
+            Closes the storage backend.
+        """
+
+        # closes the current backend if one is in use
+        if cls.backend is not None:
+            cls.backend.close()
 
     @classmethod
     def read_file(cls, filename: str) -> list[list[str]]:
@@ -28,18 +178,8 @@ class FileManager:
                 list[list[str]]: the contents of the file.
         """
 
-        # attempts to open the file
-        try:
-            with open(os.path.join(cls.folder, filename), "r") as file:
-
-                # returns the table of contents in the file
-                return [line.strip().split(",") for line in file]
-
-        # file does not exist
-        except FileNotFoundError:
-
-            # returns an empty array
-            return []
+        # reads the file from the backend
+        return cls.get_backend().read_file(filename)
 
     @classmethod
     def write_file(cls, filename: str, data: list[list[str]]) -> None:
@@ -51,15 +191,8 @@ class FileManager:
                 data (list[list[str]]): the data to write to the file.
         """
 
-        # opens the file
-        with open(os.path.join(cls.folder, filename), "w") as file:
-
-            # iterates through the data
-            for index, line in enumerate(data):
-
-                # writes a space-separated line of the data line
-                file.write(",".join(line))
-                if index < len(data) - 1: file.write("\n")
+        # writes the file to the backend
+        cls.get_backend().write_file(filename, data)
 
     @classmethod
     def create_file(cls, filename: str) -> None:
@@ -70,12 +203,8 @@ class FileManager:
                 filename (str): the name of the file to created.
         """
 
-        # gets filepath
-        filepath = os.path.join(cls.folder, filename)
-
-        # creates file
-        with open(filepath, "w") as file:
-            pass
+        # creates the file in the backend
+        cls.get_backend().create_file(filename)
 
     @classmethod
     def delete_file(cls, filename: str) -> None:
@@ -86,14 +215,23 @@ class FileManager:
                 filename (str): the name of the file to delete.
         """
 
-        # gets filepath
-        filepath = os.path.join(cls.folder, filename)
+        # deletes the file from the backend
+        cls.get_backend().delete_file(filename)
 
-        # checks if file exists
-        if os.path.exists(filepath):
+    @classmethod
+    def get_file_stamp(cls, filename: str) -> object:
+        """
+            Gets a stamp that changes whenever a file changes.
 
-            # deletes file
-            os.remove(filepath)
+            Args:
+                filename (str): the name of the file.
+
+            Returns:
+                object: the stamp of the file, or None if it cannot be stamped.
+        """
+
+        # returns the file stamp from the backend
+        return cls.get_backend().get_file_stamp(filename)
 
     @classmethod
     def get_unit_files(cls) -> list[str]:
@@ -104,14 +242,5 @@ class FileManager:
                 list[str]: the list of unit filenames.
         """
 
-        # sets the unit filename regular expression
-        unit_filename = compile(r"[A-Z]{3}\d{4}")
-
-        # finds all unit filenames
-        unit_files = [
-            file for file in os.listdir(cls.folder)
-            if os.path.isfile(os.path.join(cls.folder, file)) and unit_filename.match(file)
-        ]
-
-        # returns the list of unit filenames
-        return unit_files
+        # returns the unit files from the backend
+        return cls.get_backend().get_unit_files()
@@ -0,0 +1,110 @@
+"""
+    memory_backend.py
+
+    Contains the memory storage backend class.
+"""
+
+from re import compile
+from utils.storage_backend import StorageBackend
+
+class MemoryBackend(StorageBackend):
+    """
+        Stores all files in memory only.
+
+        Nothing is read from or written to disk, so profiles built from
+        other sources, such as rows streamed on standard input, can be used
+        wherever a storage backend is expected.
+    """
+
+    def __init__(self, files: dict[str, list[list[str]]] | None = None) -> None:
+        """
+            Initialises the backend.
+
+            Args:
+                files (dict[str, list[list[str]]] | None): the initial data of each file.
+        """
+
+        # initialises files and versions dictionaries
+        self.files = {}
+        self.versions = {}
+
+        # stores the initial files
+        self.write_files(files or {})
+
+    def read_file(self, filename: str) -> list[list[str]]:
+        """
+            Reads the rows of a file from memory.
+
+            Args:
+                filename (str): the name of the file to read.
+
+            Returns:
+                list[list[str]]: the contents of the file.
+        """
+
+        # returns a copy of the file rows
+        return [line[:] for line in self.files.get(filename, [])]
+
+    def write_file(self, filename: str, data: list[list[str]]) -> None:
+        """
+            Replaces the rows of a file.
+
+            Args:
+                filename (str): the name of the file to write to.
+                data (list[list[str]]): the data to write to the file.
+        """
+
+        # stores a copy of the rows
+        self.files[filename] = [line[:] for line in data]
+        self.versions[filename] = self.versions.get(filename, 0) + 1
+
+    def create_file(self, filename: str) -> None:
+        """
+            Creates an empty file.
+
+            Args:
+                filename (str): the name of the file to create.
+        """
+
+        # writes an empty file
+        self.write_file(filename, [])
+
+    def delete_file(self, filename: str) -> None:
+        """
+            Deletes a file.
+
+            Args:
+                filename (str): the name of the file to delete.
+        """
+
+        # removes the file
+        if self.files.pop(filename, None) is not None:
+            self.versions[filename] = self.versions.get(filename, 0) + 1
+
+    def get_unit_files(self) -> list[str]:
+        """
+            Finds the filenames of all unit files in memory.
+
+            Returns:
+                list[str]: the list of unit filenames.
+        """
+
+        # sets the unit filename regular expression
+        unit_filename = compile(r"[A-Z]{3}\d{4}")
+
+        # returns all unit filenames
+        return [filename for filename in self.files if unit_filename.match(filename)]
+
+    def get_file_stamp(self, filename: str) -> int:
+        """
+            Gets the number of times a file was changed through this backend.
+
+            Args:
+                filename (str): the name of the file.
+
+            Returns:
+                int: the version of the file.
+        """
+
+        # returns the version of the file
+        return self.versions.get(filename, 0)
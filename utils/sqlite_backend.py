@@ -0,0 +1,197 @@
+"""
+    sqlite_backend.py
+
+    Contains the SQLite storage backend class.
+"""
+
+import sqlite3
+from pathlib import Path
+from utils.storage_backend import StorageBackend
+
+class SQLiteBackend(StorageBackend):
+    """
+        Stores all files as indexed tables in a single SQLite database.
+
+        The record, WAM, GPA and target files each map to their own table,
+        and every unit file maps to the rows of the assessments table with
+        that unit code, so a unit is read or written without touching any
+        other unit.
+    """
+
+    # sets the table and columns for each non-unit file
+    tables = {
+        "record": ["unit_code", "mark", "grade", "credit_pts"],
+        "wam": ["year_lvl", "mark", "credit_pts"],
+        "gpa": ["grade", "credit_pts"],
+        "target": ["target_type", "target"]
+    }
+
+    # sets the columns of the assessments table
+    assessment_columns = ["assessment", "weight", "score", "total"]
+
+    def __init__(self, path: str, read_only: bool = False) -> None:
+        """
+            Opens the database, creating any missing tables unless it is opened read-only.
+
+            Args:
+                path (str): the path of the database file.
+                read_only (bool): whether to open the database read-only, without changing its journal mode or tables.
+        """
+
+        # initialises versions dictionary
+        self.versions = {}
+
+        # opens an existing database read-only, leaving the file untouched
+        if read_only:
+            self.connection = sqlite3.connect(f"{Path(path).absolute().as_uri()}?mode=ro", uri=True)
+            return
+
+        # opens the database in write-ahead logging mode
+        self.connection = sqlite3.connect(path)
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.execute("PRAGMA synchronous=NORMAL")
+
+        # creates the tables
+        with self.connection:
+
+            # creates a table for each non-unit file
+            for table, columns in self.tables.items():
+                self.connection.execute(f"CREATE TABLE IF NOT EXISTS {table} (position INTEGER PRIMARY KEY, {', '.join(columns)})")
+
+            # creates the unit and assessments tables
+            self.connection.execute("CREATE TABLE IF NOT EXISTS units (unit_code TEXT PRIMARY KEY)")
+            self.connection.execute(
+                f"CREATE TABLE IF NOT EXISTS assessments (unit_code TEXT, position INTEGER, {', '.join(self.assessment_columns)}, "
+                "PRIMARY KEY (unit_code, position)) WITHOUT ROWID"
+            )
+
+            # creates index for looking up record rows by unit code
+            self.connection.execute("CREATE INDEX IF NOT EXISTS record_unit_code ON record (unit_code)")
+
+    def read_file(self, filename: str) -> list[list[str]]:
+        """
+            Reads the rows of a file.
+
+            Args:
+                filename (str): the name of the file to read.
+
+            Returns:
+                list[list[str]]: the contents of the file.
+        """
+
+        # reads the rows of a non-unit file
+        if filename in self.tables:
+            columns = ", ".join(self.tables[filename])
+            rows = self.connection.execute(f"SELECT {columns} FROM {filename} ORDER BY position")
+
+        # reads the assessments of a unit file
+        else:
+            columns = ", ".join(self.assessment_columns)
+            rows = self.connection.execute(f"SELECT {columns} FROM assessments WHERE unit_code = ? ORDER BY position", (filename,))
+
+        # returns the rows as lists
+        return [list(row) for row in rows]
+
+    def write_file(self, filename: str, data: list[list[str]]) -> None:
+        """
+            Replaces the rows of a file.
+
+            Args:
+                filename (str): the name of the file to write to.
+                data (list[list[str]]): the data to write to the file.
+        """
+
+        # bumps the version of the file
+        self.versions[filename] = self.versions.get(filename, 0) + 1
+
+        with self.connection:
+
+            # replaces the rows of a non-unit file
+            if filename in self.tables:
+                columns = self.tables[filename]
+                self.connection.execute(f"DELETE FROM {filename}")
+                self.connection.executemany(
+                    f"INSERT INTO {filename} (position, {', '.join(columns)}) VALUES (?, {', '.join('?' * len(columns))})",
+                    [(position, *line) for position, line in enumerate(data)]
+                )
+
+            # replaces the assessments of a unit file
+            else:
+                columns = self.assessment_columns
+                self.connection.execute("INSERT OR IGNORE INTO units (unit_code) VALUES (?)", (filename,))
+                self.connection.execute("DELETE FROM assessments WHERE unit_code = ?", (filename,))
+                self.connection.executemany(
+                    f"INSERT INTO assessments (unit_code, position, {', '.join(columns)}) VALUES (?, ?, {', '.join('?' * len(columns))})",
+                    [(filename, position, *line) for position, line in enumerate(data)]
+                )
+
+    def create_file(self, filename: str) -> None:
+        """
+            Creates an empty file.
+
+            Args:
+                filename (str): the name of the file to create.
+        """
+
+        # clears a non-unit file
+        if filename in self.tables:
+            self.write_file(filename, [])
+            return
+
+        # adds an empty unit
+        self.versions[filename] = self.versions.get(filename, 0) + 1
+        with self.connection:
+            self.connection.execute("INSERT OR IGNORE INTO units (unit_code) VALUES (?)", (filename,))
+            self.connection.execute("DELETE FROM assessments WHERE unit_code = ?", (filename,))
+
+    def delete_file(self, filename: str) -> None:
+        """
+            Deletes a file.
+
+            Args:
+                filename (str): the name of the file to delete.
+        """
+
+        # clears a non-unit file
+        if filename in self.tables:
+            self.write_file(filename, [])
+            return
+
+        # deletes a unit and its assessments
+        self.versions[filename] = self.versions.get(filename, 0) + 1
+        with self.connection:
+            self.connection.execute("DELETE FROM units WHERE unit_code = ?", (filename,))
+            self.connection.execute("DELETE FROM assessments WHERE unit_code = ?", (filename,))
+
+    def get_unit_files(self) -> list[str]:
+        """
+            Finds the unit codes of all units.
+
+            Returns:
+                list[str]: the list of unit filenames.
+        """
+
+        # returns unit codes in the order they were added
+        return [unit_code for unit_code, in self.connection.execute("SELECT unit_code FROM units ORDER BY rowid")]
+
+    def get_file_stamp(self, filename: str) -> int:
+        """
+            Gets the number of times a file was changed through this backend.
+
+            Args:
+                filename (str): the name of the file.
+
+            Returns:
+                int: the version of the file.
+        """
+
+        # returns the version of the file
+        return self.versions.get(filename, 0)
+
+    def close(self) -> None:
+        """
+            Closes the database.
+        """
+
+        # closes the connection
+        self.connection.close()
@@ -0,0 +1,99 @@
+"""
+    storage_backend.py
+
+    Contains the storage backend base class.
+"""
+
+from abc import ABC, abstractmethod
+
+class StorageBackend(ABC):
+    """
+        Defines the storage operations the file manager passes to a backend.
+
+        Data is addressed by filename: "record", "wam", "gpa", "target" and
+        one file per unit code, each holding a table of string rows. A
+        backend must implement every abstract operation before it can be
+        created.
+    """
+
+    @abstractmethod
+    def read_file(self, filename: str) -> list[list[str]]:
+        """
+            Reads the rows of a file.
+
+            Args:
+                filename (str): the name of the file to read.
+
+            Returns:
+                list[list[str]]: the contents of the file.
+        """
+
+    @abstractmethod
+    def write_file(self, filename: str, data: list[list[str]]) -> None:
+        """
+            Replaces the rows of a file.
+
+            Args:
+                filename (str): the name of the file to write to.
+                data (list[list[str]]): the data to write to the file.
+        """
+
+    def write_files(self, files: dict[str, list[list[str]]]) -> None:
+        """
+            Replaces the rows of several files.
+
+            Args:
+                files (dict[str, list[list[str]]]): the data of each file.
+        """
+
+        # writes each file
+        for filename, data in files.items():
+            self.write_file(filename, data)
+
+    @abstractmethod
+    def create_file(self, filename: str) -> None:
+        """
+            Creates an empty file.
+
+            Args:
+                filename (str): the name of the file to create.
+        """
+
+    @abstractmethod
+    def delete_file(self, filename: str) -> None:
+        """
+            Deletes a file.
+
+            Args:
+                filename (str): the name of the file to delete.
+        """
+
+    @abstractmethod
+    def get_unit_files(self) -> list[str]:
+        """
+            Finds the filenames of all unit files.
+
+            Returns:
+                list[str]: the list of unit filenames.
+        """
+
+    def get_file_stamp(self, filename: str) -> object:
+        """
+            Gets a stamp that changes whenever a file changes.
+
+            Args:
+                filename (str): the name of the file.
+
+            Returns:
+                object: the stamp of the file, or None if it cannot be stamped.
+        """
+
+        # no stamp by default so the file is always read again
+        return None
+
+    def close(self) -> None:
+        """
+            Flushes and releases anything held by the backend.
+        """
+
+        pass
@@ -0,0 +1,422 @@
+"""
+    text_backend.py
+
+    Contains the text storage backend class.
+"""
+
+import os
+import threading
+from re import compile
+from utils.storage_backend import StorageBackend
+
+class TextBackend(StorageBackend):
+    """
+        Stores each file as comma-separated lines in a folder.
+
+        In journaled mode, changes made by write_file are appended to a small
+        journal file per data file instead of rewriting the whole file. The
+        journal is replayed by read_file and compacted back into the data file
+        in the background once it grows past the journal threshold.
+    """
+
+    # sets the journal size that triggers a compaction
+    journal_threshold = 64 * 1024
+
+    # sets the unit filename regular expression
+    unit_filename = compile(r"[A-Z]{3}\d{4}")
+
+    def __init__(self, folder: str, journaled: bool = False) -> None:
+        """
+            Initialises the backend.
+
+            Args:
+                folder (str): the folder holding the files.
+                journaled (bool): whether to use journaled mode.
+        """
+
+        # sets folder paths
+        self.folder = folder
+        self.journal_folder = os.path.join(folder, "journal")
+
+        # initialises journal state shared between threads
+        self.journaled = False
+        self.journal_cache = {}
+        self.journal_lock = threading.RLock()
+        self.compacting = set()
+
+        # initialises unit file index and the folder modification time it matches
+        self.unit_index = None
+        self.unit_index_mtime = None
+
+        # sets journaled mode
+        self.set_journaled(journaled)
+
+    def read_file(self, filename: str) -> list[list[str]]:
+        """
+            Reads and processes a file.
+
+            Args:
+                filename (str): the name of the file to read.
+
+            Returns:
+                list[list[str]]: the contents of the file.
+        """
+
+        # reads the data file and replays its journal in journaled mode
+        if self.journaled:
+            with self.journal_lock:
+                data = self.read_journaled_file(filename)
+                self.journal_cache[filename] = data
+                return [line[:] for line in data]
+
+        # attempts to open the file
+        try:
+            with open(os.path.join(self.folder, filename), "r") as file:
+
+                # returns the table of contents in the file
+                return [line.strip().split(",") for line in file]
+
+        # file does not exist
+        except FileNotFoundError:
+
+            # returns an empty array
+            return []
+
+    def write_file(self, filename: str, data: list[list[str]]) -> None:
+        """
+            Writes data to a file.
+
+            Args:
+                filename (str): the name of the file to write to.
+                data (list[list[str]]): the data to write to the file.
+        """
+
+        # appends the change to the journal in journaled mode
+        if self.journaled:
+            self.write_journaled_file(filename, data)
+            return
+
+        # opens the file
+        with open(os.path.join(self.folder, filename), "w") as file:
+
+            # iterates through the data
+            for index, line in enumerate(data):
+
+                # writes a space-separated line of the data line
+                file.write(",".join(line))
+                if index < len(data) - 1: file.write("\n")
+
+    def create_file(self, filename: str) -> None:
+        """
+            Creates a file.
+
+            Args:
+                filename (str): the name of the file to created.
+        """
+
+        # gets filepath
+        filepath = os.path.join(self.folder, filename)
+
+        # creates file and clears any journal left for it
+        with self.journal_lock:
+            index_valid = self.is_unit_index_valid()
+            with open(filepath, "w") as file:
+                pass
+            self.delete_journal(filename)
+            if self.journaled: self.journal_cache[filename] = []
+
+            # adds the file to the unit file index
+            if index_valid and self.unit_filename.match(filename):
+                self.unit_index[filename] = None
+            self.update_unit_index_mtime(index_valid)
+
+    def delete_file(self, filename: str) -> None:
+        """
+            Deletes a file.
+
+            Args:
+                filename (str): the name of the file to delete.
+        """
+
+        # gets filepath
+        filepath = os.path.join(self.folder, filename)
+
+        # deletes file and its journal
+        with self.journal_lock:
+            index_valid = self.is_unit_index_valid()
+
+            # checks if file exists
+            if os.path.exists(filepath):
+
+                # deletes file
+                os.remove(filepath)
+
+            # deletes journal and cancels any pending compaction
+            self.delete_journal(filename)
+            self.journal_cache.pop(filename, None)
+            self.compacting.discard(filename)
+
+            # removes the file from the unit file index
+            if index_valid:
+                self.unit_index.pop(filename, None)
+            self.update_unit_index_mtime(index_valid)
+
+    def get_unit_files(self) -> list[str]:
+        """
+            Finds the filenames of all unit files in the project directory.
+
+            The folder is only scanned again when its modification time no
+            longer matches the cached unit file index.
+
+            Returns:
+                list[str]: the list of unit filenames.
+        """
+
+        with self.journal_lock:
+
+            # rebuilds the unit file index if the folder changed
+            if not self.is_unit_index_valid():
+                self.unit_index_mtime = os.stat(self.folder).st_mtime_ns
+                with os.scandir(self.folder) as entries:
+                    self.unit_index = {
+                        entry.name: None for entry in entries
+                        if entry.is_file() and self.unit_filename.match(entry.name)
+                    }
+
+            # returns the list of unit filenames
+            return list(self.unit_index)
+
+    def is_unit_index_valid(self) -> bool:
+        """
+            Checks if the unit file index matches the folder.
+
+            Returns:
+                bool: whether the unit file index is up to date.
+        """
+
+        # compares the folder modification time with the index
+        return self.unit_index is not None and os.stat(self.folder).st_mtime_ns == self.unit_index_mtime
+
+    def update_unit_index_mtime(self, index_valid: bool) -> None:
+        """
+            Records the folder modification time after a change made by the backend.
+
+            Args:
+                index_valid (bool): whether the index was up to date before the change.
+        """
+
+        # keeps the index valid if it was valid before the change
+        if index_valid:
+            self.unit_index_mtime = os.stat(self.folder).st_mtime_ns
+
+    def get_file_stamp(self, filename: str) -> tuple[int, int, int, int] | None:
+        """
+            Gets the size and modification time of a file and its journal.
+
+            Args:
+                filename (str): the name of the file.
+
+            Returns:
+                tuple[int, int, int, int] | None: the file and journal sizes and modification times, or None if the file does not exist.
+        """
+
+        # attempts to stat the file
+        try:
+            stat = os.stat(os.path.join(self.folder, filename))
+
+        # file does not exist
+        except FileNotFoundError:
+            return None
+
+        # attempts to stat the journal in journaled mode
+        try:
+            journal_stat = os.stat(os.path.join(self.journal_folder, filename)) if self.journaled else None
+
+        # journal does not exist
+        except FileNotFoundError:
+            journal_stat = None
+
+        # returns the sizes and modification times
+        if journal_stat is None:
+            return stat.st_size, stat.st_mtime_ns, 0, 0
+        return stat.st_size, stat.st_mtime_ns, journal_stat.st_size, journal_stat.st_mtime_ns
+
+    def close(self) -> None:
+        """
+            Compacts every journal into its data file.
+        """
+
+        # turns off journaled mode
+        self.set_journaled(False)
+
+    def set_journaled(self, journaled: bool) -> None:
+        """
+            Turns journaled mode on or off.
+
+            Turning journaled mode off compacts every journal so the data
+            files can be read without replaying anything.
+
+            Args:
+                journaled (bool): whether to use journaled mode.
+        """
+
+        with self.journal_lock:
+
+            # creates the journal folder when turning journaled mode on
+            if journaled:
+                os.makedirs(self.journal_folder, exist_ok=True)
+
+            # compacts all journals when turning journaled mode off
+            elif self.journaled and os.path.isdir(self.journal_folder):
+                for filename in os.listdir(self.journal_folder):
+                    self.compact_file(filename)
+
+            # sets the mode and clears cached data
+            self.journaled = journaled
+            self.journal_cache.clear()
+
+    def read_journaled_file(self, filename: str) -> list[list[str]]:
+        """
+            Reads a data file and replays its journal.
+
+            Args:
+                filename (str): the name of the file to read.
+
+            Returns:
+                list[list[str]]: the contents of the file with the journal applied.
+        """
+
+        # attempts to read the data file
+        try:
+            with open(os.path.join(self.folder, filename), "r") as file:
+                data = [line.strip().split(",") for line in file]
+        except FileNotFoundError:
+            data = []
+
+        # attempts to replay the journal
+        try:
+            with open(os.path.join(self.journal_folder, filename), "r") as file:
+                for line in file:
+                    line = line.rstrip("\n")
+
+                    # appends a line
+                    if line.startswith("+"):
+                        data.append(line[1:].split(","))
+
+                    # deletes a line
+                    elif line.startswith("-"):
+                        data.pop(int(line[1:]))
+
+        # journal does not exist
+        except FileNotFoundError:
+            pass
+
+        # returns the replayed data
+        return data
+
+    def write_journaled_file(self, filename: str, data: list[list[str]]) -> None:
+        """
+            Records the change from the last known contents of a file in its journal.
+
+            Appending or deleting a single line is journaled, any other change
+            rewrites the data file.
+
+            Args:
+                filename (str): the name of the file to write to.
+                data (list[list[str]]): the data to write to the file.
+        """
+
+        with self.journal_lock:
+
+            # gets the last known contents of the file
+            if filename not in self.journal_cache:
+                self.journal_cache[filename] = self.read_journaled_file(filename)
+            old_data = self.journal_cache[filename]
+
+            # sets the journal entry for a single appended line
+            if len(data) == len(old_data) + 1 and data[:-1] == old_data:
+                entry = "+" + ",".join(data[-1])
+
+            # sets the journal entry for a single deleted line
+            elif len(data) == len(old_data) - 1:
+                index = next((i for i in range(len(data)) if data[i] != old_data[i]), len(data))
+                entry = f"-{index}" if data[index:] == old_data[index + 1:] else None
+
+            # no journal entry for any other change
+            else:
+                entry = None
+
+            # stores the new contents of the file
+            self.journal_cache[filename] = [line[:] for line in data]
+
+            # rewrites the data file if the change cannot be journaled
+            if entry is None:
+                self.compact_file(filename)
+                return
+
+            # appends the entry to the journal
+            journal_path = os.path.join(self.journal_folder, filename)
+            with open(journal_path, "a") as file:
+                file.write(entry + "\n")
+
+            # compacts the journal in the background once it is too large
+            if os.path.getsize(journal_path) > self.journal_threshold and filename not in self.compacting:
+                self.compacting.add(filename)
+                threading.Thread(target=self.compact_pending_file, args=(filename,)).start()
+
+    def compact_file(self, filename: str) -> None:
+        """
+            Writes the current contents of a file atomically and clears its journal.
+
+            Args:
+                filename (str): the name of the file to compact.
+        """
+
+        with self.journal_lock:
+
+            # gets the current contents of the file
+            data = self.journal_cache.get(filename)
+            if data is None:
+                data = self.read_journaled_file(filename)
+
+            # writes the contents to a temporary file and swaps it in
+            index_valid = self.is_unit_index_valid()
+            filepath = os.path.join(self.folder, filename)
+            temp_filepath = os.path.join(self.folder, f".{filename}.tmp")
+            with open(temp_filepath, "w") as file:
+                file.write("\n".join(",".join(line) for line in data))
+            os.replace(temp_filepath, filepath)
+            self.update_unit_index_mtime(index_valid)
+
+            # clears the journal
+            self.delete_journal(filename)
+            self.compacting.discard(filename)
+
+    def compact_pending_file(self, filename: str) -> None:
+        """
+            Compacts a file scheduled for background compaction, unless it was deleted since.
+
+            Args:
+                filename (str): the name of the file to compact.
+        """
+
+        # compacts the file if it is still pending
+        with self.journal_lock:
+            if filename in self.compacting:
+                self.compact_file(filename)
+
+    def delete_journal(self, filename: str) -> None:
+        """
+            Deletes the journal of a file.
+
+            Args:
+                filename (str): the name of the file whose journal is deleted.
+        """
+
+        # attempts to delete the journal
+        try:
+            os.remove(os.path.join(self.journal_folder, filename))
+
+        # journal does not exist
+        except FileNotFoundError:
+            pass